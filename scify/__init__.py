@@ -5,3 +5,31 @@
 __author__ = """Daniel Bok"""
 __email__ = 'daniel.bok@outlook.com'
 __version__ = '0.1.0'
+
+import importlib as _importlib
+import sys as _sys
+
+# submodule of each function, imported on first use (PEP 562) as they load the extensions and NumPy
+_SUBMODULES = {
+    **dict.fromkeys(['get_num_threads', 'get_serial_threshold', 'num_threads', 'set_num_threads',
+                     'set_serial_threshold'], 'parallel'),
+    **dict.fromkeys(['reset_stats', 'stats'], 'instrumentation'),
+}
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_importlib.import_module(f'.{_SUBMODULES[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
+
+
+if _sys.version_info < (3, 7):
+    for _name in _SUBMODULES:
+        __getattr__(_name)
@@ -0,0 +1,58 @@
+"""
+Command line interface of scify
+
+Evaluates a special function over a `.npy` or raw binary file chunk by chunk, so that files larger than the memory
+can be processed::
+
+    python -m scify eval debye_3 x.npy y.npy
+    python -m scify eval airy_Ai x.bin y.bin --dtype float32 --error y_err.bin
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from . import specfunc
+from .specfunc.stream import CHUNK_BYTES, stream
+
+# the functions which map each real value to one value, as the chunks are streamed. The others take orders or indices,
+# or return several values per element
+FUNCTIONS = ('airy_Ai', 'airy_Ai_scaled', 'airy_Ai_deriv', 'airy_Ai_deriv_scaled', 'airy_Bi', 'airy_Bi_scaled',
+             'airy_Bi_deriv', 'airy_Bi_deriv_scaled', 'clausen', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5',
+             'debye_6', 'dilog')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m scify', description='Scientific functions for Python')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    ev = commands.add_parser('eval', help='evaluate a special function over a .npy or raw binary file',
+                             description='Evaluates a special function over a .npy or raw binary file, chunk by '
+                                         'chunk. Files whose name does not end with .npy are read and written as '
+                                         'raw binary data.')
+    ev.add_argument('function', choices=FUNCTIONS, metavar='function',
+                    help=f"name of the function in scify.specfunc, one of {', '.join(FUNCTIONS)}")
+    ev.add_argument('src', help='input file')
+    ev.add_argument('dst', help='output file')
+    ev.add_argument('--dtype', default='float64', help='data type of a raw input file (default: float64)')
+    ev.add_argument('--error', metavar='PATH', help='also write the absolute error estimates into this file')
+    ev.add_argument('--chunk-bytes', type=int, default=CHUNK_BYTES,
+                    help=f'size in bytes of the input chunks (default: {CHUNK_BYTES})')
+    ev.add_argument('--threads', type=int, help='number of threads (default: all available)')
+
+    args = parser.parse_args(argv)
+    func = getattr(specfunc, args.function)
+
+    dst, kwargs = args.dst, {}
+    if args.error is not None:
+        dst, kwargs['with_error'] = (args.dst, args.error), True
+
+    stream(func, args.src, dst, chunk_bytes=args.chunk_bytes, dtype=np.dtype(args.dtype), num_threads=args.threads,
+           **kwargs)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
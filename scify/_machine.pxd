@@ -73,4 +73,4 @@ cdef:
     double M_LNPI
     double M_EULER
 
-    int sign(double) nogil
+    int sign(double) noexcept nogil
\ No newline at end of file
@@ -9,19 +9,67 @@ ctypedef struct ComplexResult:
     double imag_err
 
 
-ctypedef Result (*Fn1R) (double) nogil
-ctypedef ComplexResult (*Fn1C) (double, double) nogil
+ctypedef Result (*Fn1R) (double) noexcept nogil
+ctypedef Result (*Fn1I) (long long) noexcept nogil
+ctypedef ComplexResult (*Fn1C) (double, double) noexcept nogil
+# kernels of a real argument and an integer order
+ctypedef Result (*Fn2R) (double, long long) noexcept nogil
+# fused kernels fill res[k] for each bit k set in the mask
+ctypedef void (*FnMR) (double, int, Result*) noexcept nogil
+# block kernels evaluate n <= BLOCK contiguous points into the values and the errors, which may be NULL. The values
+# may be stored over the points, so these must all be read first
+ctypedef void (*FnBR) (const double*, Py_ssize_t, double*, double*) noexcept nogil
+# regime classifiers return the index of the code path a point takes, each path being evaluated by a block kernel
+ctypedef int (*FnClass) (double) noexcept nogil
+
+cdef enum:
+    MAX_FUSED = 8
+    BLOCK = 256
+    MAX_REGIMES = 8
+
+# stat is the stats.Kernel whose branches count the points of each regime
+ctypedef struct Regimes:
+    FnClass classify
+    int n
+    int stat
+    FnBR kernels[MAX_REGIMES]
+
+ctypedef struct FusedFn:
+    FnMR f
+    int mask
+    int n
+    bint with_err
 
 
 cdef:
-    Result make_r(double val, double err) nogil
-    Result make_r_0() nogil
-    Result make_r_nan() nogil
-    void map_dbl_p(Fn1R, double[::1], int) nogil
-    void map_dbl_s(Fn1R, double[::1], int) nogil
-
-    ComplexResult make_c(double real, double real_err, double imag, double imag_err) nogil
-    ComplexResult make_c_0() nogil
-    ComplexResult make_c_nan() nogil
-    void mapc_dbl_p(Fn1C, double[::1], double[::1], int) nogil
-    void mapc_dbl_s(Fn1C, double[::1], double[::1], int) nogil
+    Result make_r(double val, double err) noexcept nogil
+    Result make_r_0() noexcept nogil
+    Result make_r_nan() noexcept nogil
+    void map_dbl_p(Fn1R, char*, Py_ssize_t, char*, Py_ssize_t, char*, Py_ssize_t, Py_ssize_t, int) noexcept nogil
+    void map_dbl_s(Fn1R, char*, Py_ssize_t, char*, Py_ssize_t, char*, Py_ssize_t, Py_ssize_t) noexcept nogil
+    void eval_regimes(Regimes*, const double*, Py_ssize_t, double*, double*) noexcept nogil
+    double eval_scalar(Fn1R, double, double) except? -1
+
+    ComplexResult make_c(double real, double real_err, double imag, double imag_err) noexcept nogil
+    ComplexResult make_c_0() noexcept nogil
+    ComplexResult make_c_nan() noexcept nogil
+    void mapc_dbl_p(Fn1C, char*, Py_ssize_t, char*, Py_ssize_t, char*, Py_ssize_t, char*, Py_ssize_t,
+                    Py_ssize_t, int) noexcept nogil
+    void mapc_dbl_s(Fn1C, char*, Py_ssize_t, char*, Py_ssize_t, char*, Py_ssize_t, char*, Py_ssize_t,
+                    Py_ssize_t) noexcept nogil
+
+    object ufunc_d_d(Fn1R, str, str)
+    object ufunc_d_dd(Fn1R, str, str)
+    object ufunc_l_d(Fn1I, str, str)
+    object ufunc_l_dd(Fn1I, str, str)
+    object ufunc_dl_d(Fn2R, str, str)
+    object ufunc_dl_dd(Fn2R, str, str)
+    object ufunc_D_D(Fn1C, str, str)
+    object ufunc_D_DD(Fn1C, str, str)
+    object ufunc_dd_D(Fn1C, str, str)
+    object ufunc_dd_DD(Fn1C, str, str)
+    object ufunc_d_m(FnMR, int, bint, str, str)
+    object ufunc_d_d_block(FnBR, str, str)
+    object ufunc_d_dd_block(FnBR, str, str)
+    object ufunc_d_d_regimes(Regimes, str, str)
+    object ufunc_d_dd_regimes(Regimes, str, str)
@@ -1,72 +1,983 @@
-from cython.parallel import prange
+from cython.parallel import parallel, prange
+from time import perf_counter
 
-from libc.math cimport NAN
+import numpy as np
 
-cdef Result make_r(double val, double err) nogil:
+cimport numpy as cnp
+cimport openmp
+from cpython.mem cimport PyMem_Malloc
+from libc.math cimport NAN, fabs
+
+from scify cimport _machine as m
+from .cheb cimport get_rtol, set_cheb_tol, set_rtol
+from .stats cimport SCIFY_STATS, hit, loop_begin, loop_end
+
+cdef extern from "<fenv.h>" nogil:
+    int FE_ALL_EXCEPT
+    int feclearexcept(int)
+
+cnp.import_array()
+cnp.import_ufunc()
+
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #define SCIFY_THREAD_LOCAL __declspec(thread)
+    #else
+    #define SCIFY_THREAD_LOCAL __thread
+    #endif
+
+    /* Threads requested for the evaluations made by the current thread, 0 if not set. See evaluate */
+    static SCIFY_THREAD_LOCAL int scify_call_threads = 0;
+    """
+    int scify_call_threads
+
+# Process wide number of threads (0 for the OpenMP default) and the size below which arrays are evaluated serially
+cdef int default_threads = 0
+cdef Py_ssize_t serial_threshold = 1000
+
+# Single precision loops evaluate the double kernels with the Chebyshev series truncated to float accuracy
+cdef double FLT_CHEB_TOL = 1e-3 * m.FLT_EPSILON
+
+cdef dict _SINGLE = {cnp.NPY_DOUBLE: cnp.NPY_FLOAT, cnp.NPY_CDOUBLE: cnp.NPY_CFLOAT}
+
+# calls, elements and wall time of each ufunc evaluated by evaluate, in instrumented builds
+cdef dict _ufunc_stats = {}
+
+# NumPy keeps pointers to the names, docs and type signatures of the ufuncs, so they must live as long as the module
+cdef list _ufunc_refs = []
+
+
+cdef Result make_r(double val, double err) noexcept nogil:
     cdef Result r
     r.val = val
     r.err = err
     return r
 
 
-cdef Result make_r_0() nogil:
+cdef Result make_r_0() noexcept nogil:
     return make_r(0, 0)
 
 
-cdef Result make_r_nan() nogil:
+cdef Result make_r_nan() noexcept nogil:
     return make_r(NAN, NAN)
 
 
-cdef ComplexResult make_c(double real, double real_err, double imag, double imag_err) nogil:
+cdef ComplexResult make_c(double real, double real_err, double imag, double imag_err) noexcept nogil:
     cdef ComplexResult c
     c.real = real
     c.real_err = real_err
     c.imag = imag
-    c.imag_err = imag
+    c.imag_err = imag_err
     return c
 
 
-cdef ComplexResult make_c_0() nogil:
+cdef ComplexResult make_c_0() noexcept nogil:
     return make_c(0, 0, 0, 0)
 
 
-cdef ComplexResult make_c_nan() nogil:
+cdef ComplexResult make_c_nan() noexcept nogil:
     return make_c(NAN, NAN, NAN, NAN)
 
 
-cdef void map_dbl_p(Fn1R f, double[::1] x, int size) nogil:
-    # Parallel
-    cdef int i
-    for i in prange(size, nogil=True):
-        x[i] = f(x[i]).val
+cdef double eval_scalar(Fn1R f, double x, double rtol) except? -1:
+    """
+    Evaluates the kernel f at a single x, without going through the ufunc loops. rtol is applied as by evaluate, for
+    this call only
+    """
+    cdef double prev, v
+
+    assert 0 <= rtol < 1, "Relative tolerance must be in [0, 1)"
+    prev = set_rtol(rtol)
+    v = f(x).val
+    set_rtol(prev)
+    return v
+
+
+cdef void map_dbl_p(Fn1R f, char* x, Py_ssize_t xs, char* out, Py_ssize_t os, char* err, Py_ssize_t es,
+                    Py_ssize_t size, int num_threads) noexcept nogil:
+    # Parallel. The error estimates are only stored if err is not NULL. The workers take the caller's tolerance
+    cdef:
+        Result r
+        Py_ssize_t i
+        double rtol = get_rtol(), prev
+
+    with parallel(num_threads=num_threads):
+        prev = set_rtol(rtol)
+        for i in prange(size):
+            r = f((<double*> (x + i * xs))[0])
+            (<double*> (out + i * os))[0] = r.val
+            if err != NULL:
+                (<double*> (err + i * es))[0] = r.err
+        set_rtol(prev)
 
 
-cdef void map_dbl_s(Fn1R f, double[::1] x, int size) nogil:
+cdef void map_dbl_s(Fn1R f, char* x, Py_ssize_t xs, char* out, Py_ssize_t os, char* err, Py_ssize_t es,
+                    Py_ssize_t size) noexcept nogil:
     # single
-    cdef int i
+    cdef:
+        Result r
+        Py_ssize_t i
+
     for i in range(size):
-        x[i] = f(x[i]).val
+        r = f((<double*> (x + i * xs))[0])
+        (<double*> (out + i * os))[0] = r.val
+        if err != NULL:
+            (<double*> (err + i * es))[0] = r.err
 
 
-cdef void mapc_dbl_p(Fn1C f, double[::1] r, double[::1] t, int size) nogil:
-    # Parallel
+cdef void mapc_dbl_p(Fn1C f, char* a, Py_ssize_t a_s, char* b, Py_ssize_t bs, char* out, Py_ssize_t os, char* err,
+                     Py_ssize_t es, Py_ssize_t size, int num_threads) noexcept nogil:
+    # Parallel. Output and error are complex128, the error holding the real and imaginary parts' errors
     cdef:
         ComplexResult c
-        int i
+        Py_ssize_t i
+        double rtol = get_rtol(), prev
 
-    for i in prange(size, nogil=True):
-        c = f(r[i], t[i])
-        r[i] = c.real
-        t[i] = c.imag
+    with parallel(num_threads=num_threads):
+        prev = set_rtol(rtol)
+        for i in prange(size):
+            c = f((<double*> (a + i * a_s))[0], (<double*> (b + i * bs))[0])
+            (<double*> (out + i * os))[0] = c.real
+            (<double*> (out + i * os))[1] = c.imag
+            if err != NULL:
+                (<double*> (err + i * es))[0] = c.real_err
+                (<double*> (err + i * es))[1] = c.imag_err
+        set_rtol(prev)
 
 
-cdef void mapc_dbl_s(Fn1C f, double[::1] r, double[::1] t, int size) nogil:
+cdef void mapc_dbl_s(Fn1C f, char* a, Py_ssize_t a_s, char* b, Py_ssize_t bs, char* out, Py_ssize_t os, char* err,
+                     Py_ssize_t es, Py_ssize_t size) noexcept nogil:
     # Single
     cdef:
         ComplexResult c
-        int i
+        Py_ssize_t i
+
+    for i in range(size):
+        c = f((<double*> (a + i * a_s))[0], (<double*> (b + i * bs))[0])
+        (<double*> (out + i * os))[0] = c.real
+        (<double*> (out + i * os))[1] = c.imag
+        if err != NULL:
+            (<double*> (err + i * es))[0] = c.real_err
+            (<double*> (err + i * es))[1] = c.imag_err
+
+
+cdef inline void store_flt(Result r, char* out, char* err) noexcept nogil:
+    # the error includes the rounding to single precision
+    (<float*> out)[0] = <float> r.val
+    if err != NULL:
+        (<float*> err)[0] = <float> (r.err + m.FLT_EPSILON * fabs(r.val))
+
+
+cdef void map_flt_p(Fn1R f, char* x, Py_ssize_t xs, char* out, Py_ssize_t os, char* err, Py_ssize_t es,
+                    Py_ssize_t size, int num_threads) noexcept nogil:
+    # Parallel, single precision
+    cdef:
+        Result r
+        Py_ssize_t i
+        double rtol = get_rtol(), prev, prev_rtol
+
+    with parallel(num_threads=num_threads):
+        prev = set_cheb_tol(FLT_CHEB_TOL)
+        prev_rtol = set_rtol(rtol)
+        for i in prange(size):
+            r = f((<float*> (x + i * xs))[0])
+            store_flt(r, out + i * os, NULL if err == NULL else err + i * es)
+        set_rtol(prev_rtol)
+        set_cheb_tol(prev)
+
+
+cdef void map_flt_s(Fn1R f, char* x, Py_ssize_t xs, char* out, Py_ssize_t os, char* err, Py_ssize_t es,
+                    Py_ssize_t size) noexcept nogil:
+    # Single, single precision
+    cdef:
+        Py_ssize_t i
+        double prev = set_cheb_tol(FLT_CHEB_TOL)
 
     for i in range(size):
-        c = f(r[i], t[i])
-        r[i] = c.real
-        t[i] = c.imag
+        store_flt(f((<float*> (x + i * xs))[0]), out + i * os, NULL if err == NULL else err + i * es)
+    set_cheb_tol(prev)
+
+
+cdef inline void store_cflt(ComplexResult c, char* out, char* err) noexcept nogil:
+    (<float*> out)[0] = <float> c.real
+    (<float*> out)[1] = <float> c.imag
+    if err != NULL:
+        (<float*> err)[0] = <float> (c.real_err + m.FLT_EPSILON * fabs(c.real))
+        (<float*> err)[1] = <float> (c.imag_err + m.FLT_EPSILON * fabs(c.imag))
+
+
+cdef void mapc_flt_p(Fn1C f, char* a, Py_ssize_t a_s, char* b, Py_ssize_t bs, char* out, Py_ssize_t os, char* err,
+                     Py_ssize_t es, Py_ssize_t size, int num_threads) noexcept nogil:
+    # Parallel, single precision. Output and error are complex64
+    cdef:
+        ComplexResult c
+        Py_ssize_t i
+        double rtol = get_rtol(), prev, prev_rtol
+
+    with parallel(num_threads=num_threads):
+        prev = set_cheb_tol(FLT_CHEB_TOL)
+        prev_rtol = set_rtol(rtol)
+        for i in prange(size):
+            c = f((<float*> (a + i * a_s))[0], (<float*> (b + i * bs))[0])
+            store_cflt(c, out + i * os, NULL if err == NULL else err + i * es)
+        set_rtol(prev_rtol)
+        set_cheb_tol(prev)
+
+
+cdef void mapc_flt_s(Fn1C f, char* a, Py_ssize_t a_s, char* b, Py_ssize_t bs, char* out, Py_ssize_t os, char* err,
+                     Py_ssize_t es, Py_ssize_t size) noexcept nogil:
+    # Single, single precision
+    cdef:
+        Py_ssize_t i
+        double prev = set_cheb_tol(FLT_CHEB_TOL)
+
+    for i in range(size):
+        store_cflt(f((<float*> (a + i * a_s))[0], (<float*> (b + i * bs))[0]), out + i * os,
+                   NULL if err == NULL else err + i * es)
+    set_cheb_tol(prev)
+
+
+cdef inline int team_size(cnp.npy_intp size) noexcept nogil:
+    # number of threads to evaluate size elements with, 1 for the serial path
+    cdef int n = scify_call_threads
+
+    if size < serial_threshold:
+        return 1
+    if n == 0:
+        n = default_threads
+    if n == 0:
+        n = openmp.omp_get_max_threads()
+    return <int> min(n, size)
+
+
+cdef inline void clear_fp_status() noexcept nogil:
+    # kernels signal domain errors and overflow with NaN. Intermediate results (e.g. log(0) in a branch that is
+    # not taken) must not surface as NumPy RuntimeWarnings
+    feclearexcept(FE_ALL_EXCEPT)
+
+
+cdef inline int start_loop(cnp.npy_intp size) noexcept nogil:
+    # team size of a ufunc loop over size elements, which instrumented builds time from here to finish_loop
+    cdef int n = team_size(size)
+    if SCIFY_STATS:
+        loop_begin(n, size)
+    return n
+
+
+cdef inline void finish_loop() noexcept nogil:
+    clear_fp_status()
+    if SCIFY_STATS:
+        loop_end()
+
+
+cdef void loop_d_d(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        map_dbl_p(<Fn1R> data, args[0], steps[0], args[1], steps[1], NULL, 0, dims[0], n)
+    else:
+        map_dbl_s(<Fn1R> data, args[0], steps[0], args[1], steps[1], NULL, 0, dims[0])
+
+    finish_loop()
+
+
+cdef void loop_d_dd(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        map_dbl_p(<Fn1R> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], dims[0], n)
+    else:
+        map_dbl_s(<Fn1R> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], dims[0])
+
+    finish_loop()
+
+
+cdef void loop_f_f(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        map_flt_p(<Fn1R> data, args[0], steps[0], args[1], steps[1], NULL, 0, dims[0], n)
+    else:
+        map_flt_s(<Fn1R> data, args[0], steps[0], args[1], steps[1], NULL, 0, dims[0])
+
+    finish_loop()
+
+
+cdef void loop_f_ff(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        map_flt_p(<Fn1R> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], dims[0], n)
+    else:
+        map_flt_s(<Fn1R> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], dims[0])
+
+    finish_loop()
+
+
+cdef inline void map_int64(Fn1I f, char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, bint with_err) noexcept nogil:
+    cdef:
+        Result r
+        cnp.npy_intp i
+        int n = start_loop(dims[0])
+
+    if n > 1:
+        for i in prange(dims[0], nogil=True, num_threads=n):
+            r = f((<cnp.npy_int64*> (args[0] + i * steps[0]))[0])
+            (<double*> (args[1] + i * steps[1]))[0] = r.val
+            if with_err:
+                (<double*> (args[2] + i * steps[2]))[0] = r.err
+    else:
+        for i in range(dims[0]):
+            r = f((<cnp.npy_int64*> (args[0] + i * steps[0]))[0])
+            (<double*> (args[1] + i * steps[1]))[0] = r.val
+            if with_err:
+                (<double*> (args[2] + i * steps[2]))[0] = r.err
+
+    finish_loop()
+
+
+cdef void loop_l_d(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_int64(<Fn1I> data, args, dims, steps, False)
+
+
+cdef void loop_l_dd(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_int64(<Fn1I> data, args, dims, steps, True)
+
+
+cdef inline void eval_dl(Fn2R f, char** args, cnp.npy_intp* steps, cnp.npy_intp i, bint with_err,
+                         bint single) noexcept nogil:
+    # the real argument and the int64 order, then the value and the error if with_err
+    cdef:
+        Result r
+        cnp.npy_int64 order = (<cnp.npy_int64*> (args[1] + i * steps[1]))[0]
+
+    if single:
+        r = f((<float*> (args[0] + i * steps[0]))[0], order)
+        store_flt(r, args[2] + i * steps[2], args[3] + i * steps[3] if with_err else NULL)
+    else:
+        r = f((<double*> (args[0] + i * steps[0]))[0], order)
+        (<double*> (args[2] + i * steps[2]))[0] = r.val
+        if with_err:
+            (<double*> (args[3] + i * steps[3]))[0] = r.err
+
+
+cdef inline void map_dl(Fn2R f, char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, bint with_err,
+                        bint single) noexcept nogil:
+    cdef:
+        cnp.npy_intp i
+        double tol = FLT_CHEB_TOL if single else 0, rtol = get_rtol(), prev, prev_rtol
+        int n = start_loop(dims[0])
+
+    if n > 1:
+        with parallel(num_threads=n):
+            prev = set_cheb_tol(tol)
+            prev_rtol = set_rtol(rtol)
+            for i in prange(dims[0]):
+                eval_dl(f, args, steps, i, with_err, single)
+            set_rtol(prev_rtol)
+            set_cheb_tol(prev)
+    else:
+        prev = set_cheb_tol(tol)
+        for i in range(dims[0]):
+            eval_dl(f, args, steps, i, with_err, single)
+        set_cheb_tol(prev)
+
+    finish_loop()
+
+
+cdef void loop_dl_d(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_dl(<Fn2R> data, args, dims, steps, False, False)
+
+
+cdef void loop_dl_dd(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_dl(<Fn2R> data, args, dims, steps, True, False)
+
+
+cdef void loop_fl_f(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_dl(<Fn2R> data, args, dims, steps, False, True)
+
+
+cdef void loop_fl_ff(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_dl(<Fn2R> data, args, dims, steps, True, True)
+
+
+cdef void loop_D_D(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    # the real and imaginary parts of a complex128 are two adjacent doubles
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_dbl_p(<Fn1C> data, args[0], steps[0], args[0] + sizeof(double), steps[0], args[1], steps[1], NULL, 0,
+                   dims[0], n)
+    else:
+        mapc_dbl_s(<Fn1C> data, args[0], steps[0], args[0] + sizeof(double), steps[0], args[1], steps[1], NULL, 0,
+                   dims[0])
+
+    finish_loop()
+
+
+cdef void loop_D_DD(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_dbl_p(<Fn1C> data, args[0], steps[0], args[0] + sizeof(double), steps[0], args[1], steps[1], args[2],
+                   steps[2], dims[0], n)
+    else:
+        mapc_dbl_s(<Fn1C> data, args[0], steps[0], args[0] + sizeof(double), steps[0], args[1], steps[1], args[2],
+                   steps[2], dims[0])
+
+    finish_loop()
+
+
+cdef void loop_dd_D(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_dbl_p(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], NULL, 0, dims[0], n)
+    else:
+        mapc_dbl_s(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], NULL, 0, dims[0])
+
+    finish_loop()
+
+
+cdef void loop_dd_DD(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_dbl_p(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], args[3], steps[3], dims[0],
+                   n)
+    else:
+        mapc_dbl_s(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], args[3], steps[3], dims[0])
+
+    finish_loop()
+
+
+cdef void loop_F_F(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_flt_p(<Fn1C> data, args[0], steps[0], args[0] + sizeof(float), steps[0], args[1], steps[1], NULL, 0,
+                   dims[0], n)
+    else:
+        mapc_flt_s(<Fn1C> data, args[0], steps[0], args[0] + sizeof(float), steps[0], args[1], steps[1], NULL, 0,
+                   dims[0])
+
+    finish_loop()
+
+
+cdef void loop_F_FF(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_flt_p(<Fn1C> data, args[0], steps[0], args[0] + sizeof(float), steps[0], args[1], steps[1], args[2],
+                   steps[2], dims[0], n)
+    else:
+        mapc_flt_s(<Fn1C> data, args[0], steps[0], args[0] + sizeof(float), steps[0], args[1], steps[1], args[2],
+                   steps[2], dims[0])
+
+    finish_loop()
+
+
+cdef void loop_ff_F(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_flt_p(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], NULL, 0, dims[0], n)
+    else:
+        mapc_flt_s(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], NULL, 0, dims[0])
+
+    finish_loop()
+
+
+cdef void loop_ff_FF(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef int n = start_loop(dims[0])
+
+    if n > 1:
+        mapc_flt_p(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], args[3], steps[3], dims[0],
+                   n)
+    else:
+        mapc_flt_s(<Fn1C> data, args[0], steps[0], args[1], steps[1], args[2], steps[2], args[3], steps[3], dims[0])
+
+    finish_loop()
+
+
+cdef inline void eval_fused(FusedFn* fn, char** args, cnp.npy_intp* steps, cnp.npy_intp i,
+                            bint single) noexcept nogil:
+    # the n values follow the input in args, then the n errors. Both are ordered by the bits of the mask
+    cdef:
+        Result res[MAX_FUSED]
+        int k, j = 1
+        char* err
+
+    if single:
+        fn.f((<float*> (args[0] + i * steps[0]))[0], fn.mask, res)
+    else:
+        fn.f((<double*> (args[0] + i * steps[0]))[0], fn.mask, res)
+
+    for k in range(MAX_FUSED):
+        if fn.mask & (1 << k):
+            err = args[j + fn.n] + i * steps[j + fn.n] if fn.with_err else NULL
+            if single:
+                store_flt(res[k], args[j] + i * steps[j], err)
+            else:
+                (<double*> (args[j] + i * steps[j]))[0] = res[k].val
+                if err != NULL:
+                    (<double*> err)[0] = res[k].err
+            j += 1
+
+
+cdef inline void map_fused(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data,
+                           bint single) noexcept nogil:
+    cdef:
+        cnp.npy_intp i
+        double tol = FLT_CHEB_TOL if single else 0, rtol = get_rtol(), prev, prev_rtol
+        int n = start_loop(dims[0])
+
+    if n > 1:
+        with parallel(num_threads=n):
+            prev = set_cheb_tol(tol)
+            prev_rtol = set_rtol(rtol)
+            for i in prange(dims[0]):
+                eval_fused(<FusedFn*> data, args, steps, i, single)
+            set_rtol(prev_rtol)
+            set_cheb_tol(prev)
+    else:
+        prev = set_cheb_tol(tol)
+        for i in range(dims[0]):
+            eval_fused(<FusedFn*> data, args, steps, i, single)
+        set_cheb_tol(prev)
+
+    finish_loop()
+
+
+cdef void loop_d_m(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_fused(args, dims, steps, data, False)
+
+
+cdef void loop_f_m(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_fused(args, dims, steps, data, True)
+
+
+cdef void eval_regimes(Regimes* rg, const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    """
+    Evaluates the n <= BLOCK points of x by regime. The points are classified, gathered regime by regime into
+    contiguous buffers which the regimes' block kernels evaluate, and the results are scattered back. Each kernel
+    thus runs over points taking the same code path, without the branches of a per-element kernel
+    """
+    cdef:
+        unsigned char cls[BLOCK]
+        short idx[BLOCK]
+        double xs[BLOCK]
+        double vs[BLOCK]
+        double es[BLOCK]
+        Py_ssize_t start[MAX_REGIMES + 1]
+        Py_ssize_t pos[MAX_REGIMES]
+        Py_ssize_t j, p
+        int k
+
+    for k in range(rg.n + 1):
+        start[k] = 0
+    for j in range(n):
+        k = rg.classify(x[j])
+        cls[j] = k
+        start[k + 1] += 1
+
+    if SCIFY_STATS:
+        for k in range(rg.n):
+            hit(rg.stat, k, start[k + 1])
+
+    for k in range(rg.n):
+        if start[k + 1] == n:
+            # sorted or narrow inputs mostly fall into a single regime and need not be moved
+            rg.kernels[k](x, n, val, err)
+            return
+        start[k + 1] += start[k]
+        pos[k] = start[k]
+
+    for j in range(n):
+        p = pos[cls[j]]
+        pos[cls[j]] += 1
+        xs[p] = x[j]
+        idx[p] = j
+
+    for k in range(rg.n):
+        if start[k + 1] > start[k]:
+            rg.kernels[k](xs + start[k], start[k + 1] - start[k], vs + start[k],
+                          es + start[k] if err != NULL else NULL)
+
+    for p in range(n):
+        val[idx[p]] = vs[p]
+    if err != NULL:
+        for p in range(n):
+            err[idx[p]] = es[p]
+
+
+cdef inline void run_block(void* data, bint regimes, const double* x, Py_ssize_t n, double* val,
+                           double* err) noexcept nogil:
+    if regimes:
+        eval_regimes(<Regimes*> data, x, n, val, err)
+    else:
+        (<FnBR> data)(x, n, val, err)
+
+
+cdef inline void eval_block(void* data, bint regimes, char** args, cnp.npy_intp* steps, cnp.npy_intp start,
+                            cnp.npy_intp size, bint with_err, bint single) noexcept nogil:
+    # evaluates the size elements from start. Contiguous doubles are passed in place, others through buffers
+    cdef:
+        double x[BLOCK]
+        double val[BLOCK]
+        double err[BLOCK]
+        cnp.npy_intp j
+        char* e
+
+    if (not single and steps[0] == sizeof(double) and steps[1] == sizeof(double) and
+            (not with_err or steps[2] == sizeof(double))):
+        run_block(data, regimes, <double*> (args[0] + start * steps[0]), size, <double*> (args[1] + start * steps[1]),
+                  <double*> (args[2] + start * steps[2]) if with_err else NULL)
+        return
+
+    for j in range(size):
+        if single:
+            x[j] = (<float*> (args[0] + (start + j) * steps[0]))[0]
+        else:
+            x[j] = (<double*> (args[0] + (start + j) * steps[0]))[0]
+
+    run_block(data, regimes, x, size, val, err if with_err else NULL)
+
+    for j in range(size):
+        e = args[2] + (start + j) * steps[2] if with_err else NULL
+        if single:
+            store_flt(make_r(val[j], err[j] if with_err else 0), args[1] + (start + j) * steps[1], e)
+        else:
+            (<double*> (args[1] + (start + j) * steps[1]))[0] = val[j]
+            if with_err:
+                (<double*> e)[0] = err[j]
+
+
+cdef inline void map_block(void* data, bint regimes, char** args, cnp.npy_intp* dims, cnp.npy_intp* steps,
+                           bint with_err, bint single) noexcept nogil:
+    # the elements are evaluated BLOCK at a time, the blocks being shared among the threads
+    cdef:
+        cnp.npy_intp i, blocks = (dims[0] + BLOCK - 1) // BLOCK
+        double tol = FLT_CHEB_TOL if single else 0, rtol = get_rtol(), prev, prev_rtol
+        int n = start_loop(dims[0])
+
+    if n > 1:
+        with parallel(num_threads=n):
+            prev = set_cheb_tol(tol)
+            prev_rtol = set_rtol(rtol)
+            for i in prange(blocks):
+                eval_block(data, regimes, args, steps, i * BLOCK, min(BLOCK, dims[0] - i * BLOCK), with_err, single)
+            set_rtol(prev_rtol)
+            set_cheb_tol(prev)
+    else:
+        prev = set_cheb_tol(tol)
+        for i in range(blocks):
+            eval_block(data, regimes, args, steps, i * BLOCK, min(BLOCK, dims[0] - i * BLOCK), with_err, single)
+        set_cheb_tol(prev)
+
+    finish_loop()
+
+
+cdef void loop_d_d_block(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, False, args, dims, steps, False, False)
+
+
+cdef void loop_d_dd_block(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, False, args, dims, steps, True, False)
+
+
+cdef void loop_f_f_block(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, False, args, dims, steps, False, True)
+
+
+cdef void loop_f_ff_block(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, False, args, dims, steps, True, True)
+
+
+cdef void loop_d_d_regimes(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, True, args, dims, steps, False, False)
+
+
+cdef void loop_d_dd_regimes(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, True, args, dims, steps, True, False)
+
+
+cdef void loop_f_f_regimes(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, True, args, dims, steps, False, True)
+
+
+cdef void loop_f_ff_regimes(char** args, cnp.npy_intp* dims, cnp.npy_intp* steps, void* data) noexcept nogil:
+    map_block(data, True, args, dims, steps, True, True)
+
+
+cdef object make_ufunc(void* f, cnp.PyUFuncGenericFunction loop, cnp.PyUFuncGenericFunction single_loop, int nin,
+                       tuple types, str name, str doc):
+    """
+    Creates a ufunc whose inner loops call the kernel ``f``. The outputs follow the nin inputs in types. If
+    single_loop is not NULL, a second loop takes the single precision counterparts of types, which must be listed
+    first so that float32 and complex64 arguments are not upcast. Integer arguments are kept in both loops
+    """
+    cdef:
+        int n_types = 1 if single_loop is NULL else 2
+        int n_args = len(types)
+        cnp.PyUFuncGenericFunction* loops = <cnp.PyUFuncGenericFunction*> PyMem_Malloc(
+            n_types * sizeof(cnp.PyUFuncGenericFunction))
+        void** data = <void**> PyMem_Malloc(n_types * sizeof(void*))
+        char* signature = <char*> PyMem_Malloc(n_types * n_args)
+        bytes b_name = name.encode(), b_doc = doc.encode()
+        int i
+
+    if loops is NULL or data is NULL or signature is NULL:
+        raise MemoryError(f"Could not allocate ufunc '{name}'")
+
+    if single_loop is not NULL:
+        loops[0] = single_loop
+        for i in range(n_args):
+            signature[i] = <char> _SINGLE.get(types[i], types[i])
+    loops[n_types - 1] = loop
+
+    for i in range(n_types):
+        data[i] = f
+    for i in range(n_args):
+        signature[(n_types - 1) * n_args + i] = <char> types[i]
+
+    _ufunc_refs.append((b_name, b_doc))
+    return cnp.PyUFunc_FromFuncAndData(loops, data, signature, n_types, nin, n_args - nin, cnp.PyUFunc_None,
+                                       b_name, b_doc, 0)
+
+
+cdef object ufunc_d_d(Fn1R f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_d_d, <cnp.PyUFuncGenericFunction> loop_f_f, 1,
+                      (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_d_dd(Fn1R f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_d_dd, <cnp.PyUFuncGenericFunction> loop_f_ff, 1,
+                      (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_l_d(Fn1I f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_l_d, NULL, 1,
+                      (cnp.NPY_INT64, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_l_dd(Fn1I f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_l_dd, NULL, 1,
+                      (cnp.NPY_INT64, cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_d_d_block(FnBR g, str name, str doc):
+    return make_ufunc(<void*> g, <cnp.PyUFuncGenericFunction> loop_d_d_block,
+                      <cnp.PyUFuncGenericFunction> loop_f_f_block, 1, (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_d_dd_block(FnBR g, str name, str doc):
+    return make_ufunc(<void*> g, <cnp.PyUFuncGenericFunction> loop_d_dd_block,
+                      <cnp.PyUFuncGenericFunction> loop_f_ff_block, 1, (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE, cnp.NPY_DOUBLE),
+                      name, doc)
+
+
+cdef Regimes* copy_regimes(Regimes rg, str name) except NULL:
+    cdef Regimes* r
+
+    assert 0 < rg.n <= MAX_REGIMES, f"Number of regimes must be between 1 and {MAX_REGIMES}"
+    r = <Regimes*> PyMem_Malloc(sizeof(Regimes))
+    if r is NULL:
+        raise MemoryError(f"Could not allocate ufunc '{name}'")
+    r[0] = rg
+    return r
+
+
+cdef object ufunc_d_d_regimes(Regimes rg, str name, str doc):
+    """Creates a ufunc evaluating each block of its elements regime by regime, see eval_regimes"""
+    return make_ufunc(<void*> copy_regimes(rg, name), <cnp.PyUFuncGenericFunction> loop_d_d_regimes,
+                      <cnp.PyUFuncGenericFunction> loop_f_f_regimes, 1, (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_d_dd_regimes(Regimes rg, str name, str doc):
+    return make_ufunc(<void*> copy_regimes(rg, name), <cnp.PyUFuncGenericFunction> loop_d_dd_regimes,
+                      <cnp.PyUFuncGenericFunction> loop_f_ff_regimes, 1,
+                      (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_dl_d(Fn2R f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_dl_d, <cnp.PyUFuncGenericFunction> loop_fl_f, 2,
+                      (cnp.NPY_DOUBLE, cnp.NPY_INT64, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_dl_dd(Fn2R f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_dl_dd, <cnp.PyUFuncGenericFunction> loop_fl_ff, 2,
+                      (cnp.NPY_DOUBLE, cnp.NPY_INT64, cnp.NPY_DOUBLE, cnp.NPY_DOUBLE), name, doc)
+
+
+cdef object ufunc_D_D(Fn1C f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_D_D, <cnp.PyUFuncGenericFunction> loop_F_F, 1,
+                      (cnp.NPY_CDOUBLE, cnp.NPY_CDOUBLE), name, doc)
+
+
+cdef object ufunc_D_DD(Fn1C f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_D_DD, <cnp.PyUFuncGenericFunction> loop_F_FF, 1,
+                      (cnp.NPY_CDOUBLE, cnp.NPY_CDOUBLE, cnp.NPY_CDOUBLE), name, doc)
+
+
+cdef object ufunc_dd_D(Fn1C f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_dd_D, <cnp.PyUFuncGenericFunction> loop_ff_F, 2,
+                      (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE, cnp.NPY_CDOUBLE), name, doc)
+
+
+cdef object ufunc_dd_DD(Fn1C f, str name, str doc):
+    return make_ufunc(<void*> f, <cnp.PyUFuncGenericFunction> loop_dd_DD, <cnp.PyUFuncGenericFunction> loop_ff_FF, 2,
+                      (cnp.NPY_DOUBLE, cnp.NPY_DOUBLE, cnp.NPY_CDOUBLE, cnp.NPY_CDOUBLE), name, doc)
+
+
+cdef object ufunc_d_m(FnMR f, int mask, bint with_err, str name, str doc):
+    """Creates a ufunc with one output per bit set in mask (and as many errors if with_err) from a fused kernel"""
+    cdef FusedFn* fn
+
+    assert 0 < mask < 1 << MAX_FUSED, f"mask must select between 1 and {MAX_FUSED} outputs"
+    fn = <FusedFn*> PyMem_Malloc(sizeof(FusedFn))
+    if fn is NULL:
+        raise MemoryError(f"Could not allocate ufunc '{name}'")
+
+    fn.f = f
+    fn.mask = mask
+    fn.n = bin(mask).count('1')
+    fn.with_err = with_err
+
+    return make_ufunc(<void*> fn, <cnp.PyUFuncGenericFunction> loop_d_m, <cnp.PyUFuncGenericFunction> loop_f_m, 1,
+                      (cnp.NPY_DOUBLE,) * (1 + fn.n * (2 if with_err else 1)), name, doc)
+
+
+def get_num_threads():
+    """Returns the number of threads the specfunc functions use by default"""
+    return default_threads or openmp.omp_get_max_threads()
+
+
+def set_num_threads(int n=0):
+    """Sets the number of threads the specfunc functions use by default. 0 restores the OpenMP default"""
+    global default_threads
+    assert n >= 0, "Number of threads must be non-negative"
+    default_threads = n
+
+
+def get_serial_threshold():
+    """Returns the array size below which the specfunc functions do not start threads"""
+    return serial_threshold
+
+
+def set_serial_threshold(Py_ssize_t n):
+    """Sets the array size below which the specfunc functions do not start threads"""
+    global serial_threshold
+    assert n >= 0, "Serial threshold must be non-negative"
+    serial_threshold = n
+
+
+def get_local_threads():
+    """Returns the number of threads set for the calling thread's evaluations, 0 if not set"""
+    return scify_call_threads
+
+
+def set_local_threads(int n):
+    """
+    Sets the number of threads used by the evaluations made from the calling thread, overriding the process wide
+    setting. 0 removes the override. Returns the previous value
+    """
+    global scify_call_threads
+    cdef int prev = scify_call_threads
+
+    assert n >= 0, "Number of threads must be non-negative"
+    scify_call_threads = n
+    return prev
+
+
+def get_team_size(Py_ssize_t size):
+    """Returns the number of threads an evaluation of size elements from the calling thread uses, 1 if serial"""
+    return team_size(size)
+
+
+def ufunc_stats():
+    """Returns the calls, elements and wall time in seconds of each ufunc evaluated, by name"""
+    return {name: {'calls': c, 'elements': n, 'seconds': t} for name, (c, n, t) in _ufunc_stats.items()}
+
+
+def reset_ufunc_stats():
+    """Sets the statistics of the ufuncs to zero"""
+    _ufunc_stats.clear()
+
+
+cdef object call(object ufunc, tuple args, dict kwargs):
+    # calls the ufunc, recording its statistics in instrumented builds
+    if not SCIFY_STATS:
+        return ufunc(*args, **kwargs)
+
+    t0 = perf_counter()
+    res = ufunc(*args, **kwargs)
+    elapsed = perf_counter() - t0
+
+    calls, elements, seconds = _ufunc_stats.get(ufunc.__name__, (0, 0, 0.))
+    _ufunc_stats[ufunc.__name__] = (calls + 1, elements + np.size(res[0] if ufunc.nout > 1 else res),
+                                    seconds + elapsed)
+    return res
+
+
+cdef bint single_args(tuple args):
+    # the float32 and complex64 loops are for arguments of those types, possibly with Python numbers. NumPy would also
+    # pick them for bool, the small integer types and float16, which cast safely to float32
+    for a in args:
+        dtype = getattr(a, 'dtype', None)
+        if dtype is None:
+            if isinstance(a, bool) or not isinstance(a, (int, float, complex)):
+                return False
+        elif dtype not in (np.float32, np.complex64):
+            return False
+    return True
+
+
+def evaluate(ufunc, *args, bint threaded=True, num_threads=None, out=None, bint inplace=False, double rtol=0,
+             **kwargs):
+    """
+    Evaluates a specfunc ufunc over the arguments. If threaded is False, the inner loops are run
+    on the calling thread only. Otherwise they use num_threads threads if given, or the calling thread's or
+    process wide setting.
+
+    If rtol is positive, the kernels which support it stop their series once the relative error is below rtol
+    instead of at full double precision. Other kernels ignore it.
+
+    The result is written into ``out`` if given, or back into the first argument if ``inplace`` is True.
+    Otherwise a new array is allocated; the arguments are never modified. For ufuncs which also return the error
+    estimates, ``out`` may be a single array for the values or a tuple of arrays for the values and errors.
+
+    Only float32 and complex64 arguments are evaluated in single precision. The others, including bool, the small
+    integer types and float16, are evaluated in double precision, unless a ``signature`` or ``dtype`` is given.
+    """
+    cdef:
+        int prev
+        double prev_rtol
+
+    assert 0 <= rtol < 1, "Relative tolerance must be in [0, 1)"
+    if inplace:
+        assert out is None, "Cannot specify 'out' when evaluating inplace"
+        out = args[0]
+        assert isinstance(out, np.ndarray), "Input must be a numpy array when evaluating inplace"
+    if out is not None:
+        if not isinstance(out, tuple):
+            out = (out,) + (None,) * (ufunc.nout - 1)
+        kwargs['out'] = out
+
+    if ufunc.ntypes > 1 and 'signature' not in kwargs and 'dtype' not in kwargs and not single_args(args):
+        kwargs['signature'] = ufunc.types[ufunc.ntypes - 1]
+
+    if not threaded:
+        num_threads = 1
+    if num_threads is None and rtol == 0:
+        return call(ufunc, args, kwargs)
+
+    assert num_threads is None or num_threads > 0, "Number of threads must be positive"
+    prev = set_local_threads(num_threads or scify_call_threads)
+    prev_rtol = set_rtol(rtol)
+    try:
+        return call(ufunc, args, kwargs)
+    finally:
+        set_rtol(prev_rtol)
+        set_local_threads(prev)
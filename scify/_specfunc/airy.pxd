@@ -0,0 +1,12 @@
+from ._results cimport Result
+
+cdef:
+    (Result, Result) airy_mod_phase(double) noexcept nogil
+    Result airy_aie(double) noexcept nogil
+    Result airy_bie(double) noexcept nogil
+    Result airy_ai_series(double) noexcept nogil
+    Result airy_bi_series(double) noexcept nogil
+    Result _airy_Ai(double) noexcept nogil
+    Result _airy_Bi(double) noexcept nogil
+    Result _airy_Ai_scaled(double) noexcept nogil
+    Result _airy_Bi_scaled(double) noexcept nogil
@@ -1,16 +1,15 @@
-import numpy as np
-
 from libc cimport math as cm
-cimport numpy as cnp
 
 from scify cimport _machine as m
-from ._results cimport Result, make_r, make_r_0, make_r_nan, map_dbl_p, map_dbl_s
-from .cheb cimport cheb_eval_mode
+from ._results cimport (BLOCK, Regimes, Result, eval_scalar, make_r, make_r_0, make_r_nan, ufunc_d_d, ufunc_d_dd,
+                        ufunc_d_d_regimes, ufunc_d_dd_regimes)
+from .cheb cimport ChebSeries, cheb_eval_block_mode, cheb_eval_mode
+from .stats cimport AIRY_AI, AIRY_BI, SCIFY_STATS, hit
 from .trig cimport cos_err, sin_err
 
 
 cdef:
-    double[::1] a1 = np.array([
+    double[37] A1 = [
         0.0065809191761485,
         0.0023675984685722,
         0.0001324741670371,
@@ -48,8 +47,9 @@ cdef:
         0.0000000000000003,
         0.0000000000000001,
         0.0000000000000001
-    ])
-    double[::1] a2 = np.array([
+    ]
+    ChebSeries a1 = ChebSeries(&A1[0], sizeof(A1) // sizeof(double))
+    double[36] A2 = [
         -0.07125837815669365,
         -0.00590471979831451,
         -0.00012114544069499,
@@ -86,8 +86,9 @@ cdef:
         -0.00000000000000007,
         -0.00000000000000004,
         -0.00000000000000002
-    ])
-    double[::1] b1 = np.array([
+    ]
+    ChebSeries a2 = ChebSeries(&A2[0], sizeof(A2) // sizeof(double))
+    double[33] B1 = [
         -0.01562844480625341,
         0.00778336445239681,
         0.00086705777047718,
@@ -121,8 +122,9 @@ cdef:
         0.00000000000000017,
         0.00000000000000007,
         0.00000000000000002
-    ])
-    double[::1] b2 = np.array([
+    ]
+    ChebSeries b1 = ChebSeries(&B1[0], sizeof(B1) // sizeof(double))
+    double[32] B2 = [
         0.00440527345871877,
         -0.03042919452318455,
         -0.00138565328377179,
@@ -155,8 +157,9 @@ cdef:
         -0.00000000000000015,
         -0.00000000000000006,
         -0.00000000000000002
-    ])
-    double[::1] aie = np.array([
+    ]
+    ChebSeries b2 = ChebSeries(&B2[0], sizeof(B2) // sizeof(double))
+    double[36] AIE = [
         -0.0187519297793867540198,
         -0.0091443848250055004725,
         0.0009010457337825074652,
@@ -193,9 +196,10 @@ cdef:
         -0.0000000000000000509642,
         0.0000000000000000252377,
         -0.0000000000000000125793
-    ])
+    ]
+    ChebSeries aie = ChebSeries(&AIE[0], sizeof(AIE) // sizeof(double))
 
-    double[::1] aif = np.array([
+    double[9] AIF = [
         -0.03797135849666999750,
         0.05919188853726363857,
         0.00098629280577279975,
@@ -205,8 +209,11 @@ cdef:
         0.00000000000010092454,
         0.00000000000000012014,
         0.00000000000000000010
-    ])
-    double[::1] aig = np.array([
+
+    ]
+
+    ChebSeries aif = ChebSeries(&AIF[0], sizeof(AIF) // sizeof(double))
+    double[8] AIG = [
         0.01815236558116127,
         0.02157256316601076,
         0.00025678356987483,
@@ -215,8 +222,9 @@ cdef:
         0.00000000000952517,
         0.00000000000001392,
         0.00000000000000001
-    ])
-    double[::1] bif = np.array([
+    ]
+    ChebSeries aig = ChebSeries(&AIG[0], sizeof(AIG) // sizeof(double))
+    double[9] BIF = [
         -0.01673021647198664948,
         0.10252335834249445610,
         0.00170830925073815165,
@@ -226,8 +234,9 @@ cdef:
         0.00000000000017480643,
         0.00000000000000020810,
         0.00000000000000000018
-    ])
-    double[::1] big = np.array([
+    ]
+    ChebSeries bif = ChebSeries(&BIF[0], sizeof(BIF) // sizeof(double))
+    double[8] BIG = [
         0.02246622324857452,
         0.03736477545301955,
         0.00044476218957212,
@@ -236,8 +245,9 @@ cdef:
         0.00000000001649807,
         0.00000000000002411,
         0.00000000000000002
-    ])
-    double[::1] bif2 = np.array([
+    ]
+    ChebSeries big = ChebSeries(&BIG[0], sizeof(BIG) // sizeof(double))
+    double[10] BIF2 = [
         0.0998457269381604100,
         0.4786249778630055380,
         0.0251552119604330118,
@@ -248,8 +258,9 @@ cdef:
         0.0000000000014288910,
         0.0000000000000044962,
         0.0000000000000000111
-    ])
-    double[::1] big2 = np.array([
+    ]
+    ChebSeries bif2 = ChebSeries(&BIF2[0], sizeof(BIF2) // sizeof(double))
+    double[10] BIG2 = [
         0.033305662145514340,
         0.161309215123197068,
         0.0063190073096134286,
@@ -260,8 +271,9 @@ cdef:
         0.0000000000001783107,
         0.0000000000000005167,
         0.0000000000000000011
-    ])
-    double[::1] bip = np.array([
+    ]
+    ChebSeries big2 = ChebSeries(&BIG2[0], sizeof(BIG2) // sizeof(double))
+    double[24] BIP = [
         -0.08322047477943447,
         0.01146118927371174,
         0.00042896440718911,
@@ -286,8 +298,9 @@ cdef:
         0.00000000000000049,
         -0.00000000000000011,
         0.00000000000000001
-    ])
-    double[::1] bip2 = np.array([
+    ]
+    ChebSeries bip = ChebSeries(&BIP[0], sizeof(BIP) // sizeof(double))
+    double[29] BIP2 = [
         -0.113596737585988679,
         0.0041381473947881595,
         0.0001353470622119332,
@@ -317,10 +330,11 @@ cdef:
         0.0000000000000002175,
         -0.0000000000000001737,
         -0.0000000000000000010
-    ])
+    ]
+    ChebSeries bip2 = ChebSeries(&BIP2[0], sizeof(BIP2) // sizeof(double))
 
 
-cdef (Result, Result) airy_mod_phase(double x) nogil:
+cdef (Result, Result) airy_mod_phase(double x) noexcept nogil:
     """airy function for x < -1"""
     cdef:
         Result res_m, res_p
@@ -343,13 +357,48 @@ cdef (Result, Result) airy_mod_phase(double x) nogil:
     mr = cm.sqrt(m_ / sqx)
     mp = m.M_PI_4 - x * sqx * p_
 
+    # the errors of the series, which are those of their truncation under a relative tolerance, carried through the
+    # square root and the scaling of the phase
     return (
-        make_r(mr, cm.fabs(mr) * m.DBL_EPSILON + cm.fabs(res_m.err / res_m.val)),
-        make_r(mp, cm.fabs(mp) * m.DBL_EPSILON + cm.fabs(res_p.err / res_p.val))
+        make_r(mr, cm.fabs(mr) * (m.DBL_EPSILON + cm.fabs(res_m.err / (2 * m_)))),
+        make_r(mp, cm.fabs(mp) * m.DBL_EPSILON + cm.fabs(x * sqx * res_p.err))
     )
 
 
-cdef Result airy_aie(double x) nogil:
+cdef void mod_phase_block(const double* x, Py_ssize_t n, bint far, double* mod, double* mod_err, double* phase,
+                          double* phase_err) noexcept nogil:
+    """airy_mod_phase for n points all below -2 if far, else all in [-2, -1)"""
+    cdef:
+        double z[BLOCK]
+        double rm[BLOCK]
+        double em[BLOCK]
+        double rp[BLOCK]
+        double ep[BLOCK]
+        double sqx, m_, p_
+        Py_ssize_t j
+
+    if far:
+        for j in range(n):
+            z[j] = 16. / cm.pow(x[j], 3) + 1
+        cheb_eval_block_mode(a1, z, n, -1, 1, rm, em)
+        cheb_eval_block_mode(a2, z, n, -1, 1, rp, ep)
+    else:
+        for j in range(n):
+            z[j] = (16. / cm.pow(x[j], 3) + 9) / 7
+        cheb_eval_block_mode(b1, z, n, -1, 1, rm, em)
+        cheb_eval_block_mode(b2, z, n, -1, 1, rp, ep)
+
+    for j in range(n):
+        sqx = cm.sqrt(-x[j])
+        m_ = 0.3125 + rm[j]
+        p_ = -0.625 + rp[j]
+        mod[j] = cm.sqrt(m_ / sqx)
+        phase[j] = m.M_PI_4 - x[j] * sqx * p_
+        mod_err[j] = cm.fabs(mod[j]) * (m.DBL_EPSILON + cm.fabs(em[j] / (2 * m_)))
+        phase_err[j] = cm.fabs(phase[j]) * m.DBL_EPSILON + cm.fabs(x[j] * sqx * ep[j])
+
+
+cdef Result airy_aie(double x) noexcept nogil:
     """airy function of the first kind for x >= 1"""
     cdef:
         double sqx = cm.sqrt(x)
@@ -361,27 +410,53 @@ cdef Result airy_aie(double x) nogil:
     return make_r(val, res.err / y + m.DBL_EPSILON * cm.fabs(val))
 
 
-def airy_Ai(x, bint threaded):
-    x = np.asarray(x, float)
+cdef Result airy_ai_series(double x) noexcept nogil:
+    """airy function of the first kind for |x| <= 1"""
     cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+        double z = x ** 3
+        Result f = cheb_eval_mode(aif, z, -1, 1)
+        Result g = cheb_eval_mode(aig, z, -1, 1)
 
-    if n == 1:
-        return _airy_Ai(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Ai, arr, n)
-    else:
-        map_dbl_s(_airy_Ai, arr, n)
+    return make_r(0.375 + (f.val - x * (0.25 + g.val)), f.err + cm.fabs(x * g.err))
+
+
+cdef Result airy_bi_series(double x) noexcept nogil:
+    """airy function of the second kind for -1 <= x <= 2"""
+    cdef:
+        double z = x ** 3
+        Result f, g
+
+    if x < 1:
+        f = cheb_eval_mode(bif, z, -1, 1)
+        g = cheb_eval_mode(big, z, -1, 1)
+        return make_r(0.625 + f.val + x * (0.4375 + g.val), f.err + cm.fabs(x * g.err))
 
-    return arr.reshape(x.shape)
+    z = (2. * z - 9) / 7
+    f = cheb_eval_mode(bif2, z, -1, 1)
+    g = cheb_eval_mode(big2, z, -1, 1)
+    return make_r(1.125 + f.val + x * (0.625 + g.val), f.err + cm.fabs(x * g.err))
 
 
-cdef Result _airy_Ai(double x) nogil:
+airy_Ai = ufunc_d_d_regimes(ai_regimes(), 'airy_Ai', "Airy function of the first kind, Ai(x)")
+airy_Ai_e = ufunc_d_dd_regimes(ai_regimes(), 'airy_Ai_e',
+                               "Airy function of the first kind, Ai(x), and its absolute error")
+
+cpdef double airy_Ai_scalar(double x, double rtol=0) except? -1:
+    """Airy function of the first kind, Ai(x), of a single value"""
+    return eval_scalar(_airy_Ai, x, rtol)
+
+# evaluated element by element, the baseline of the regime ufuncs' benchmarks
+_airy_Ai_elementwise = ufunc_d_d(_airy_Ai, '_airy_Ai_elementwise', "Airy function of the first kind, Ai(x)")
+
+
+cdef Result _airy_Ai(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result mod, theta, res_cos
-        double s, x32, z
+        double s, x32
+
+    if SCIFY_STATS:
+        hit(AIRY_AI, ai_regime(x), 1)
 
     if x < -1:
         mod, theta = airy_mod_phase(x)
@@ -390,11 +465,7 @@ cdef Result _airy_Ai(double x) nogil:
         res.err = cm.fabs(mod.val * res_cos.err) + cm.fabs(res_cos.val * mod.err)
 
     elif x <= 1:
-        z = x ** 3
-        mod = cheb_eval_mode(aif, z, -1, 1)
-        theta = cheb_eval_mode(aig, z, -1, 1)
-        res.val = 0.375 + (mod.val - x * (0.25 + theta.val))
-        res.err = mod.err + cm.fabs(x * theta.err)
+        res = airy_ai_series(x)
 
     else:
         x32 = x ** 1.5
@@ -410,27 +481,119 @@ cdef Result _airy_Ai(double x) nogil:
     return res
 
 
-def airy_Ai_scaled(x, bint threaded):
-    x = np.asarray(x, float)
+cdef Regimes ai_regimes():
+    # the branches of _airy_Ai, the oscillatory one split by the series of airy_mod_phase
+    cdef Regimes rg
+    rg.classify = ai_regime
+    rg.n = 4
+    rg.stat = AIRY_AI
+    rg.kernels[0] = airy_Ai_far
+    rg.kernels[1] = airy_Ai_near
+    rg.kernels[2] = airy_Ai_series
+    rg.kernels[3] = airy_Ai_decay
+    return rg
+
+
+cdef int ai_regime(double x) noexcept nogil:
+    # NaN falls into the last regime, as it does into the last branch of _airy_Ai
+    return (not x < -2) + (not x < -1) + (not x <= 1)
+
+
+cdef inline void airy_Ai_oscillatory(const double* x, Py_ssize_t n, bint far, double* val,
+                                     double* err) noexcept nogil:
     cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+        double mod[BLOCK]
+        double mod_err[BLOCK]
+        double theta[BLOCK]
+        double theta_err[BLOCK]
+        Result c
+        Py_ssize_t j
+
+    mod_phase_block(x, n, far, mod, mod_err, theta, theta_err)
+    for j in range(n):
+        c = cos_err(theta[j], theta_err[j])
+        val[j] = mod[j] * c.val
+        if err != NULL:
+            err[j] = cm.fabs(mod[j] * c.err) + cm.fabs(c.val * mod_err[j]) + m.DBL_EPSILON * cm.fabs(val[j])
+
+
+cdef void airy_Ai_far(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Ai_oscillatory(x, n, True, val, err)
+
+
+cdef void airy_Ai_near(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Ai_oscillatory(x, n, False, val, err)
+
+
+cdef void airy_Ai_series(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    cdef:
+        double z[BLOCK]
+        double f[BLOCK]
+        double f_err[BLOCK]
+        double g[BLOCK]
+        double g_err[BLOCK]
+        double v
+        Py_ssize_t j
+
+    for j in range(n):
+        z[j] = cm.pow(x[j], 3)
+    cheb_eval_block_mode(aif, z, n, -1, 1, f, f_err)
+    cheb_eval_block_mode(aig, z, n, -1, 1, g, g_err)
+
+    for j in range(n):
+        v = 0.375 + (f[j] - x[j] * (0.25 + g[j]))
+        if err != NULL:
+            err[j] = f_err[j] + cm.fabs(x[j] * g_err[j]) + m.DBL_EPSILON * cm.fabs(v)
+        val[j] = v
+
+
+cdef void airy_Ai_decay(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    cdef:
+        double z[BLOCK]
+        double r[BLOCK]
+        double r_err[BLOCK]
+        double sqx, y, x32, s, v, e
+        Py_ssize_t j
+
+    for j in range(n):
+        z[j] = 2. / (x[j] * cm.sqrt(x[j])) - 1
+    cheb_eval_block_mode(aie, z, n, -1, 1, r, r_err)
+
+    for j in range(n):
+        sqx = cm.sqrt(x[j])
+        y = cm.sqrt(sqx)
+        x32 = cm.pow(x[j], 1.5)
+        s = cm.exp(-2.0 * x32 / 3.0)
+        v = (0.28125 + r[j]) / y
+        e = r_err[j] / y + m.DBL_EPSILON * cm.fabs(v)
+        v = v * s
+        e = e * s + v * x32 * m.DBL_EPSILON
+        if cm.fabs(v) < m.DBL_MIN:
+            v = e = cm.NAN
+        else:
+            e += m.DBL_EPSILON * cm.fabs(v)
+
+        val[j] = v
+        if err != NULL:
+            err[j] = e
 
-    if n == 1:
-        return _airy_Ai_scaled(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Ai_scaled, arr, n)
-    else:
-        map_dbl_s(_airy_Ai_scaled, arr, n)
 
-    return arr.reshape(x.shape)
+airy_Ai_scaled = ufunc_d_d(_airy_Ai_scaled, 'airy_Ai_scaled',
+                           "Scaled Airy function of the first kind, exp(2/3 x^1.5) Ai(x) for x > 0")
+airy_Ai_scaled_e = ufunc_d_dd(_airy_Ai_scaled, 'airy_Ai_scaled_e',
+                              "Scaled Airy function of the first kind, exp(2/3 x^1.5) Ai(x) for x > 0, "
+                              "and its absolute error")
 
+cpdef double airy_Ai_scaled_scalar(double x, double rtol=0) except? -1:
+    """Scaled Airy function of the first kind, exp(2/3 x^1.5) Ai(x) for x > 0, of a single value"""
+    return eval_scalar(_airy_Ai_scaled, x, rtol)
 
-cdef Result _airy_Ai_scaled(double x) nogil:
+
+cdef Result _airy_Ai_scaled(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result mod, theta, res_cos
-        double z, s
+        double s
 
     if x < -1:
         mod, theta = airy_mod_phase(x)
@@ -438,14 +601,11 @@ cdef Result _airy_Ai_scaled(double x) nogil:
         res.val = mod.val * res_cos.val
         res.err = cm.fabs(mod.val * res_cos.err) + cm.fabs(res_cos.val * mod.err) + m.DBL_EPSILON * cm.fabs(res.val)
     elif x < 1:
-        z = x ** 3
-        mod = cheb_eval_mode(aif, z, -1, 1)
-        theta = cheb_eval_mode(aig, z, -1, 1)
-        res.val = 0.375 + (mod.val - x * (0.25 + theta.val))
-        res.err = mod.err + cm.fabs(x * theta.err) + m.DBL_EPSILON * cm.fabs(res.val)
+        res = airy_ai_series(x)
+        res.err += m.DBL_EPSILON * cm.fabs(res.val)
 
         if x > 0:
-            s = cm.exp(2. / 3 * cm.sqrt(z))
+            s = cm.exp(2. / 3 * x ** 1.5)
             res.val *= s
             res.err *= s
     else:
@@ -453,7 +613,7 @@ cdef Result _airy_Ai_scaled(double x) nogil:
     return res
 
 
-cdef Result airy_bie(double x) nogil:
+cdef Result airy_bie(double x) noexcept nogil:
     """airy function of the second kind for x >= 2"""
     cdef:
         double sqx = cm.sqrt(x)
@@ -472,48 +632,35 @@ cdef Result airy_bie(double x) nogil:
     return make_r(val, res.err / y + m.DBL_EPSILON * cm.fabs(val))
 
 
-def airy_Bi(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+airy_Bi = ufunc_d_d_regimes(bi_regimes(), 'airy_Bi', "Airy function of the second kind, Bi(x)")
+airy_Bi_e = ufunc_d_dd_regimes(bi_regimes(), 'airy_Bi_e',
+                               "Airy function of the second kind, Bi(x), and its absolute error")
 
-    if n == 1:
-        return _airy_Bi(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Bi, arr, n)
-    else:
-        map_dbl_s(_airy_Bi, arr, n)
+cpdef double airy_Bi_scalar(double x, double rtol=0) except? -1:
+    """Airy function of the second kind, Bi(x), of a single value"""
+    return eval_scalar(_airy_Bi, x, rtol)
 
-    return arr.reshape(x.shape)
+_airy_Bi_elementwise = ufunc_d_d(_airy_Bi, '_airy_Bi_elementwise', "Airy function of the second kind, Bi(x)")
 
 
-cdef Result _airy_Bi(double x) nogil:
+cdef Result _airy_Bi(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result mod, theta, res_sin
         double s, z
 
+    if SCIFY_STATS:
+        hit(AIRY_BI, bi_regime(x), 1)
+
     if x < -1:
         mod, theta = airy_mod_phase(x)
         res_sin = sin_err(theta.val, theta.err)
         res.val = mod.val * res_sin.val
         res.err = cm.fabs(mod.val * res_sin.err) + cm.fabs(res_sin.val * mod.err)
-    elif x < 1:
-        z = x ** 3
-        mod = cheb_eval_mode(bif, z, -1, 1)
-        theta = cheb_eval_mode(big, z, -1, 1)
-        res.val = 0.625 + mod.val + x * (0.4375 + theta.val)
-        res.err = mod.err + cm.fabs(x * theta.err)
-
     elif x <= 2:
-        z = (2. * x ** 3 - 9) / 7
-        mod = cheb_eval_mode(bif2, z, -1, 1)
-        theta = cheb_eval_mode(big2, z, -1, 1)
-        res.val = 1.125 + mod.val + x * (0.625 + theta.val)
-        res.err = mod.err + cm.fabs(x * theta.err)
+        res = airy_bi_series(x)
     else:
-        z = 2. / 3 * x ** 1.5
+        z = 2. / 3 * cm.pow(x, 1.5)
         s = cm.exp(z)
 
         if z > m.LOG_DBL_MAX - 1:
@@ -526,55 +673,171 @@ cdef Result _airy_Bi(double x) nogil:
     res.err += m.DBL_EPSILON * cm.fabs(res.val)
     return res
 
-def airy_Bi_scaled(x, bint threaded):
-    x = np.asarray(x, float)
+
+cdef Regimes bi_regimes():
+    # the branches of _airy_Bi, split further by the series of airy_mod_phase, airy_bi_series and airy_bie
+    cdef Regimes rg
+    rg.classify = bi_regime
+    rg.n = 6
+    rg.stat = AIRY_BI
+    rg.kernels[0] = airy_Bi_far
+    rg.kernels[1] = airy_Bi_near
+    rg.kernels[2] = airy_Bi_series
+    rg.kernels[3] = airy_Bi_series_2
+    rg.kernels[4] = airy_Bi_growth
+    rg.kernels[5] = airy_Bi_growth_2
+    return rg
+
+
+cdef int bi_regime(double x) noexcept nogil:
+    return (not x < -2) + (not x < -1) + (not x < 1) + (not x <= 2) + (not x < 4)
+
+
+cdef inline void airy_Bi_oscillatory(const double* x, Py_ssize_t n, bint far, double* val,
+                                     double* err) noexcept nogil:
     cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+        double mod[BLOCK]
+        double mod_err[BLOCK]
+        double theta[BLOCK]
+        double theta_err[BLOCK]
+        Result s
+        Py_ssize_t j
+
+    mod_phase_block(x, n, far, mod, mod_err, theta, theta_err)
+    for j in range(n):
+        s = sin_err(theta[j], theta_err[j])
+        val[j] = mod[j] * s.val
+        if err != NULL:
+            err[j] = cm.fabs(mod[j] * s.err) + cm.fabs(s.val * mod_err[j]) + m.DBL_EPSILON * cm.fabs(val[j])
+
+
+cdef void airy_Bi_far(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Bi_oscillatory(x, n, True, val, err)
+
+
+cdef void airy_Bi_near(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Bi_oscillatory(x, n, False, val, err)
 
-    if n == 1:
-        return _airy_Bi_scaled(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Bi_scaled, arr, n)
+
+cdef inline void airy_Bi_series_block(const double* x, Py_ssize_t n, bint upper, double* val,
+                                      double* err) noexcept nogil:
+    """airy_bi_series for n points all in [1, 2] if upper, else all in [-1, 1)"""
+    cdef:
+        double z[BLOCK]
+        double f[BLOCK]
+        double f_err[BLOCK]
+        double g[BLOCK]
+        double g_err[BLOCK]
+        double v
+        Py_ssize_t j
+
+    if upper:
+        for j in range(n):
+            z[j] = (2. * cm.pow(x[j], 3) - 9) / 7
+        cheb_eval_block_mode(bif2, z, n, -1, 1, f, f_err)
+        cheb_eval_block_mode(big2, z, n, -1, 1, g, g_err)
     else:
-        map_dbl_s(_airy_Bi_scaled, arr, n)
+        for j in range(n):
+            z[j] = cm.pow(x[j], 3)
+        cheb_eval_block_mode(bif, z, n, -1, 1, f, f_err)
+        cheb_eval_block_mode(big, z, n, -1, 1, g, g_err)
+
+    for j in range(n):
+        if upper:
+            v = 1.125 + f[j] + x[j] * (0.625 + g[j])
+        else:
+            v = 0.625 + f[j] + x[j] * (0.4375 + g[j])
+        if err != NULL:
+            err[j] = f_err[j] + cm.fabs(x[j] * g_err[j]) + m.DBL_EPSILON * cm.fabs(v)
+        val[j] = v
+
+
+cdef void airy_Bi_series(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Bi_series_block(x, n, False, val, err)
 
-    return arr.reshape(x.shape)
 
+cdef void airy_Bi_series_2(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Bi_series_block(x, n, True, val, err)
 
-cdef Result _airy_Bi_scaled(double x) nogil:
+
+cdef inline void airy_Bi_growth_block(const double* x, Py_ssize_t n, bint far, double* val,
+                                      double* err) noexcept nogil:
+    """the last branch of _airy_Bi for n points all at least 4 if far, else all in (2, 4)"""
+    cdef:
+        double z[BLOCK]
+        double r[BLOCK]
+        double r_err[BLOCK]
+        double sqx, y, zx, s, v, e
+        Py_ssize_t j
+
+    if far:
+        for j in range(n):
+            z[j] = 16. / (x[j] * cm.sqrt(x[j])) - 1
+        cheb_eval_block_mode(bip2, z, n, -1, 1, r, r_err)
+    else:
+        for j in range(n):
+            z[j] = 8.7506905708484345 / (x[j] * cm.sqrt(x[j])) - 2.0938363213560543
+        cheb_eval_block_mode(bip, z, n, -1, 1, r, r_err)
+
+    for j in range(n):
+        zx = 2. / 3 * cm.pow(x[j], 1.5)
+        if zx > m.LOG_DBL_MAX - 1 or zx != zx:
+            val[j] = cm.NAN
+            if err != NULL:
+                err[j] = cm.NAN
+            continue
+
+        sqx = cm.sqrt(x[j])
+        y = cm.sqrt(sqx)
+        s = cm.exp(zx)
+        v = (0.625 + r[j]) / y
+        e = r_err[j] / y + m.DBL_EPSILON * cm.fabs(v)
+        v = v * s
+        e = e * s + cm.fabs(1.5 * zx * m.DBL_EPSILON * v)
+
+        val[j] = v
+        if err != NULL:
+            err[j] = e + m.DBL_EPSILON * cm.fabs(v)
+
+
+cdef void airy_Bi_growth(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Bi_growth_block(x, n, False, val, err)
+
+
+cdef void airy_Bi_growth_2(const double* x, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    airy_Bi_growth_block(x, n, True, val, err)
+
+
+airy_Bi_scaled = ufunc_d_d(_airy_Bi_scaled, 'airy_Bi_scaled',
+                           "Scaled Airy function of the second kind, exp(-2/3 x^1.5) Bi(x) for x > 0")
+airy_Bi_scaled_e = ufunc_d_dd(_airy_Bi_scaled, 'airy_Bi_scaled_e',
+                              "Scaled Airy function of the second kind, exp(-2/3 x^1.5) Bi(x) for x > 0, "
+                              "and its absolute error")
+
+cpdef double airy_Bi_scaled_scalar(double x, double rtol=0) except? -1:
+    """Scaled Airy function of the second kind, exp(-2/3 x^1.5) Bi(x) for x > 0, of a single value"""
+    return eval_scalar(_airy_Bi_scaled, x, rtol)
+
+
+cdef Result _airy_Bi_scaled(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result mod, theta, res_sin
-        double s, z
+        double s
 
     if x < -1:
         mod, theta = airy_mod_phase(x)
         res_sin = sin_err(theta.val, theta.err)
         res.val = mod.val * res_sin.val
         res.err = cm.fabs(mod.val * res_sin.err) + cm.fabs(res_sin.val * mod.err) + m.DBL_EPSILON * cm.fabs(res.val)
-    elif x < 1:
-        z = x ** 3
-        mod = cheb_eval_mode(bif, z, -1, 1)
-        theta = cheb_eval_mode(big, z, -1, 1)
-        res.val = 0.625 + mod.val + x * (0.4375 + theta.val)
-        res.err = mod.err + cm.fabs(x * theta.err) + m.DBL_EPSILON * cm.fabs(res.val)
+    elif x <= 2:
+        res = airy_bi_series(x)
+        res.err += m.DBL_EPSILON * cm.fabs(res.val)
 
         if x > 0:
-            s = cm.exp(-2./3 * cm.sqrt(z))
+            s = cm.exp(-2. / 3 * x ** 1.5)
             res.val *= s
             res.err *= s
-
-    elif x <= 2:
-        z = x ** 3
-        s = cm.exp(-2./3 * cm.sqrt(z))
-        z = (2. * z - 9) / 7
-
-        mod = cheb_eval_mode(bif2, z, -1, 1)
-        theta = cheb_eval_mode(big2, z, -1, 1)
-
-        res.val = s * (1.125 + mod.val + x * (0.625 + theta.val))
-        res.err = s * (mod.err + cm.fabs(x * theta.err)) + m.DBL_EPSILON * cm.fabs(res.val)
     else:
         res = airy_bie(x)
 
@@ -0,0 +1,157 @@
+from libc cimport math as cm
+
+from scify cimport _machine as m
+from ._results cimport Result, make_r, make_r_nan, ufunc_d_m
+from .airy cimport airy_aie, airy_ai_series, airy_bie, airy_bi_series, airy_mod_phase
+from .airy_deriv cimport (airy_ai_deriv_asymp, airy_ai_deriv_series, airy_bi_deriv_asymp, airy_bi_deriv_series,
+                          airy_deriv_mod_phase)
+from .trig cimport sincos_err
+
+# Output slots of the fused kernel. The mask selects which of them are computed
+cdef enum:
+    AI = 1
+    AI_DERIV = 2
+    BI = 4
+    BI_DERIV = 8
+
+ALL = AI | AI_DERIV | BI | BI_DERIV
+
+
+cdef inline Result wkb(Result mod, Result trig) noexcept nogil:
+    cdef double val = mod.val * trig.val
+    return make_r(val, cm.fabs(mod.val * trig.err) + cm.fabs(trig.val * mod.err) + m.DBL_EPSILON * cm.fabs(val))
+
+
+cdef inline Result wkb_deriv(Result amp, Result phase, double trig) noexcept nogil:
+    cdef double val = amp.val * trig
+    return make_r(val, cm.fabs(amp.val * phase.err) + cm.fabs(trig * amp.err) + m.DBL_EPSILON * cm.fabs(val))
+
+
+cdef void airy_oscillatory(double x, int mask, Result* res) noexcept nogil:
+    """x < -1. Ai and Bi share the modulus and phase, as do Ai' and Bi'"""
+    cdef:
+        Result mod, theta, s, c
+
+    if mask & (AI | BI):
+        mod, theta = airy_mod_phase(x)
+        sincos_err(theta.val, theta.err, &s, &c)
+        res[0] = wkb(mod, c)
+        res[2] = wkb(mod, s)
+
+    if mask & (AI_DERIV | BI_DERIV):
+        mod, theta = airy_deriv_mod_phase(x)
+        res[1] = wkb_deriv(mod, theta, cm.cos(theta.val))
+        res[3] = wkb_deriv(mod, theta, cm.sin(theta.val))
+
+
+cdef void airy_all_mask(double x, int mask, bint scaled, Result* res) noexcept nogil:
+    cdef:
+        Result r
+        double z = 0, e = 1
+
+    if x < -1:
+        airy_oscillatory(x, mask, res)
+        return
+
+    # Ai and Ai' come out of their series unscaled for x <= 1 and scaled beyond, Bi and Bi' for x < 2. Both are
+    # brought to the requested form with a single exponential
+    if x > 0:
+        z = 2. / 3 * cm.pow(x, 1.5)
+        e = cm.exp(z)
+
+    if mask & AI:
+        if x <= 1:
+            r = airy_ai_series(x)
+            r.err += m.DBL_EPSILON * cm.fabs(r.val)
+        else:
+            r = airy_aie(x)
+
+        if scaled and x > 0 and x <= 1:
+            r.val *= e
+            r.err *= e
+        elif not scaled and x > 1:
+            r.val /= e
+            r.err = r.err / e + cm.fabs(r.val) * (1.5 * z + 1) * m.DBL_EPSILON
+            if cm.fabs(r.val) < m.DBL_MIN:
+                r = make_r_nan()
+        res[0] = r
+
+    if mask & AI_DERIV:
+        r = airy_ai_deriv_series(x) if x <= 1 else airy_ai_deriv_asymp(x)
+
+        if scaled and x > 0 and x <= 1:
+            r.val *= e
+            r.err *= e
+        elif not scaled and x > 1:
+            r.err = (r.err + cm.fabs(r.val * 1.5 * z * m.DBL_EPSILON)) / e
+            r.val /= e
+            r.err += 2 * m.DBL_EPSILON * cm.fabs(r.val)
+            if z >= -m.LOG_DBL_MIN or cm.fabs(r.val) < m.DBL_MIN:
+                r = make_r_nan()
+        res[1] = r
+
+    if mask & BI:
+        if x <= 2:
+            r = airy_bi_series(x)
+            r.err += m.DBL_EPSILON * cm.fabs(r.val)
+        else:
+            r = airy_bie(x)
+
+        if scaled and x > 0 and x <= 2:
+            r.val /= e
+            r.err /= e
+        elif not scaled and x > 2:
+            r.val *= e
+            r.err = r.err * e + cm.fabs(r.val) * (1.5 * z + 1) * m.DBL_EPSILON
+            if z > m.LOG_DBL_MAX - 1:
+                r = make_r_nan()
+        res[2] = r
+
+    if mask & BI_DERIV:
+        r = airy_bi_deriv_series(x) if x < 2 else airy_bi_deriv_asymp(x)
+
+        if scaled and x > 0 and x < 2:
+            r.val /= e
+            r.err /= e
+        elif not scaled and x >= 2:
+            r.err = (r.err + cm.fabs(r.val * 1.5 * z * m.DBL_EPSILON)) * e
+            r.val *= e
+            r.err += 2 * m.DBL_EPSILON * cm.fabs(r.val)
+            if cm.fabs(r.val) > m.DBL_MAX:
+                r = make_r_nan()
+        res[3] = r
+
+
+cdef void _airy_all(double x, int mask, Result* res) noexcept nogil:
+    airy_all_mask(x, mask, False, res)
+
+
+cdef void _airy_all_scaled(double x, int mask, Result* res) noexcept nogil:
+    airy_all_mask(x, mask, True, res)
+
+
+cdef dict _fused = {}
+
+
+def airy_all_ufunc(int mask=ALL, bint scaled=False, bint with_error=False):
+    """
+    Returns the fused Airy ufunc computing the functions selected by the bits of mask (Ai, Ai', Bi, Bi' from
+    the lowest bit) in a single pass. Its outputs are the selected values in that order, followed by their errors
+    if with_error is True. The ufuncs are created once and cached.
+    """
+    key = mask, scaled, with_error
+    if key not in _fused:
+        name = 'airy_all' + ('_scaled' if scaled else '') + ('_e' if with_error else '')
+        doc = ("Ai(x), Ai'(x), Bi(x) and Bi'(x) in a single pass, " +
+               ("scaled as the airy_*_scaled functions, " if scaled else "") +
+               f"for the outputs selected by mask {mask}" +
+               (", followed by their absolute errors" if with_error else ""))
+        _fused[key] = ufunc_d_m(_airy_all_scaled if scaled else _airy_all, mask, with_error, name, doc)
+
+    return _fused[key]
+
+
+airy_all = airy_all_ufunc(ALL)
+airy_all_e = airy_all_ufunc(ALL, with_error=True)
+airy_all_scaled = airy_all_ufunc(ALL, True)
+airy_all_scaled_e = airy_all_ufunc(ALL, True, True)
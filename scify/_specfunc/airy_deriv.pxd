@@ -0,0 +1,12 @@
+from ._results cimport Result
+
+cdef:
+    (Result, Result) airy_deriv_mod_phase(double) noexcept nogil
+    Result airy_ai_deriv_series(double) noexcept nogil
+    Result airy_ai_deriv_asymp(double) noexcept nogil
+    Result airy_bi_deriv_series(double) noexcept nogil
+    Result airy_bi_deriv_asymp(double) noexcept nogil
+    Result _airy_Ai_deriv(double) noexcept nogil
+    Result _airy_Bi_deriv(double) noexcept nogil
+    Result _airy_Ai_deriv_scaled(double) noexcept nogil
+    Result _airy_Bi_deriv_scaled(double) noexcept nogil
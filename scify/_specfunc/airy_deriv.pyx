@@ -1,16 +1,13 @@
-import numpy as np
-
 from libc cimport math as cm
-cimport numpy as cnp
 
 from scify cimport _machine as m
-from ._results cimport Result, make_r, make_r_nan, map_dbl_p, map_dbl_s
-from .cheb cimport cheb_eval_mode
+from ._results cimport Result, eval_scalar, make_r, make_r_nan, ufunc_d_d, ufunc_d_dd
+from .cheb cimport ChebSeries, cheb_eval_mode
 from .exp cimport exp_mult_err
 
 
 cdef:
-    double[::1] aif = np.array([
+    double[8] AIF = [
         0.10527461226531408809,
         0.01183613628152997844,
         0.00012328104173225664,
@@ -19,8 +16,9 @@ cdef:
         0.00000000000363328873,
         0.00000000000000504622,
         0.00000000000000000522
-    ])
-    double[::1] aig = np.array([
+    ]
+    ChebSeries aif = ChebSeries(&AIF[0], sizeof(AIF) // sizeof(double))
+    double[9] AIG = [
         0.021233878150918666852,
         0.086315930335214406752,
         0.001797594720383231358,
@@ -30,8 +28,9 @@ cdef:
         0.000000000000264587660,
         0.000000000000000331562,
         0.000000000000000000314
-    ])
-    double[::1] aip1 = np.array([
+    ]
+    ChebSeries aig = ChebSeries(&AIG[0], sizeof(AIG) // sizeof(double))
+    double[25] AIP1 = [
         0.0358865097808301538,
         0.0114668575627764899,
         -0.0007592073583861400,
@@ -57,8 +56,9 @@ cdef:
         -0.0000000000000002688,
         0.0000000000000000832,
         -0.0000000000000000260
-    ])
-    double[::1] aip2 = np.array([
+    ]
+    ChebSeries aip1 = ChebSeries(&AIP1[0], sizeof(AIP1) // sizeof(double))
+    double[15] AIP2 = [
         0.0065457691989713757,
         0.0023833724120774592,
        -0.0000430700770220586,
@@ -74,8 +74,9 @@ cdef:
        -0.0000000000000009620,
         0.0000000000000001403,
        -0.0000000000000000215
-    ])
-    double[::1] bif = np.array([
+    ]
+    ChebSeries aip2 = ChebSeries(&AIP2[0], sizeof(AIP2) // sizeof(double))
+    double[8] BIF = [
         0.1153536790828570243,
         0.0205007894049192875,
         0.0002135290278902876,
@@ -84,8 +85,9 @@ cdef:
         0.0000000000062930407,
         0.0000000000000087403,
         0.0000000000000000090
-    ])
-    double[::1] big = np.array([
+    ]
+    ChebSeries bif = ChebSeries(&BIF[0], sizeof(BIF) // sizeof(double))
+    double[9] BIG = [
         -0.097196440416443537390,
         0.149503576843167066571,
         0.003113525387121326042,
@@ -95,8 +97,9 @@ cdef:
         0.000000000000458279271,
         0.000000000000000574283,
         0.000000000000000000544
-    ])
-    double[::1] bif2 = np.array([
+    ]
+    ChebSeries big = ChebSeries(&BIG[0], sizeof(BIG) // sizeof(double))
+    double[10] BIF2 = [
         0.323493987603522033521,
         0.086297871535563559139,
         0.002994025552655397426,
@@ -107,8 +110,9 @@ cdef:
         0.000000000000061663520,
         0.000000000000000171911,
         0.000000000000000000382
-    ])
-    double[::1] big2 = np.array([
+    ]
+    ChebSeries bif2 = ChebSeries(&BIF2[0], sizeof(BIF2) // sizeof(double))
+    double[10] BIG2 = [
         1.6062999463621294578,
         0.7449088819876088652,
         0.0470138738610277380,
@@ -119,8 +123,9 @@ cdef:
         0.0000000000039547918,
         0.0000000000000130017,
         0.0000000000000000335
-    ])
-    double[::1] bip1 = np.array([
+    ]
+    ChebSeries big2 = ChebSeries(&BIG2[0], sizeof(BIG2) // sizeof(double))
+    double[24] BIP1 = [
         -0.1729187351079553719,
         -0.0149358492984694364,
         -0.0005471104951678566,
@@ -145,8 +150,9 @@ cdef:
         -0.0000000000000004977,
         0.0000000000000001155,
         -0.0000000000000000186
-    ])
-    double[::1] bip2 = np.array([
+    ]
+    ChebSeries bip1 = ChebSeries(&BIP1[0], sizeof(BIP1) // sizeof(double))
+    double[29] BIP2 = [
         -0.13269705443526630495,
         -0.00568443626045977481,
         -0.00015643601119611610,
@@ -176,8 +182,9 @@ cdef:
         -0.00000000000000022369,
          0.00000000000000017487,
          0.00000000000000000207
-    ])
-    double[::1] an20 = np.array([
+    ]
+    ChebSeries bip2 = ChebSeries(&BIP2[0], sizeof(BIP2) // sizeof(double))
+    double[16] AN20 = [
         0.0126732217145738027,
        -0.0005212847072615621,
        -0.0000052672111140370,
@@ -194,8 +201,9 @@ cdef:
        -0.0000000000000006278,
        -0.0000000000000001621,
        -0.0000000000000000441
-    ])
-    double[::1] an21 = np.array([
+    ]
+    ChebSeries an20 = ChebSeries(&AN20[0], sizeof(AN20) // sizeof(double))
+    double[24] AN21 = [
         0.0198313155263169394,
        -0.0029376249067087533,
        -0.0001136260695958196,
@@ -220,8 +228,9 @@ cdef:
        -0.0000000000000002908,
        -0.0000000000000000993,
        -0.0000000000000000343
-    ])
-    double[::1] an22 = np.array([
+    ]
+    ChebSeries an21 = ChebSeries(&AN21[0], sizeof(AN21) // sizeof(double))
+    double[33] AN22 = [
         0.0537418629629794329,
         -0.0126661435859883193,
         -0.0011924334106593007,
@@ -255,8 +264,9 @@ cdef:
         -0.0000000000000001917,
         -0.0000000000000000794,
         -0.0000000000000000330
-    ])
-    double[::1] aph0 = np.array([
+    ]
+    ChebSeries an22 = ChebSeries(&AN22[0], sizeof(AN22) // sizeof(double))
+    double[15] APH0 = [
         -0.0855849241130933257,
         0.0011214378867065261,
         0.0000042721029353664,
@@ -272,8 +282,9 @@ cdef:
         0.0000000000000004024,
         0.0000000000000000930,
         0.0000000000000000229
-    ])
-    double[::1] aph1 = np.array([
+    ]
+    ChebSeries aph0 = ChebSeries(&APH0[0], sizeof(APH0) // sizeof(double))
+    double[22] APH1 = [
         -0.1024172908077571694,
         0.0071697275146591248,
         0.0001209959363122329,
@@ -296,8 +307,9 @@ cdef:
         0.0000000000000005950,
         0.0000000000000001934,
         0.0000000000000000638
-    ])
-    double[::1] aph2 = np.array([
+    ]
+    ChebSeries aph1 = ChebSeries(&APH1[0], sizeof(APH1) // sizeof(double))
+    double[32] APH2 = [
         -0.2057088719781465107,
         0.0422196961357771922,
         0.0020482560511207275,
@@ -330,10 +342,11 @@ cdef:
         0.0000000000000001769,
         0.0000000000000000719,
         0.0000000000000000294
-    ])
+    ]
+    ChebSeries aph2 = ChebSeries(&APH2[0], sizeof(APH2) // sizeof(double))
 
 
-cdef (Result, Result) airy_deriv_mod_phase(double x) nogil:
+cdef (Result, Result) airy_deriv_mod_phase(double x) noexcept nogil:
     cdef:
         double pi34 = 2.356194490192344928847  # 0.75pi
         double z = 0, a, p
@@ -358,32 +371,89 @@ cdef (Result, Result) airy_deriv_mod_phase(double x) nogil:
 
     a = amp.val + 0.3125
     p = phi.val - 0.625
+    a = cm.sqrt(a * sqx)
+    p = pi34 - x * sqx * p
 
+    # as in airy_mod_phase, the errors of the series are carried through the square root and the scaling of the phase
     return (
-        make_r(cm.sqrt(a * sqx),
-               cm.fabs(amp.val) * (m.DBL_EPSILON + cm.fabs(amp.err / amp.val))),
-        make_r(pi34 - x* sqx * p,
-               cm.fabs(phi.val) * (m.DBL_EPSILON + cm.fabs(phi.err / phi.val)))
+        make_r(a, a * (m.DBL_EPSILON + cm.fabs(amp.err / (2 * (amp.val + 0.3125))))),
+        make_r(p, cm.fabs(p) * m.DBL_EPSILON + cm.fabs(x * sqx * phi.err))
     )
 
 
-def airy_Ai_deriv(x, bint threaded):
-    x = np.asarray(x, float)
+cdef Result airy_ai_deriv_series(double x) noexcept nogil:
+    """derivative of the airy function of the first kind for |x| <= 1"""
+    cdef:
+        double x3 = x ** 3
+        Result a = cheb_eval_mode(aif, x3, -1, 1)
+        Result p = cheb_eval_mode(aig, x3, -1, 1)
+        double val = x * x * (0.125 + a.val) - p.val - 0.25
+
+    return make_r(val, cm.fabs(x * x * a.err) + p.err + m.DBL_EPSILON * cm.fabs(val))
+
+
+cdef Result airy_ai_deriv_asymp(double x) noexcept nogil:
+    """scaled derivative of the airy function of the first kind for x > 1"""
     cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+        double sqx = cm.sqrt(x)
+        double s = cm.sqrt(sqx)
+        double val
+        Result a
 
-    if n == 1:
-        return _airy_Ai_deriv(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Ai_deriv, arr, n)
+    if x <= 4:
+        a = cheb_eval_mode(aip1, (16. / (x * sqx) - 9) / 7, -1, 1)
     else:
-        map_dbl_s(_airy_Ai_deriv, arr, n)
+        a = cheb_eval_mode(aip2, 16 / (x * sqx) -1, -1, 1)
 
-    return arr.reshape(x.shape)
+    val = -(0.28125 + a.val) * s
+    return make_r(val, a.err * s + m.DBL_EPSILON * cm.fabs(val))
 
 
-cdef Result _airy_Ai_deriv(double x) nogil:
+cdef Result airy_bi_deriv_series(double x) noexcept nogil:
+    """derivative of the airy function of the second kind for -1 <= x < 2"""
+    cdef:
+        double x3 = x ** 3
+        double val
+        Result a, p
+
+    if x < 1:
+        a = cheb_eval_mode(bif, x3, -1, 1)
+        p = cheb_eval_mode(big, x3, -1, 1)
+    else:
+        a = cheb_eval_mode(bif2, (2 * x3 - 9.) / 7, -1, 1)
+        p = cheb_eval_mode(big2, (2 * x3 - 9.) / 7, -1, 1)
+
+    val = x * x * (0.25 + a.val) + p.val + 0.5
+    return make_r(val, x * x * a.err + p.err + m.DBL_EPSILON * cm.fabs(val))
+
+
+cdef Result airy_bi_deriv_asymp(double x) noexcept nogil:
+    """scaled derivative of the airy function of the second kind for x >= 2"""
+    cdef:
+        double sqx = cm.sqrt(x)
+        double s = cm.sqrt(sqx)
+        double val
+        Result a
+
+    if x < 4:
+        a = cheb_eval_mode(bip1, 8.7506905708484345 / (x * sqx) - 2.0938363213560543, -1, 1)
+    else:
+        a = cheb_eval_mode(bip2, 16 / (x * sqx) -1, -1, 1)
+
+    val = s * (0.625 + a.val)
+    return make_r(val, s * a.err + m.DBL_EPSILON * cm.fabs(val))
+
+
+airy_Ai_deriv = ufunc_d_d(_airy_Ai_deriv, 'airy_Ai_deriv', "Derivative of the Airy function of the first kind, Ai'(x)")
+airy_Ai_deriv_e = ufunc_d_dd(_airy_Ai_deriv, 'airy_Ai_deriv_e',
+                             "Derivative of the Airy function of the first kind, Ai'(x), and its absolute error")
+
+cpdef double airy_Ai_deriv_scalar(double x, double rtol=0) except? -1:
+    """Derivative of the Airy function of the first kind, Ai'(x), of a single value"""
+    return eval_scalar(_airy_Ai_deriv, x, rtol)
+
+
+cdef Result _airy_Ai_deriv(double x) noexcept nogil:
     cdef:
         Result a, p
         double c, val, err
@@ -393,17 +463,12 @@ cdef Result _airy_Ai_deriv(double x) nogil:
         a, p = airy_deriv_mod_phase(x)
         c = cm.cos(p.val)
         val = a.val * c
-        err = cm.fabs(val * p.err) + cm.fabs(c * a.err) + m.DBL_EPSILON * cm.fabs(val)
+        err = cm.fabs(a.val * p.err) + cm.fabs(c * a.err) + m.DBL_EPSILON * cm.fabs(val)
 
         return make_r(val, err)
 
     elif x < 1:
-        a = cheb_eval_mode(aif, x3, -1, 1)
-        p = cheb_eval_mode(aig, x3, -1, 1)
-        val = x * x * (0.125 + a.val) - p.val - 0.25
-        err = cm.fabs(x * x * a.err) + p.err + m.DBL_EPSILON * cm.fabs(val)
-
-        return make_r(val, err)
+        return airy_ai_deriv_series(x)
 
     elif x3 < 2.25 * m.LOG_DBL_MIN ** 2:
         c = -2. * cm.sqrt(x3) / 3
@@ -414,105 +479,64 @@ cdef Result _airy_Ai_deriv(double x) nogil:
         return make_r_nan()
 
 
-def airy_Ai_deriv_scaled(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
-
-    if n == 1:
-        return _airy_Ai_deriv_scaled(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Ai_deriv_scaled, arr, n)
-    else:
-        map_dbl_s(_airy_Ai_deriv_scaled, arr, n)
+airy_Ai_deriv_scaled = ufunc_d_d(_airy_Ai_deriv_scaled, 'airy_Ai_deriv_scaled',
+                                 "Scaled derivative of Ai, exp(2/3 x^1.5) Ai'(x) for x > 0")
+airy_Ai_deriv_scaled_e = ufunc_d_dd(_airy_Ai_deriv_scaled, 'airy_Ai_deriv_scaled_e',
+                                    "Scaled derivative of Ai, exp(2/3 x^1.5) Ai'(x) for x > 0, and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double airy_Ai_deriv_scaled_scalar(double x, double rtol=0) except? -1:
+    """Scaled derivative of Ai, exp(2/3 x^1.5) Ai'(x) for x > 0, of a single value"""
+    return eval_scalar(_airy_Ai_deriv_scaled, x, rtol)
 
 
-cdef Result _airy_Ai_deriv_scaled(double x) nogil:
+cdef Result _airy_Ai_deriv_scaled(double x) noexcept nogil:
     cdef:
         Result a, p
         double c, val, err, s
-        double sqx = cm.sqrt(x)
-        double x3 = x ** 3
 
     if x < -1:
         a, p = airy_deriv_mod_phase(x)
         c = cm.cos(p.val)
         val = a.val * c
-        err = cm.fabs(val * p.err) + cm.fabs(c * a.err) + m.DBL_EPSILON * cm.fabs(val)
+        err = cm.fabs(a.val * p.err) + cm.fabs(c * a.err) + m.DBL_EPSILON * cm.fabs(val)
         return make_r(val, err)
 
     elif x <= 1:
-        a = cheb_eval_mode(aif, x3, -1, 1)
-        p = cheb_eval_mode(aig, x3, -1, 1)
-        val = x * x * (0.125 + a.val) - p.val - 0.25
-        err = cm.fabs(x * x * a.val) + p.err + m.DBL_EPSILON * cm.fabs(val)
+        a = airy_ai_deriv_series(x)
 
         if x > m.ROOT3_DBL_EPSILON ** 2:
             s = cm.exp(2. / 3 * x ** 1.5)
-            val *= s
-            err *= s
-
-        return make_r(val, err)
-
-    elif x <= 4:
-        a = cheb_eval_mode(aip1, (16. / (x * sqx) - 9) / 7, -1, 1)
-    else:
-        a = cheb_eval_mode(aip2, 16 / (x * sqx) -1, -1, 1)
+            a.val *= s
+            a.err *= s
 
-    s = cm.sqrt(sqx)
-    val = -(0.28125 + a.val) * s
-    err = a.err * s + m.DBL_EPSILON * cm.fabs(val)
-    return make_r(val, err)
+        return a
 
+    return airy_ai_deriv_asymp(x)
 
-def airy_Bi_deriv(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
 
-    if n == 1:
-        return _airy_Bi_deriv(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Bi_deriv, arr, n)
-    else:
-        map_dbl_s(_airy_Bi_deriv, arr, n)
+airy_Bi_deriv = ufunc_d_d(_airy_Bi_deriv, 'airy_Bi_deriv', "Derivative of the Airy function of the second kind, Bi'(x)")
+airy_Bi_deriv_e = ufunc_d_dd(_airy_Bi_deriv, 'airy_Bi_deriv_e',
+                             "Derivative of the Airy function of the second kind, Bi'(x), and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double airy_Bi_deriv_scalar(double x, double rtol=0) except? -1:
+    """Derivative of the Airy function of the second kind, Bi'(x), of a single value"""
+    return eval_scalar(_airy_Bi_deriv, x, rtol)
 
 
-cdef Result _airy_Bi_deriv(double x) nogil:
+cdef Result _airy_Bi_deriv(double x) noexcept nogil:
     cdef:
         Result a, p
-        double c, val, err, s, z
-        double x3 = x ** 3
+        double val, err, s, z
 
     if x < -1:
         a, p = airy_deriv_mod_phase(x)
         s = cm.sin(p.val)
         val = a.val * s
-        err = cm.fabs(val * p.err) + cm.fabs(s * a.err) + m.DBL_EPSILON * cm.fabs(val)
-        return make_r(val, err)
-
-    elif x < 1:
-        a = cheb_eval_mode(bif, x3, -1, 1)
-        p = cheb_eval_mode(big, x3, -1, 1)
-        val = x * x * (0.25 + a.val) + p.val + 0.5
-        err = x * x * a.val + p.err + m.DBL_EPSILON * cm.fabs(val)
-
+        err = cm.fabs(a.val * p.err) + cm.fabs(s * a.err) + m.DBL_EPSILON * cm.fabs(val)
         return make_r(val, err)
 
     elif x < 2:
-        z = (2 * x3 - 9.) / 7
-        a = cheb_eval_mode(bif2, z, -1, 1)
-        p = cheb_eval_mode(big2, z, -1, 1)
-        val = x * x * (a.val + 0.25) + p.val + 0.5
-        err = x * x * a.err + p.err + m.DBL_EPSILON * cm.fabs(val)
-
-        return make_r(val, err)
+        return airy_bi_deriv_series(x)
 
     elif x < m.ROOT3_DBL_MAX ** 2:
         z = 2 * x * cm.sqrt(x) /3.
@@ -522,65 +546,37 @@ cdef Result _airy_Bi_deriv(double x) nogil:
         return make_r_nan()
 
 
-def airy_Bi_deriv_scaled(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+airy_Bi_deriv_scaled = ufunc_d_d(_airy_Bi_deriv_scaled, 'airy_Bi_deriv_scaled',
+                                 "Scaled derivative of Bi, exp(-2/3 x^1.5) Bi'(x) for x > 0")
+airy_Bi_deriv_scaled_e = ufunc_d_dd(_airy_Bi_deriv_scaled, 'airy_Bi_deriv_scaled_e',
+                                    "Scaled derivative of Bi, exp(-2/3 x^1.5) Bi'(x) for x > 0, "
+                                    "and its absolute error")
 
-    if n == 1:
-        return _airy_Bi_deriv_scaled(arr[0]).val
-    if threaded:
-        map_dbl_p(_airy_Bi_deriv_scaled, arr, n)
-    else:
-        map_dbl_s(_airy_Bi_deriv_scaled, arr, n)
-
-    return arr.reshape(x.shape)
+cpdef double airy_Bi_deriv_scaled_scalar(double x, double rtol=0) except? -1:
+    """Scaled derivative of Bi, exp(-2/3 x^1.5) Bi'(x) for x > 0, of a single value"""
+    return eval_scalar(_airy_Bi_deriv_scaled, x, rtol)
 
 
-cdef Result _airy_Bi_deriv_scaled(double x) nogil:
+cdef Result _airy_Bi_deriv_scaled(double x) noexcept nogil:
     cdef:
         Result a, p
-        double c, val, err, s
-        double sqx = cm.sqrt(x)
-        double x3 = x ** 3
+        double val, err, s
 
     if x < -1:
         a, p = airy_deriv_mod_phase(x)
         s = cm.sin(p.val)
         val = a.val * s
-        err = cm.fabs(val * p.err) + cm.fabs(s * a.err) + m.DBL_EPSILON * cm.fabs(val)
+        err = cm.fabs(a.val * p.err) + cm.fabs(s * a.err) + m.DBL_EPSILON * cm.fabs(val)
         return make_r(val, err)
 
-    elif x < 1:
-        a = cheb_eval_mode(bif, x3, -1, 1)
-        p = cheb_eval_mode(big, x3, -1, 1)
-        val = x * x * (0.25 + a.val) + p.val + 0.5
-        err = x * x * a.err + p.err + m.DBL_EPSILON * cm.fabs(val)
+    elif x < 2:
+        a = airy_bi_deriv_series(x)
 
         if x > m.ROOT3_DBL_EPSILON ** 2:
             s = cm.exp(-2. / 3 * x ** 1.5)
-            val *= s
-            err *= s
+            a.val *= s
+            a.err *= s
 
-        return make_r(val, err)
+        return a
 
-    elif x < 2:
-        c = (2 * x3 - 9.) / 7
-        s = cm.exp(-2. / 3 * x ** 1.5)
-        a = cheb_eval_mode(bif2, c, -1, 1)
-        p = cheb_eval_mode(big2, c, -1, 1)
-        val = s * (x * x * (0.25 + a.val) + 0.5 + p.val)
-        err = s * (x * x * a.err + p.err) + m.DBL_EPSILON * cm.fabs(val)
-
-        return make_r(val, err)
-
-    elif x < 4:
-        a = cheb_eval_mode(bip1, 8.7506905708484345 / (x * sqx) - 2.0938363213560543, -1, 1)
-    else:
-        a = cheb_eval_mode(bip2, 16 / (x * sqx) -1, -1, 1)
-
-    s = cm.sqrt(sqx)
-    val = s * (0.625 + a.val)
-    err = s * a.err + m.DBL_EPSILON * cm.fabs(val)
-    return make_r(val, err)
+    return airy_bi_deriv_asymp(x)
@@ -0,0 +1,7 @@
+from ._results cimport Result
+
+cdef:
+    Result _airy_zero_Ai(long long) noexcept nogil
+    Result _airy_zero_Bi(long long) noexcept nogil
+    Result _airy_zero_Ai_deriv(long long) noexcept nogil
+    Result _airy_zero_Bi_deriv(long long) noexcept nogil
@@ -1,16 +1,16 @@
 from cython.parallel import prange
-import numpy as np
 
 from libc cimport math as cm
-cimport numpy as cnp
 
 from scify cimport _machine as m
-from ._results cimport Result, make_r_nan
+from ._results cimport Fn1I, Fn1R, Result, make_r_nan, ufunc_l_d, ufunc_l_dd
+from .airy cimport _airy_Ai, _airy_Bi
+from .airy_deriv cimport _airy_Ai_deriv, _airy_Bi_deriv
 
 
 cdef:
     double DBL_EPS = m.DBL_EPSILON, PI = m.M_PI
-    double[::1] zero_ai =  np.array([
+    double[101] zero_ai = [
         0,
         -2.3381074104597670385,
         -4.087949444130970617,
@@ -112,8 +112,8 @@ cdef:
         -59.64473935594259360,
         -60.05083255860419805,
         -60.45555727411669871
-    ])
-    double[::1] zero_bi =  np.array([
+    ]
+    double[101] zero_bi = [
         0,
         -1.173713222709127925,
         -3.271093302836352716,
@@ -215,8 +215,8 @@ cdef:
         -59.44117374601743460,
         -59.84795817643466996,
         -60.25336482580837088
-    ])
-    double[::1] zero_aip = np.array([
+    ]
+    double[101] zero_aip = [
         0,
         -1.018792971647471089,
         -3.248197582179836738,
@@ -318,8 +318,8 @@ cdef:
         -59.44110298997521892,
         -59.84788837897058171,
         -60.25329596442479317
-    ])
-    double[::1] zero_bip = np.array([
+    ]
+    double[51] zero_bip = [
         0,
         -2.294439682614123247,
         -4.073155089071828216,
@@ -371,10 +371,10 @@ cdef:
         -36.99489118631672770,
         -37.50961740986809593,
         -38.02083574095788210
-    ])
+    ]
 
 
-cdef inline double zero_f(double z) nogil:
+cdef inline double zero_f(double z) noexcept nogil:
     cdef:
         double pre = z ** (2.0 / 3)
         double zi2 = 1 / (z * z)
@@ -385,7 +385,7 @@ cdef inline double zero_f(double z) nogil:
         double t4  = -108056875. / 6967296 * zi4 * zi4
     return pre * (1.0 + t1 + t2 + t3 + t4)
 
-cdef inline double zero_g(double z) nogil:
+cdef inline double zero_g(double z) noexcept nogil:
     cdef:
         double pre = z ** (2.0 / 3)
         double zi2 = 1.0 / (z * z)
@@ -398,132 +398,158 @@ cdef inline double zero_g(double z) nogil:
     return pre * (1.0 + t1 + t2 + t3 + t4)
 
 
-def airy_zero_Ai(x, bint threaded):
-    x = np.asarray(x, np.int64)
-    cdef:
-        cnp.ndarray[cnp.npy_int64, ndim=1] y = x.ravel()
-        int i, n = x.size
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = np.zeros(n)
-
-    if n == 1:
-        return _airy_zero_Ai(y[0]).val
-    if threaded:
-        for i in prange(n, nogil=True):
-            arr[i] = _airy_zero_Ai(y[i]).val
-    else:
-        for i in range(n):
-            arr[i] = _airy_zero_Ai(y[i]).val
+airy_zero_Ai = ufunc_l_d(_airy_zero_Ai, 'airy_zero_Ai', "Location of the s-th zero of the Airy function Ai(x)")
+airy_zero_Ai_e = ufunc_l_dd(_airy_zero_Ai, 'airy_zero_Ai_e',
+                            "Location of the s-th zero of the Airy function Ai(x), and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double airy_zero_Ai_scalar(long long s) noexcept:
+    """Location of the s-th zero of the Airy function Ai(x), of a single value"""
+    return _airy_zero_Ai(s).val
 
-cdef Result _airy_zero_Ai(int x) nogil:
+cdef Result _airy_zero_Ai(long long x) noexcept nogil:
     cdef:
         Result res = make_r_nan()
 
     if x < 1:
         return res
-    elif x < len(zero_ai):
+    elif x < sizeof(zero_ai) // sizeof(double):
         res.val = zero_ai[x]
         res.err = DBL_EPS * cm.fabs(res.val)
     else:
-        res.val = -zero_f(3 * PI / 8 * (4 * x - 1))
+        res.val = -zero_f(3 * PI / 8 * (4. * x - 1))
         res.err = 2 * DBL_EPS * cm.fabs(res.val)
     return res
 
 
-def airy_zero_Bi(x, bint threaded):
-    x = np.asarray(x, np.int64)
-    cdef:
-        cnp.ndarray[cnp.npy_int64, ndim=1] y = x.ravel()
-        int i, n = x.size
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = np.zeros(n)
-
-    if n == 1:
-        return _airy_zero_Bi(y[0]).val
-    if threaded:
-        for i in prange(n, nogil=True):
-            arr[i] = _airy_zero_Bi(y[i]).val
-    else:
-        for i in range(n):
-            arr[i] = _airy_zero_Bi(y[i]).val
+airy_zero_Bi = ufunc_l_d(_airy_zero_Bi, 'airy_zero_Bi', "Location of the s-th zero of the Airy function Bi(x)")
+airy_zero_Bi_e = ufunc_l_dd(_airy_zero_Bi, 'airy_zero_Bi_e',
+                            "Location of the s-th zero of the Airy function Bi(x), and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double airy_zero_Bi_scalar(long long s) noexcept:
+    """Location of the s-th zero of the Airy function Bi(x), of a single value"""
+    return _airy_zero_Bi(s).val
 
-cdef Result _airy_zero_Bi(int x) nogil:
+cdef Result _airy_zero_Bi(long long x) noexcept nogil:
     cdef:
         Result res = make_r_nan()
 
     if x < 1:
         return res
-    elif x < len(zero_bi):
+    elif x < sizeof(zero_bi) // sizeof(double):
         res.val = zero_bi[x]
         res.err = DBL_EPS * cm.fabs(res.val)
     else:
-        res.val = -zero_f(3 * PI / 8 * (4 * x - 3))
+        res.val = -zero_f(3 * PI / 8 * (4. * x - 3))
         res.err = 2 * DBL_EPS * cm.fabs(res.val)
     return res
 
 
-def airy_zero_Ai_deriv(x, bint threaded):
-    x = np.asarray(x, np.int64)
-    cdef:
-        cnp.ndarray[cnp.npy_int64, ndim=1] y = x.ravel()
-        int i, n = x.size
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = np.zeros(n)
-
-    if n == 1:
-        return _airy_zero_Ai_deriv(y[0]).val
-    if threaded:
-        for i in prange(n, nogil=True):
-            arr[i] = _airy_zero_Ai_deriv(y[i]).val
-    else:
-        for i in range(n):
-            arr[i] = _airy_zero_Ai_deriv(y[i]).val
-    return arr.reshape(x.shape)
+airy_zero_Ai_deriv = ufunc_l_d(_airy_zero_Ai_deriv, 'airy_zero_Ai_deriv',
+                               "Location of the s-th zero of the Airy function derivative Ai'(x)")
+airy_zero_Ai_deriv_e = ufunc_l_dd(_airy_zero_Ai_deriv, 'airy_zero_Ai_deriv_e',
+                                  "Location of the s-th zero of the Airy function derivative Ai'(x), "
+                                  "and its absolute error")
 
-cdef Result _airy_zero_Ai_deriv(int x) nogil:
+cpdef double airy_zero_Ai_deriv_scalar(long long s) noexcept:
+    """Location of the s-th zero of the Airy function derivative Ai'(x), of a single value"""
+    return _airy_zero_Ai_deriv(s).val
+
+cdef Result _airy_zero_Ai_deriv(long long x) noexcept nogil:
     cdef:
         Result res = make_r_nan()
 
     if x < 1:
         return res
-    elif x < len(zero_aip):
+    elif x < sizeof(zero_aip) // sizeof(double):
         res.val = zero_aip[x]
         res.err = DBL_EPS * cm.fabs(res.val)
     else:
-        res.val = -zero_g(3 * PI / 8 * (4 * x - 3))
+        res.val = -zero_g(3 * PI / 8 * (4. * x - 3))
         res.err = 2 * DBL_EPS * cm.fabs(res.val)
     return res
 
 
-def airy_zero_Bi_deriv(x, bint threaded):
-    x = np.asarray(x, np.int32)
-    cdef:
-        cnp.ndarray[cnp.npy_int32, ndim=1] y = x.ravel()
-        int i, n = x.size
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = np.zeros(n)
-
-    if n == 1:
-        return _airy_zero_Bi_deriv(y[0]).val
-    if threaded:
-        for i in prange(n, nogil=True):
-            arr[i] = _airy_zero_Bi_deriv(y[i]).val
-    else:
-        for i in range(n):
-            arr[i] = _airy_zero_Bi_deriv(y[i]).val
+airy_zero_Bi_deriv = ufunc_l_d(_airy_zero_Bi_deriv, 'airy_zero_Bi_deriv',
+                               "Location of the s-th zero of the Airy function derivative Bi'(x)")
+airy_zero_Bi_deriv_e = ufunc_l_dd(_airy_zero_Bi_deriv, 'airy_zero_Bi_deriv_e',
+                                  "Location of the s-th zero of the Airy function derivative Bi'(x), "
+                                  "and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double airy_zero_Bi_deriv_scalar(long long s) noexcept:
+    """Location of the s-th zero of the Airy function derivative Bi'(x), of a single value"""
+    return _airy_zero_Bi_deriv(s).val
 
-cdef Result _airy_zero_Bi_deriv(cnp.npy_int32 x) nogil:
+cdef Result _airy_zero_Bi_deriv(long long x) noexcept nogil:
     cdef:
         Result res = make_r_nan()
 
     if x < 1:
         return res
-    elif x < len(zero_bip):
+    elif x < sizeof(zero_bip) // sizeof(double):
         res.val = zero_bip[x]
         res.err = DBL_EPS * cm.fabs(res.val)
     else:
-        res.val = -zero_g(3 * PI / 8 * (4 * x - 1))
+        res.val = -zero_g(3 * PI / 8 * (4. * x - 1))
         res.err = 2 * DBL_EPS * cm.fabs(res.val)
     return res
+
+
+# Kinds of zeros filled by airy_zeros: of Ai, Bi, Ai' and Bi'
+cdef enum:
+    AI = 0
+    BI = 1
+    AI_DERIV = 2
+    BI_DERIV = 3
+
+cdef Fn1I[4] ZERO = [_airy_zero_Ai, _airy_zero_Bi, _airy_zero_Ai_deriv, _airy_zero_Bi_deriv]
+cdef Fn1R[4] FUNC = [_airy_Ai, _airy_Bi, _airy_Ai_deriv, _airy_Bi_deriv]
+# derivative of the functions at their zeros, or the functions at the zeros of their derivatives
+cdef Fn1R[4] OTHER = [_airy_Ai_deriv, _airy_Bi_deriv, _airy_Ai, _airy_Bi]
+
+
+cdef inline Py_ssize_t table_size(int kind) noexcept nogil:
+    if kind == AI:
+        return sizeof(zero_ai) // sizeof(double)
+    elif kind == BI:
+        return sizeof(zero_bi) // sizeof(double)
+    elif kind == AI_DERIV:
+        return sizeof(zero_aip) // sizeof(double)
+    return sizeof(zero_bip) // sizeof(double)
+
+
+cdef void polished_zero(int kind, long long s, double* zero, double* other) noexcept nogil:
+    """
+    s-th zero of the kind into zero and the other function there into other. Zeros beyond the tables come from the
+    asymptotic expansions and are polished by a Newton step, using Ai''(x) = x Ai(x) for the derivatives' zeros
+    """
+    cdef:
+        double x = ZERO[kind](s).val
+        double f, df
+        Result o = OTHER[kind](x)
+
+    if s >= table_size(kind):
+        f = FUNC[kind](x).val
+        df = o.val if kind < AI_DERIV else x * o.val
+        if df != 0:
+            x -= f / df
+            o = OTHER[kind](x)
+
+    zero[0] = x
+    other[0] = o.val
+
+
+def airy_zeros(int kind, long long start, double[::1] zeros not None, double[::1] other not None,
+               int num_threads=1):
+    """
+    Fills zeros with the consecutive zeros of the kind (0 to 3 for Ai, Bi, Ai' and Bi') from the start-th, and
+    other with the derivative of the function at each zero, or the function itself for the derivatives' zeros
+    """
+    cdef Py_ssize_t i
+
+    assert 0 <= kind <= BI_DERIV, "Unknown kind of zeros"
+    assert start >= 1, "Zeros are numbered from 1"
+    assert zeros.shape[0] == other.shape[0], "Output arrays must have the same length"
+    assert num_threads > 0, "Number of threads must be positive"
+
+    for i in prange(zeros.shape[0], nogil=True, num_threads=num_threads, schedule='static'):
+        polished_zero(kind, start + i, &zeros[i], &other[i])
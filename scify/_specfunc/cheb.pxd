@@ -1,5 +1,25 @@
 from ._results cimport Result
 
+# a Chebyshev series, whose n coefficients c are a static table of the module defining it, e.g.
+#     double[3] C = [...]
+#     ChebSeries c = ChebSeries(&C[0], sizeof(C) // sizeof(double))
+ctypedef struct ChebSeries:
+    const double* c
+    size_t n
+
+# points evaluated together by cheb_eval_block
+cdef enum:
+    CHEB_BLOCK = 64
+
 cdef:
-    Result cheb_eval(double[::1], double, int, int) nogil
-    Result cheb_eval_mode(double[::1], double, int, int) nogil
+    double set_cheb_tol(double) noexcept nogil
+    double get_rtol() noexcept nogil
+    double set_rtol(double) noexcept nogil
+    Result cheb_eval(ChebSeries, double, int, int) noexcept nogil
+    Result cheb_eval_tol(ChebSeries, double, int, int, double) noexcept nogil
+    Result cheb_eval_n(const double*, size_t, double, double, double) noexcept nogil
+    Result cheb_eval_mode(ChebSeries, double, int, int) noexcept nogil
+    void cheb_eval_block(ChebSeries, const double*, Py_ssize_t, int, int, double*, double*) noexcept nogil
+    void cheb_eval_block_tol(ChebSeries, const double*, Py_ssize_t, int, int, double, double*,
+                             double*) noexcept nogil
+    void cheb_eval_block_mode(ChebSeries, const double*, Py_ssize_t, int, int, double*, double*) noexcept nogil
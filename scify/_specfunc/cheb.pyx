@@ -1,16 +1,93 @@
 from libc cimport math as cm
 
 from scify cimport _machine as m
-from ._results cimport Result, make_r
+from ._results cimport Result  # types only, so that _results may cimport this module
 
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #define SCIFY_THREAD_LOCAL __declspec(thread)
+    #else
+    #define SCIFY_THREAD_LOCAL __thread
+    #endif
 
-cdef Result cheb_eval(double[::1] constants, double x, int a, int b) nogil:
+    /* Coefficients whose absolute sum is below this tolerance are dropped from the tail of the series. It is set
+       per thread by the inner loops, e.g. for single precision outputs, and is 0 (the full series) otherwise */
+    static SCIFY_THREAD_LOCAL double scify_cheb_tol = 0;
+
+    /* Relative error requested from the kernels which support a faster, less accurate mode, 0 for full accuracy.
+       Set per call by evaluate and per thread by the parallel loops */
+    static SCIFY_THREAD_LOCAL double scify_rtol = 0;
+    """
+    double scify_cheb_tol
+    double scify_rtol
+
+# Share of the requested relative error given to the truncation of the series, which are scaled to the size of the
+# functions they make up, as for the single precision loops
+cdef double CHEB_RTOL = 1e-3
+
+
+cdef double set_cheb_tol(double tol) noexcept nogil:
+    global scify_cheb_tol
+    cdef double prev = scify_cheb_tol
+    scify_cheb_tol = tol
+    return prev
+
+
+cdef double get_rtol() noexcept nogil:
+    return scify_rtol
+
+
+cdef double set_rtol(double rtol) noexcept nogil:
+    global scify_rtol
+    cdef double prev = scify_rtol
+    scify_rtol = rtol
+    return prev
+
+
+cdef inline double thread_tol() noexcept nogil:
+    # the thread's truncation tolerance, of the single precision loops or from the relative error requested
+    return cm.fmax(scify_cheb_tol, CHEB_RTOL * scify_rtol)
+
+
+cdef inline size_t truncate(ChebSeries series, double tol, double* tail) noexcept nogil:
+    # number of leading coefficients to evaluate given the tolerance, the dropped tail's sum in tail
+    cdef size_t n = series.n
+
+    tail[0] = 0
+    if tol > 0:
+        while n > 1 and tail[0] + cm.fabs(series.c[n - 1]) < tol:
+            n -= 1
+            tail[0] += cm.fabs(series.c[n])
+
+    return n
+
+
+cdef Result cheb_eval(ChebSeries series, double x, int a, int b) noexcept nogil:
+    return cheb_eval_tol(series, x, a, b, 0)
+
+
+cdef Result cheb_eval_tol(ChebSeries series, double x, int a, int b, double tol) noexcept nogil:
+    # evaluates the series with the trailing coefficients summing to less than tol, or the thread's tolerance if
+    # larger, dropped
+    cdef:
+        double tail
+        size_t n = truncate(series, cm.fmax(tol, thread_tol()), &tail)
+        Result res = cheb_eval_n(series.c, n, x, a, b)
+
+    res.err += tail
+    return res
+
+
+cdef Result cheb_eval_n(const double* constants, size_t n, double x, double a, double b) noexcept nogil:
+    # evaluates the series of the n coefficients over [a, b] at x, by Clenshaw's recurrence
     cdef:
         double d = 0, dd = 0, err = 0
         double y = (2. * x - a - b) / (b - a)
         double y2 = 2 * y
         double temp
-        size_t i, n = len(constants)
+        size_t i
+        Result res
 
     for i in range(n - 1, 0, -1):
         temp = d
@@ -22,21 +99,93 @@ cdef Result cheb_eval(double[::1] constants, double x, int a, int b) nogil:
     d = y * d - dd + 0.5 * constants[0]
     err += cm.fabs(y * temp) + cm.fabs(dd) + 0.5 * cm.fabs(constants[0])
 
-    return make_r(d, m.DBL_EPSILON * err + cm.fabs(constants[n - 1]))
+    res.val = d
+    res.err = m.DBL_EPSILON * err + cm.fabs(constants[n - 1])
+    return res
 
 
-cdef Result cheb_eval_mode(double[::1] constants, double x, int a, int b) nogil:
+cdef Result cheb_eval_mode(ChebSeries series, double x, int a, int b) noexcept nogil:
     cdef:
-        double d = 0, dd = 0
+        double d = 0, dd = 0, tail
         double y = (2 * x - a - b) / (b - a)
         double y2 = 2 * y
-        double val, err
-        size_t i, length = len(constants)
+        const double* constants = series.c
+        size_t i, n = truncate(series, thread_tol(), &tail)
+        Result res
 
-    for i in range(length - 1, 0, -1):
+    for i in range(n - 1, 0, -1):
         dd, d = d, y2 * d - dd + constants[i]
 
-    val = y * d - dd + 0.5 * constants[0]
-    err = m.DBL_EPSILON * cm.fabs(val) + length
+    res.val = y * d - dd + 0.5 * constants[0]
+    res.err = m.DBL_EPSILON * cm.fabs(res.val) + cm.fabs(constants[n - 1]) + tail
+    return res
+
+
+cdef void cheb_eval_block(ChebSeries series, const double* x, Py_ssize_t n, int a, int b, double* val,
+                          double* err) noexcept nogil:
+    cheb_eval_block_tol(series, x, n, a, b, 0, val, err)
+
+
+cdef void cheb_eval_block_tol(ChebSeries series, const double* x, Py_ssize_t n, int a, int b, double tol, double* val,
+                              double* err) noexcept nogil:
+    """
+    Evaluates the series at the n points of x as cheb_eval_tol does, into val and err, which is skipped if NULL.
+    The recurrence is run for CHEB_BLOCK points at a time with the points in the inner loops, so that they are
+    vectorized, and gives the same results as cheb_eval_tol
+    """
+    cdef:
+        double tail, c, temp
+        double y[CHEB_BLOCK]
+        double y2[CHEB_BLOCK]
+        double d[CHEB_BLOCK]
+        double dd[CHEB_BLOCK]
+        double e[CHEB_BLOCK]
+        const double* cs = series.c
+        size_t i, nc = truncate(series, cm.fmax(tol, thread_tol()), &tail)
+        Py_ssize_t j, k = 0, size
+
+    while k < n:
+        size = min(CHEB_BLOCK, n - k)
+        for j in range(size):
+            y[j] = (2. * x[k + j] - a - b) / (b - a)
+            y2[j] = 2 * y[j]
+            d[j] = 0
+            dd[j] = 0
+            e[j] = 0
+
+        for i in range(nc - 1, 0, -1):
+            c = cs[i]
+            if err != NULL:
+                for j in range(size):
+                    temp = d[j]
+                    d[j] = y2[j] * d[j] - dd[j] + c
+                    e[j] += cm.fabs(y2[j] * temp) + cm.fabs(dd[j]) + cm.fabs(c)
+                    dd[j] = temp
+            else:
+                for j in range(size):
+                    temp = d[j]
+                    d[j] = y2[j] * d[j] - dd[j] + c
+                    dd[j] = temp
+
+        c = cs[0]
+        for j in range(size):
+            val[k + j] = y[j] * d[j] - dd[j] + 0.5 * c
+        if err != NULL:
+            for j in range(size):
+                e[j] += cm.fabs(y[j] * d[j]) + cm.fabs(dd[j]) + 0.5 * cm.fabs(c)
+                err[k + j] = m.DBL_EPSILON * e[j] + cm.fabs(cs[nc - 1]) + tail
+        k += size
+
+
+cdef void cheb_eval_block_mode(ChebSeries series, const double* x, Py_ssize_t n, int a, int b, double* val,
+                               double* err) noexcept nogil:
+    # cheb_eval_mode over the n points of x, with its coarser error estimate
+    cdef:
+        double tail, last
+        Py_ssize_t j
 
-    return make_r(val, err)
+    cheb_eval_block(series, x, n, a, b, val, NULL)
+    if err != NULL:
+        last = cm.fabs(series.c[truncate(series, thread_tol(), &tail) - 1])
+        for j in range(n):
+            err[j] = m.DBL_EPSILON * cm.fabs(val[j]) + last + tail
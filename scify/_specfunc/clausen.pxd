@@ -1,4 +1,5 @@
 from ._results cimport Result
 
 cdef:
-    Result _clausen(double) nogil
+    Result _clausen(double) noexcept nogil
+    void _clausen_block(const double*, Py_ssize_t, double*, double*) noexcept nogil
\ No newline at end of file
@@ -1,16 +1,13 @@
-import numpy as np
-
 from libc cimport math as cm
-cimport numpy as cnp
 
 from scify cimport _machine as m
-from ._results cimport Result, make_r_0, map_dbl_p, map_dbl_s
-from .cheb cimport cheb_eval
+from ._results cimport BLOCK, Result, eval_scalar, make_r_0, ufunc_d_d_block, ufunc_d_dd_block
+from .cheb cimport ChebSeries, cheb_eval, cheb_eval_block
 from .trig cimport angle_restrict_pos_err
 
 
 cdef:
-    double[::1] constants = np.array([
+    double[15] CONSTANTS = [
         2.142694363766688447e+00,
         0.723324281221257925e-01,
         0.101642475021151164e-02,
@@ -26,26 +23,64 @@ cdef:
         0.1100e-15,
         0.68e-17,
         0.4e-18
-    ])
-
+    ]
+    ChebSeries constants = ChebSeries(&CONSTANTS[0], sizeof(CONSTANTS) // sizeof(double))
 
-def clausen(x, bint threaded=True):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
 
-    if n == 1:
-        return _clausen(arr[0]).val
-    if threaded and n > 1:
-        map_dbl_p(_clausen, arr, n)
-    else:
-        map_dbl_s(_clausen, arr, n)
+clausen = ufunc_d_d_block(_clausen_block, 'clausen', "Clausen function, Cl_2(x)")
+clausen_e = ufunc_d_dd_block(_clausen_block, 'clausen_e', "Clausen function, Cl_2(x), and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double clausen_scalar(double x, double rtol=0) except? -1:
+    """Clausen function, Cl_2(x), of a single value"""
+    return eval_scalar(_clausen, x, rtol)
 
 
-cdef Result _clausen(double x) nogil:
+cdef void _clausen_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    # the arguments are reduced to [0, pi], where the whole block shares the Chebyshev series
+    cdef:
+        double x_cut = m.M_PI * m.DBL_EPSILON
+        double r[BLOCK]
+        double y[BLOCK]
+        double sgn[BLOCK]
+        double s[BLOCK]
+        double s_err[BLOCK]
+        double x
+        Py_ssize_t j
+
+    for j in range(n):
+        x = xs[j]
+        sgn[j] = 1
+        if x < 0:
+            x = -x
+            sgn[j] = -1
+
+        x = angle_restrict_pos_err(x).val
+        if x > m.M_PI:
+            x = (6.28125 - x) + 1.9353071795864769253e-03
+            sgn[j] = -sgn[j]
+
+        r[j] = x
+        y[j] = 2 * (x * x / (m.M_PI ** 2) - 0.5)
+
+    cheb_eval_block(constants, y, n, -1, 1, s, s_err if err != NULL else NULL)
+
+    for j in range(n):
+        x = r[j]
+        if x == 0.0:
+            val[j] = 0
+            if err != NULL:
+                err[j] = 0
+        elif x < x_cut:
+            val[j] = sgn[j] * x * (1 - cm.log(x))
+            if err != NULL:
+                err[j] = x * m.DBL_EPSILON
+        else:
+            val[j] = sgn[j] * x * (s[j] - cm.log(x))
+            if err != NULL:
+                err[j] = x * (s_err[j] + m.DBL_EPSILON)
+
+
+cdef Result _clausen(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result sr
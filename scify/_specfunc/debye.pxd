@@ -0,0 +1,10 @@
+from ._results cimport Result
+
+cdef:
+    Result _debye_1(double) noexcept nogil
+    Result _debye_2(double) noexcept nogil
+    Result _debye_3(double) noexcept nogil
+    Result _debye_4(double) noexcept nogil
+    Result _debye_5(double) noexcept nogil
+    Result _debye_6(double) noexcept nogil
+    Result _debye_n(double, long long) noexcept nogil
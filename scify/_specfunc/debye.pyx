@@ -1,19 +1,33 @@
-import numpy as np
-
 from libc cimport math as cm
-cimport numpy as cnp
+from libc.limits cimport INT_MAX
 
 from scify cimport _machine as m
-from ._results cimport Result, make_r_0, make_r_nan, map_dbl_p, map_dbl_s
-from .cheb cimport cheb_eval
+from ._results cimport (BLOCK, MAX_FUSED, Fn1R, Result, eval_scalar, make_r_0, make_r_nan, ufunc_d_d_block,
+                        ufunc_d_dd_block, ufunc_d_m, ufunc_dl_d, ufunc_dl_dd)
+from .cheb cimport ChebSeries, cheb_eval_block_tol, cheb_eval_tol, get_rtol, set_rtol
+from .stats cimport DEBYE_1, DEBYE_N, SCIFY_STATS, hit, iterations
 
-ctypedef double (*DFunc) (double) nogil
+ctypedef double (*DFunc) (double) noexcept nogil
 
 
 cdef double X_CUT = -m.LOG_DBL_MIN
 
+# the orders computed by the fused kernel, one bit each from order 1
+ALL = 0b111111
+
+# lim x^n D_n(x) as x -> infinity, n n! zeta(n + 1), by order
+cdef double[7] VAL_INFINITY = [0, 1.64493406684822644, 4.80822761263837714, 19.4818182068004875, 99.5450644937635129,
+                               610.405837190669483828710757875, 4356.06887828990661194792541535]
+
+# D_n(4), the smallest value of D_n over the range of the Chebyshev series, by order
+cdef double[7] D_AT_4 = [1, 0.3881480212979378, 0.24055368752127904, 0.1817369138217746, 0.15185461258672017,
+                         0.13429474589592938, 0.12292785628145797]
+
+# n / (n + 1), the slope of the linear term D_n(x) = cheb(x^2 / 8 - 1) - n x / (n + 1) for x <= 4, by order
+cdef double[7] SLOPE = [0, 0.25, 1 / 3., 0.375, 0.4, 5 / 12., 3 / 7.]
+
 cdef:
-    double[::1] db1 = np.array([
+    double[17] DB1 = [
         2.4006597190381410194,
         0.1937213042189360089,
         -0.62329124554895770e-02,
@@ -31,8 +45,9 @@ cdef:
         -0.1376e-15,
         0.109e-16,
         -0.9e-18
-    ])
-    double[::1] db2 = np.array([
+    ]
+    ChebSeries db1 = ChebSeries(&DB1[0], sizeof(DB1) // sizeof(double))
+    double[18] DB2 = [
         2.5943810232570770282,
         0.2863357204530719834,
         -0.102062656158046713e-01,
@@ -51,8 +66,9 @@ cdef:
         0.211e-16,
         -0.17e-17,
         0.1e-18
-    ])
-    double[::1] db3 = np.array([
+    ]
+    ChebSeries db2 = ChebSeries(&DB2[0], sizeof(DB2) // sizeof(double))
+    double[17] DB3 = [
         2.707737068327440945,
         0.340068135211091751,
         -0.12945150184440869e-01,
@@ -70,8 +86,9 @@ cdef:
         -0.3820e-15,
         0.305e-16,
         -0.24e-17
-    ])
-    double[::1] db4 = np.array([
+    ]
+    ChebSeries db3 = ChebSeries(&DB3[0], sizeof(DB3) // sizeof(double))
+    double[17] DB4 = [
         2.781869415020523460,
         0.374976783526892863,
         -0.14940907399031583e-01,
@@ -89,8 +106,9 @@ cdef:
         -0.4911e-15,
         0.393e-16,
         -0.32e-17
-    ])
-    double[::1] db5 = np.array([
+    ]
+    ChebSeries db4 = ChebSeries(&DB4[0], sizeof(DB4) // sizeof(double))
+    double[17] DB5 = [
         2.8340269546834530149,
         0.3994098857106266445,
         -0.164566764773099646e-1,
@@ -108,8 +126,9 @@ cdef:
         -0.5925e-15,
         0.475e-16,
         -0.39e-17
-    ])
-    double[::1] db6 = np.array([
+    ]
+    ChebSeries db5 = ChebSeries(&DB5[0], sizeof(DB5) // sizeof(double))
+    double[17] DB6 = [
         2.8726727134130122113,
         0.4174375352339027746,
         -0.176453849354067873e-1,
@@ -127,33 +146,185 @@ cdef:
         -0.6872e-15,
         0.552e-16,
         -0.44e-17
-    ])
-
-
-def debye_1(x, bint threaded):
-    x = np.asarray(x, float)
+    ]
+    ChebSeries db6 = ChebSeries(&DB6[0], sizeof(DB6) // sizeof(double))
+    ChebSeries[7] DB = [db1, db1, db2, db3, db4, db5, db6]
+
+    # B_2k / (2k)!, the coefficients of the series t / (e^t - 1) = sum_k B_k t^k / k!
+    double[20] bernoulli = [
+        0.08333333333333333,
+        -0.001388888888888889,
+        3.306878306878307e-05,
+        -8.267195767195768e-07,
+        2.08767569878681e-08,
+        -5.284190138687493e-10,
+        1.3382536530684679e-11,
+        -3.3896802963225827e-13,
+        8.586062056277845e-15,
+        -2.174868698558062e-16,
+        5.5090028283602295e-18,
+        -1.3954464685812522e-19,
+        3.534707039629467e-21,
+        -8.953517427037546e-23,
+        2.267952452337683e-24,
+        -5.744790668872202e-26,
+        1.455172475614865e-27,
+        -3.6859949406653103e-29,
+        9.336734257095045e-31,
+        -2.36502241570063e-32
+    ]
+
+
+cdef void debye_sums(double x, int mask, double tol, Result* res) noexcept nogil:
+    """
+    D_n(x) = VAL_INFINITY[n] / x^n - n sum_i e^{-ix} P_n(1 / ix) / i for 4 < x < X_CUT and each order n whose bit
+    n - 1 is set in mask, into res[n - 1]. P_n(u) = sum_k n! / (n - k)! u^k = 1 + n u P_{n - 1}(u), so that the
+    exponentials and polynomials are shared by the orders. Each term is less than e^{-x} times the previous one,
+    so the sums stop once the bounds on their tails are below tol relative to the values, typically after a few
+    terms instead of the X_CUT / x terms of the full precision loops
+    """
     cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+        double ex = cm.exp(-x), e = 1, u, p, xn, term
+        double[7] total, bound
+        int i = 0, n, top = 0
+        bint done
+
+    for n in range(1, 7):
+        total[n] = 0
+        if mask & (1 << (n - 1)):
+            top = n
+
+    while True:
+        i += 1
+        e *= ex
+        u = 1 / (x * i)
+        p = 1
+        xn = 1
+        done = True
+        for n in range(1, top + 1):
+            p = 1 + n * u * p
+            xn *= x
+            if mask & (1 << (n - 1)):
+                term = e * p / i
+                total[n] += term
+                res[n - 1].val = VAL_INFINITY[n] / xn - n * total[n]
+                bound[n] = n * term * ex / (1 - ex)
+                done = done and bound[n] <= tol * res[n - 1].val
+        if done or e == 0:
+            break
+
+    xn = 1
+    for n in range(1, top + 1):
+        xn *= x
+        if mask & (1 << (n - 1)):
+            res[n - 1].err = 2 * m.DBL_EPSILON * (VAL_INFINITY[n] / xn + n * total[n]) + bound[n]
+
+
+cdef inline Result debye_sum(int n, double x, double rtol) noexcept nogil:
+    cdef Result res[MAX_FUSED]
+    debye_sums(x, 1 << (n - 1), 0.5 * rtol, res)
+    return res[n - 1]
+
+
+cdef inline void count_branch(int n, double x, double rtol) noexcept nogil:
+    # records the branch of _debye_n taken at x, and the terms summed by the exponential sums
+    cdef int branch
 
-    if n == 1:
-        return _debye_1(arr[0]).val
-    elif threaded:
-        map_dbl_p(_debye_1, arr, n)
+    if x < 0:
+        branch = 0
+    elif x < 2 * m.SQRT_DBL_EPSILON * (1 if n == 1 else m.M_SQRT2):
+        branch = 1
+    elif x <= 4:
+        branch = 2
+    elif rtol > 0 and x < X_CUT:
+        branch = 3
+    elif x <= -(m.M_LN2 + m.LOG_DBL_EPSILON):
+        branch = 4
+        iterations(DEBYE_1 + n - 1, <long long> cm.floor(X_CUT / x))
+    elif x < X_CUT:
+        branch = 5
     else:
-        map_dbl_s(_debye_1, arr, n)
+        branch = 6
+    hit(DEBYE_1 + n - 1, branch, 1)
 
-    return arr.reshape(x.shape)
 
+cdef inline Result debye_cheb(int n, double x, double c, double c_err) noexcept nogil:
+    # D_n(x) for x <= 4 from the value c of its Chebyshev series at x^2 / 8 - 1, and the error c_err of that value
+    cdef Result res
 
-cdef Result _debye_1(double x) nogil:
+    res.val = c - SLOPE[n] * x
+    res.err = c_err + m.DBL_EPSILON * SLOPE[n] * x
+    return res
+
+
+cdef void debye_block(int n, const double* xs, Py_ssize_t size, double* val, double* err) noexcept nogil:
+    """
+    D_n at the size <= BLOCK points of xs into val and err, which is skipped if NULL. The points between the small
+    argument limit and 4 share the Chebyshev series of the order and are evaluated together by cheb_eval_block_tol,
+    the others by the kernel of the order, giving the same results as that kernel does for every point
+    """
+    cdef:
+        double rtol = get_rtol(), small = 2 * m.SQRT_DBL_EPSILON * (1 if n == 1 else m.M_SQRT2)
+        double x
+        double xc[BLOCK]
+        double y[BLOCK]
+        double c[BLOCK]
+        double c_err[BLOCK]
+        Py_ssize_t at[BLOCK]
+        Py_ssize_t j, k = 0
+        Result res
+
+    for j in range(size):
+        x = xs[j]
+        if small <= x <= 4:
+            at[k] = j
+            xc[k] = x
+            y[k] = x * x / 8. - 1
+            k += 1
+        else:
+            res = DEBYE[n](x)
+            val[j] = res.val
+            if err != NULL:
+                err[j] = res.err
+
+    if k == 0:
+        return
+    if SCIFY_STATS:
+        hit(DEBYE_1 + n - 1, 2, k)
+
+    cheb_eval_block_tol(DB[n], y, k, -1, 1, 0.5 * rtol * D_AT_4[n], c, c_err if err != NULL else NULL)
+    for j in range(k):
+        res = debye_cheb(n, xc[j], c[j], c_err[j] if err != NULL else 0)
+        val[at[j]] = res.val
+        if err != NULL:
+            err[at[j]] = res.err
+
+
+debye_1 = ufunc_d_d_block(_debye_1_block, 'debye_1', "Debye function of order 1, D_1(x)")
+debye_1_e = ufunc_d_dd_block(_debye_1_block, 'debye_1_e',
+                             "Debye function of order 1, D_1(x), and its absolute error")
+
+cpdef double debye_1_scalar(double x, double rtol=0) except? -1:
+    """Debye function of order 1, D_1(x), of a single value. See eval_scalar"""
+    return eval_scalar(_debye_1, x, rtol)
+
+
+cdef void _debye_1_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    debye_block(1, xs, n, val, err)
+
+
+cdef Result _debye_1(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
         double val_infinity = 1.64493406684822644
         int i, nexp
+        double rtol = get_rtol()
         double total, ex
 
+    if SCIFY_STATS:
+        count_branch(1, x, rtol)
+
     if x < 0:
         return make_r_nan()
 
@@ -162,9 +333,11 @@ cdef Result _debye_1(double x) nogil:
         res.err = m.DBL_EPSILON * cm.fabs(res.val)
 
     elif x <= 4:
-        c = cheb_eval(db1, x * x / 8. - 1, -1, 1)
-        res.val = c.val - 0.25 * x
-        res.err = c.err + 0.25 * x * m.DBL_EPSILON
+        c = cheb_eval_tol(db1, x * x / 8. - 1, -1, 1, 0.5 * rtol * D_AT_4[1])
+        res = debye_cheb(1, x, c.val, c.err)
+
+    elif rtol > 0 and x < X_CUT:
+        return debye_sum(1, x, rtol)
 
     elif x <= -(m.M_LN2 + m.LOG_DBL_EPSILON):
         nexp = <int> cm.floor(X_CUT / x)
@@ -188,30 +361,31 @@ cdef Result _debye_1(double x) nogil:
     return res
 
 
-def debye_2(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+debye_2 = ufunc_d_d_block(_debye_2_block, 'debye_2', "Debye function of order 2, D_2(x)")
+debye_2_e = ufunc_d_dd_block(_debye_2_block, 'debye_2_e',
+                             "Debye function of order 2, D_2(x), and its absolute error")
+
+cpdef double debye_2_scalar(double x, double rtol=0) except? -1:
+    """Debye function of order 2, D_2(x), of a single value. See eval_scalar"""
+    return eval_scalar(_debye_2, x, rtol)
 
-    if n == 1:
-        return _debye_2(arr[0]).val
-    elif threaded:
-        map_dbl_p(_debye_2, arr, n)
-    else:
-        map_dbl_s(_debye_2, arr, n)
 
-    return arr.reshape(x.shape)
+cdef void _debye_2_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    debye_block(2, xs, n, val, err)
 
 
-cdef Result _debye_2(double x) nogil:
+cdef Result _debye_2(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
         double val_infinity = 4.80822761263837714, x2 = x ** 2
         int i, nexp
+        double rtol = get_rtol()
         double total, ex, xi
 
+    if SCIFY_STATS:
+        count_branch(2, x, rtol)
+
     if x < 0:
         return make_r_nan()
 
@@ -220,9 +394,11 @@ cdef Result _debye_2(double x) nogil:
         res.err = m.DBL_EPSILON * res.val
 
     elif x <= 4:
-        c = cheb_eval(db2, x * x / 8. - 1, -1, 1)
-        res.val = c.val - x / 3.
-        res.err = c.err + m.DBL_EPSILON * x / 3.
+        c = cheb_eval_tol(db2, x * x / 8. - 1, -1, 1, 0.5 * rtol * D_AT_4[2])
+        res = debye_cheb(2, x, c.val, c.err)
+
+    elif rtol > 0 and x < X_CUT:
+        return debye_sum(2, x, rtol)
 
     elif x < - (m.M_LN2 + m.LOG_DBL_EPSILON):
         nexp = <int> cm.floor(X_CUT / x)
@@ -248,30 +424,31 @@ cdef Result _debye_2(double x) nogil:
     return res
 
 
-def debye_3(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+debye_3 = ufunc_d_d_block(_debye_3_block, 'debye_3', "Debye function of order 3, D_3(x)")
+debye_3_e = ufunc_d_dd_block(_debye_3_block, 'debye_3_e',
+                             "Debye function of order 3, D_3(x), and its absolute error")
+
+cpdef double debye_3_scalar(double x, double rtol=0) except? -1:
+    """Debye function of order 3, D_3(x), of a single value. See eval_scalar"""
+    return eval_scalar(_debye_3, x, rtol)
 
-    if n == 1:
-        return _debye_3(arr[0]).val
-    elif threaded:
-        map_dbl_p(_debye_3, arr, n)
-    else:
-        map_dbl_s(_debye_3, arr, n)
 
-    return arr.reshape(x.shape)
+cdef void _debye_3_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    debye_block(3, xs, n, val, err)
 
 
-cdef Result _debye_3(double x) nogil:
+cdef Result _debye_3(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
         double val_infinity = 19.4818182068004875, x3 = x ** 3
         int i, nexp
+        double rtol = get_rtol()
         double total, ex, xinv
 
+    if SCIFY_STATS:
+        count_branch(3, x, rtol)
+
     if x < 0:
         return make_r_nan()
     elif x < 2.0 * m.M_SQRT2 * m.SQRT_DBL_EPSILON:
@@ -279,9 +456,11 @@ cdef Result _debye_3(double x) nogil:
         res.err = m.DBL_EPSILON * res.val
 
     elif x <= 4:
-        c = cheb_eval(db3, x * x / 8. - 1, -1, 1)
-        res.val = c.val - 0.375 * x
-        res.err = c.err + m.DBL_EPSILON * 0.375 * x
+        c = cheb_eval_tol(db3, x * x / 8. - 1, -1, 1, 0.5 * rtol * D_AT_4[3])
+        res = debye_cheb(3, x, c.val, c.err)
+
+    elif rtol > 0 and x < X_CUT:
+        return debye_sum(3, x, rtol)
 
     elif x < - (m.M_LN2 + m.LOG_DBL_EPSILON):
         nexp = <int>cm.floor(X_CUT / x)
@@ -307,30 +486,31 @@ cdef Result _debye_3(double x) nogil:
     return res
 
 
-def debye_4(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+debye_4 = ufunc_d_d_block(_debye_4_block, 'debye_4', "Debye function of order 4, D_4(x)")
+debye_4_e = ufunc_d_dd_block(_debye_4_block, 'debye_4_e',
+                             "Debye function of order 4, D_4(x), and its absolute error")
+
+cpdef double debye_4_scalar(double x, double rtol=0) except? -1:
+    """Debye function of order 4, D_4(x), of a single value. See eval_scalar"""
+    return eval_scalar(_debye_4, x, rtol)
 
-    if n == 1:
-        return _debye_4(arr[0]).val
-    elif threaded:
-        map_dbl_p(_debye_4, arr, n)
-    else:
-        map_dbl_s(_debye_4, arr, n)
 
-    return arr.reshape(x.shape)
+cdef void _debye_4_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    debye_block(4, xs, n, val, err)
 
 
-cdef Result _debye_4(double x) nogil:
+cdef Result _debye_4(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
         double val_infinity = 99.5450644937635129, x4 = x ** 4
         int i, nexp
+        double rtol = get_rtol()
         double total, ex, xinv         
 
+    if SCIFY_STATS:
+        count_branch(4, x, rtol)
+
     if x < 0:
         return make_r_nan()
     
@@ -339,9 +519,11 @@ cdef Result _debye_4(double x) nogil:
         res.err = m.DBL_EPSILON * res.val
         
     elif x <= 4:
-        c = cheb_eval(db4, x * x / 8. - 1, -1, 1)
-        res.val = c.val - 0.4 * x
-        res.err = c.err + m.DBL_EPSILON * 0.4 * x
+        c = cheb_eval_tol(db4, x * x / 8. - 1, -1, 1, 0.5 * rtol * D_AT_4[4])
+        res = debye_cheb(4, x, c.val, c.err)
+
+    elif rtol > 0 and x < X_CUT:
+        return debye_sum(4, x, rtol)
 
     elif x < - (m.M_LN2 + m.LOG_DBL_EPSILON):
         nexp = <int> cm.floor(X_CUT / x)
@@ -366,30 +548,31 @@ cdef Result _debye_4(double x) nogil:
 
     return res
 
-def debye_5(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+debye_5 = ufunc_d_d_block(_debye_5_block, 'debye_5', "Debye function of order 5, D_5(x)")
+debye_5_e = ufunc_d_dd_block(_debye_5_block, 'debye_5_e',
+                             "Debye function of order 5, D_5(x), and its absolute error")
+
+cpdef double debye_5_scalar(double x, double rtol=0) except? -1:
+    """Debye function of order 5, D_5(x), of a single value. See eval_scalar"""
+    return eval_scalar(_debye_5, x, rtol)
 
-    if n == 1:
-        return _debye_5(arr[0]).val
-    elif threaded:
-        map_dbl_p(_debye_5, arr, n)
-    else:
-        map_dbl_s(_debye_5, arr, n)
 
-    return arr.reshape(x.shape)
+cdef void _debye_5_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    debye_block(5, xs, n, val, err)
 
 
-cdef Result _debye_5(double x) nogil:
+cdef Result _debye_5(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
         double val_infinity = 610.405837190669483828710757875, x5 = x ** 5
         int i, nexp
+        double rtol = get_rtol()
         double total, ex, xinv
 
+    if SCIFY_STATS:
+        count_branch(5, x, rtol)
+
     if x < 0:
         return make_r_nan()
 
@@ -398,9 +581,11 @@ cdef Result _debye_5(double x) nogil:
         res.err = m.DBL_EPSILON * res.val
 
     elif x <= 4:
-        c = cheb_eval(db5, x * x / 8. - 1, -1, 1)
-        res.val = c.val - 5. * x / 12
-        res.err = c.err + m.DBL_EPSILON * 5. * x / 12
+        c = cheb_eval_tol(db5, x * x / 8. - 1, -1, 1, 0.5 * rtol * D_AT_4[5])
+        res = debye_cheb(5, x, c.val, c.err)
+
+    elif rtol > 0 and x < X_CUT:
+        return debye_sum(5, x, rtol)
 
     elif x < - (m.M_LN2 + m.LOG_DBL_EPSILON):
         nexp = <int> cm.floor(X_CUT / x)
@@ -425,30 +610,31 @@ cdef Result _debye_5(double x) nogil:
     return res
 
 
-def debye_6(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
+debye_6 = ufunc_d_d_block(_debye_6_block, 'debye_6', "Debye function of order 6, D_6(x)")
+debye_6_e = ufunc_d_dd_block(_debye_6_block, 'debye_6_e',
+                             "Debye function of order 6, D_6(x), and its absolute error")
 
-    if n == 1:
-        return _debye_6(arr[0]).val
-    elif threaded:
-        map_dbl_p(_debye_6, arr, n)
-    else:
-        map_dbl_s(_debye_6, arr, n)
+cpdef double debye_6_scalar(double x, double rtol=0) except? -1:
+    """Debye function of order 6, D_6(x), of a single value. See eval_scalar"""
+    return eval_scalar(_debye_6, x, rtol)
 
-    return arr.reshape(x.shape)
 
+cdef void _debye_6_block(const double* xs, Py_ssize_t n, double* val, double* err) noexcept nogil:
+    debye_block(6, xs, n, val, err)
 
-cdef Result _debye_6(double x) nogil:
+
+cdef Result _debye_6(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
         double val_infinity = 4356.06887828990661194792541535, x6 = x ** 6
         int i, nexp
+        double rtol = get_rtol()
         double total, ex, xinv
 
+    if SCIFY_STATS:
+        count_branch(6, x, rtol)
+
     if x < 0:
         return make_r_nan()
 
@@ -457,9 +643,11 @@ cdef Result _debye_6(double x) nogil:
         res.err = m.DBL_EPSILON * res.val
 
     elif x <= 4:
-        c = cheb_eval(db6, x * x / 8. - 1, -1, 1)
-        res.val = c.val - 3. * x / 7
-        res.err = c.err + m.DBL_EPSILON - 3. * x / 7
+        c = cheb_eval_tol(db6, x * x / 8. - 1, -1, 1, 0.5 * rtol * D_AT_4[6])
+        res = debye_cheb(6, x, c.val, c.err)
+
+    elif rtol > 0 and x < X_CUT:
+        return debye_sum(6, x, rtol)
 
     elif x < - (m.M_LN2 + m.LOG_DBL_EPSILON):
         nexp = <int> cm.floor(X_CUT / x)
@@ -483,3 +671,196 @@ cdef Result _debye_6(double x) nogil:
         res.err = m.DBL_EPSILON * res.val
 
     return res
+
+
+debye_n = ufunc_dl_d(_debye_n, 'debye_n', "Debye function of integer order n, D_n(x)")
+debye_n_e = ufunc_dl_dd(_debye_n, 'debye_n_e', "Debye function of integer order n, D_n(x), and its absolute error")
+
+cpdef double debye_n_scalar(double x, long long n, double rtol=0) except? -1:
+    """Debye function of integer order n, D_n(x), of a single value. See eval_scalar"""
+    cdef double prev, v
+
+    assert n >= 1, "Debye order must be a positive integer"
+    assert 0 <= rtol < 1, "Relative tolerance must be in [0, 1)"
+    prev = set_rtol(rtol)
+    v = _debye_n(x, n).val
+    set_rtol(prev)
+    return v
+
+
+cdef Fn1R[7] DEBYE = [NULL, _debye_1, _debye_2, _debye_3, _debye_4, _debye_5, _debye_6]
+
+# D_n is split at B_CUT into the Bernoulli series below and the sum of incomplete gamma functions above
+cdef double B_CUT = 2
+
+
+cdef Result _debye_n(double x, long long n) noexcept nogil:
+    if n < 1 or n > INT_MAX:
+        return make_r_nan()
+    elif n <= 6:
+        return DEBYE[n](x)
+    return debye_any(x, <int> n)
+
+
+cdef Result debye_any(double x, int n) noexcept nogil:
+    """
+    D_n(x) for any order. n / x^n int_0^x t^n / (e^t - 1) dt is split at c = min(x, B_CUT). The part below c is the
+    series n (c / x)^n sum_k B_k c^k / (k! (n + k)), which converges for c < 2 pi. The part above c is
+    n / x^n sum_i int_c^x t^n e^{-it} dt, each term of which is less than e^{-c} times the previous one
+    """
+    cdef:
+        double tol = cm.fmax(0.5 * get_rtol(), m.DBL_EPSILON)
+        double c = cm.fmin(x, B_CUT), c2 = c * c, p = 1, term, total, lg, err, tail
+        int i, k
+        Result res, t
+
+    if not x >= 0:
+        if SCIFY_STATS:
+            hit(DEBYE_N, 0, 1)
+        return make_r_nan()
+    elif x == cm.INFINITY:
+        if SCIFY_STATS:
+            hit(DEBYE_N, 1, 1)
+        return make_r_0()
+
+    # the terms of the series decrease by (c / 2 pi)^2 < 0.11, so the last one bounds the tail
+    total = 1 - n * c / (2. * (n + 1))
+    for k in range(sizeof(bernoulli) // sizeof(double)):
+        p *= c2
+        term = bernoulli[k] * p * n / (n + 2 * k + 2)
+        total += term
+        if cm.fabs(term) < tol * total:
+            break
+    err = 4 * m.DBL_EPSILON * total + cm.fabs(term)
+
+    if x <= B_CUT:
+        if SCIFY_STATS:
+            hit(DEBYE_N, 2, 1)
+            iterations(DEBYE_N, k + 1)
+        res.val = total
+        res.err = err
+        return res
+
+    p = cm.pow(c / x, n)
+    total *= p
+    err = (n + 4) * m.DBL_EPSILON * total + p * cm.fabs(term)
+    lg = cm.lgamma(n + 1)
+
+    i = 0
+    while True:
+        i += 1
+        t = debye_term(n, x, c, i, lg)
+        total += t.val
+        err += t.err
+
+        # the tail is at most term * e^{-c} / (1 - e^{-c})
+        tail = t.val / (cm.exp(c) - 1)
+        if tail <= tol * total:
+            break
+
+    if SCIFY_STATS:
+        hit(DEBYE_N, 3, 1)
+        iterations(DEBYE_N, k + 1 + i)
+    res.val = total
+    res.err = err + tail
+    return res
+
+
+cdef Result debye_term(int n, double x, double c, int i, double lg) noexcept nogil:
+    """
+    n / x^n int_c^x t^n e^{-it} dt = n / (x^n i^{n + 1}) int_{ic}^{ix} u^n e^{-u} du, as the difference of the lower
+    incomplete gamma functions gamma(n + 1, .) if ix < n + 1, of the upper ones Gamma(n + 1, .) if ic >= n + 1 and
+    n! minus both otherwise, so that it does not cancel. lg = log(n!)
+    """
+    cdef:
+        double a = c * i, b = x * i, lcx = cm.log(c / x), la, lb
+        Result res
+
+    if a >= n + 1:
+        la = n * lcx - a + log_gamma_q_sum(n, a)
+        lb = -b + log_gamma_q_sum(n, b)
+        res.val = n / (<double> i) * cm.exp(la) * -cm.expm1(lb - la)
+        res.err = m.DBL_EPSILON * (4 + cm.fabs(la)) * res.val
+
+    elif b < n + 1:
+        la = (n + 1) * lcx - a + log_gamma_p_sum(n, a)
+        lb = -b + log_gamma_p_sum(n, b)
+        res.val = n * x * cm.exp(lb) * -cm.expm1(la - lb)
+        res.err = m.DBL_EPSILON * (4 + cm.fabs(lb) + cm.fabs(la)) * res.val
+
+    else:
+        la = lg - n * cm.log(x) - (n + 1) * cm.log(i)
+        res.val = n * (cm.exp(la) - cm.exp(-b + log_gamma_q_sum(n, b)) / i
+                       - x * cm.exp((n + 1) * lcx - a + log_gamma_p_sum(n, a)))
+        res.err = m.DBL_EPSILON * (4 + cm.fabs(la) + b) * n * cm.exp(la)
+
+    return res
+
+
+cdef double log_gamma_p_sum(int n, double y) noexcept nogil:
+    # log(gamma(n + 1, y) e^y / y^{n + 1}) for 0 < y < n + 1, from gamma(n + 1, y) = y^{n + 1} e^{-y} sum_j y^j n! /
+    # (n + 1 + j)!, whose terms decrease
+    cdef:
+        double a = 1, s = 1, r
+        int j = 1
+
+    while True:
+        r = y / (n + 1 + j)
+        a *= r
+        s += a
+        if a * r < m.DBL_EPSILON * s * (1 - r):
+            break
+        j += 1
+
+    return cm.log(s / (n + 1))
+
+
+cdef double log_gamma_q_sum(int n, double y) noexcept nogil:
+    # log(Gamma(n + 1, y) e^y / y^n) for y >= n + 1, from Gamma(n + 1, y) = e^{-y} sum_{k <= n} y^k n! / k!, whose
+    # terms decrease from k = n
+    cdef:
+        double a = 1, s = 1
+        int k = n
+
+    while k > 0 and a > m.DBL_EPSILON * s * (1 - k / y):
+        a *= k / y
+        s += a
+        k -= 1
+
+    return cm.log(s)
+
+
+cdef void _debye_all(double x, int mask, Result* res) noexcept nogil:
+    # D_n(x) into res[n - 1] for each order n whose bit n - 1 is set in mask. Between 4 and X_CUT, where the kernels
+    # spend their time, the exponentials and sums are shared by the orders
+    cdef int n
+
+    if 4 < x < X_CUT:
+        debye_sums(x, mask, cm.fmax(0.5 * get_rtol(), 0.5 * m.DBL_EPSILON), res)
+    else:
+        for n in range(1, 7):
+            if mask & (1 << (n - 1)):
+                res[n - 1] = DEBYE[n](x)
+
+
+cdef dict _fused = {}
+
+
+def debye_all_ufunc(int mask=ALL, bint with_error=False):
+    """
+    Returns the fused Debye ufunc computing the orders selected by the bits of mask (order 1 from the lowest bit)
+    in a single pass. Its outputs are the selected values in increasing order, followed by their errors if
+    with_error is True. The ufuncs are created once and cached.
+    """
+    key = mask, with_error
+    if key not in _fused:
+        name = 'debye_all' + ('_e' if with_error else '')
+        doc = (f"Debye functions D_1(x) to D_6(x) in a single pass for the orders selected by mask {mask}" +
+               (", followed by their absolute errors" if with_error else ""))
+        _fused[key] = ufunc_d_m(_debye_all, mask, with_error, name, doc)
+
+    return _fused[key]
+
+
+debye_all = debye_all_ufunc(ALL)
+debye_all_e = debye_all_ufunc(ALL, True)
@@ -0,0 +1,5 @@
+from ._results cimport ComplexResult, Result
+
+cdef:
+    Result _dilog(double) noexcept nogil
+    ComplexResult _dilog_complex_xy(double, double) noexcept nogil
@@ -1,41 +1,42 @@
-import numpy as np
-
 from libc cimport math as cm
-cimport numpy as cnp
 
 from scify cimport _machine as m
 from ._results cimport (
-Result, make_r_0, make_r_nan, map_dbl_p, map_dbl_s,
-ComplexResult, make_c_0, mapc_dbl_p, mapc_dbl_s
+Result, eval_scalar, make_r_0, make_r_nan, ufunc_d_d, ufunc_d_dd,
+ComplexResult, make_c_0, ufunc_D_D, ufunc_D_DD, ufunc_dd_D, ufunc_dd_DD
 )
+from .cheb cimport get_rtol, set_rtol
 from .clausen cimport _clausen
 from .log cimport _complex_log
+from .stats cimport DILOG, DILOG_COMPLEX, DILOGC_UNIT_DISK, SCIFY_STATS, hit, iterations
 
 cdef:
     double PI = m.M_PI
     double DBL_EPS = m.DBL_EPSILON
+    # share of the requested relative error given to stopping the series, the rest covering their combination
+    double SERIES_RTOL = 0.1
 
+# B_2k / (2k + 1)! for k = 1, ..., 10, the coefficients of the odd powers of the Bernoulli series of Li_2
+cdef double[10] BERNOULLI = [1. / 36, -1. / 3600, 1. / 211680, -1. / 10886400, 1. / 526901760,
+                             -4.0647616451442255e-11, 8.9216910204564526e-13, -1.9939295860721076e-14,
+                             4.5189800296199182e-16, -1.0356517612181247e-17]
 
-def dilog(x, bint threaded):
-    x = np.asarray(x, float)
-    cdef:
-        cnp.ndarray[cnp.npy_float64, ndim=1] arr = x.ravel()
-        int n = arr.size
 
-    if n == 1:
-        return _dilog(arr[0]).val
-    if threaded and n > 1:
-        map_dbl_p(_dilog, arr, n)
-    else:
-        map_dbl_s(_dilog, arr, n)
+dilog = ufunc_d_d(_dilog, 'dilog', "Real dilogarithm, Li_2(x)")
+dilog_e = ufunc_d_dd(_dilog, 'dilog_e', "Real dilogarithm, Li_2(x), and its absolute error")
 
-    return arr.reshape(x.shape)
+cpdef double dilog_scalar(double x, double rtol=0) except? -1:
+    """Real dilogarithm, Li_2(x), of a single value"""
+    return eval_scalar(_dilog, x, rtol)
 
-cdef Result _dilog(double x) nogil:
+cdef Result _dilog(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result d1, d2
 
+    if SCIFY_STATS:
+        count_branch(x)
+
     if x >= 0:
         return dilog_xge0(x)
     d1 = dilog_xge0(-x)
@@ -44,7 +45,31 @@ cdef Result _dilog(double x) nogil:
     res.err = d1.err + 0.5 * d2.err + 2 * DBL_EPS * cm.fabs(res.val)
     return res
 
-cdef Result dilog_xge0(double x) nogil:
+cdef inline void count_branch(double x) noexcept nogil:
+    # records the branch of _dilog, or of dilog_xge0 for x >= 0, taken at x
+    cdef int branch
+
+    if x < 0:
+        branch = 0
+    elif x > 2:
+        branch = 1
+    elif x > 1.01:
+        branch = 2
+    elif x > 1:
+        branch = 3
+    elif cm.fabs(x - 1) <= m.DBL_EPSILON * 10:
+        branch = 4
+    elif x > 0.5:
+        branch = 5
+    elif x > 0.25:
+        branch = 6
+    elif x > 0:
+        branch = 7
+    else:
+        branch = 8
+    hit(DILOG, branch, 1)
+
+cdef Result dilog_xge0(double x) noexcept nogil:
     """Calculates dilog for real :math:`x \geq 0"""
     cdef:
         Result res = make_r_0()
@@ -100,10 +125,11 @@ cdef Result dilog_xge0(double x) nogil:
 
     return res
 
-cdef Result dilog_series_1(double x) nogil:
+cdef Result dilog_series_1(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         double rk2, term = x, total = x
+        double tol = cm.fmax(DBL_EPS, SERIES_RTOL * get_rtol())
         int k
 
     for k in range(2, 1000):
@@ -111,30 +137,39 @@ cdef Result dilog_series_1(double x) nogil:
         term *= x * rk2
         total += term
 
-        if cm.fabs(term / total) < DBL_EPS:
+        if cm.fabs(term / total) < tol:
+            if SCIFY_STATS:
+                iterations(DILOG, k)
             res.val = total
             res.err = 2 * (cm.fabs(term) + DBL_EPS * cm.fabs(res.val))
             return res
 
     # Max iteration hit. dilog_series_1 could not converge
+    if SCIFY_STATS:
+        iterations(DILOG, 999)
     return make_r_nan()
 
-cdef Result dilog_series_2(double x) nogil:
+cdef Result dilog_series_2(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         double total = 0.5 * x, y = x, z = 0
         double ds
+        double tol = cm.fmax(0.5 * DBL_EPS, SERIES_RTOL * get_rtol())
         int k
 
     for k in range(2, 100):
         y *= x
         ds = y / (k * k * (k + 1))
         total += ds
-        if k >= 10 and cm.fabs(ds / total) < 0.5 * DBL_EPS:
+        if k >= 10 and cm.fabs(ds / total) < tol:
             break
 
+    if SCIFY_STATS:
+        iterations(DILOG, k)
+
+    # x <= 1/2, so the terms left out sum to less than the last
     res.val = total
-    res.err = 2.0 * 100 * DBL_EPS * cm.fabs(total)
+    res.err = 2.0 * 100 * DBL_EPS * cm.fabs(total) + cm.fabs(ds)
 
     if x > 0.01:
         z = (1 - x) * cm.log(1 - x) / x
@@ -147,41 +182,46 @@ cdef Result dilog_series_2(double x) nogil:
     res.err += 2.0 * DBL_EPS * cm.fabs(z)
     return res
 
-def dilog_complex(r, theta, bint threaded):
-    r = np.asarray(r, float)
-    theta = np.asarray(theta, float)
-
+dilog_complex = ufunc_D_D(_dilog_complex_xy, 'dilog_complex', "Complex dilogarithm, Li_2(z)")
+dilog_complex_e = ufunc_D_DD(_dilog_complex_xy, 'dilog_complex_e',
+                             "Complex dilogarithm, Li_2(z), and its absolute error")
+_dilog_complex_series = ufunc_D_D(dilogc_unit_disk_series, '_dilog_complex_series',
+                                  "Complex dilogarithm, Li_2(z), for |z| < 1 by power series in z")
+dilog_complex_polar = ufunc_dd_D(_dilog_complex, 'dilog_complex_polar',
+                                 "Complex dilogarithm, Li_2(z), of z = r exp(i theta) given as (r, theta)")
+dilog_complex_polar_e = ufunc_dd_DD(_dilog_complex, 'dilog_complex_polar_e',
+                                    "Complex dilogarithm, Li_2(z), of z = r exp(i theta) given as (r, theta), "
+                                    "and its absolute error")
+
+cpdef double complex dilog_complex_scalar(double complex z, double rtol=0) except *:
+    """Complex dilogarithm, Li_2(z), of a single value. rtol is applied as by eval_scalar"""
     cdef:
         ComplexResult c
-        cnp.ndarray[cnp.npy_float64, ndim=1] r_vec = r.ravel()
-        cnp.ndarray[cnp.npy_float64, ndim=1] i_vec = theta.ravel()
-        int n = r_vec.size
+        double prev
 
-    assert r.shape == theta.shape, "Radius of complex vector must have same shape as the angled part"
+    assert 0 <= rtol < 1, "Relative tolerance must be in [0, 1)"
+    prev = set_rtol(rtol)
+    c = _dilog_complex_xy(z.real, z.imag)
+    set_rtol(prev)
+    return c.real + 1j * c.imag
 
-    if n == 1:
-        c = _dilog_complex(r_vec[0], i_vec[0])
-        return c.real + 1j * c.imag
-    if threaded:
-        mapc_dbl_p(_dilog_complex, r_vec, i_vec, n)
-    else:
-        mapc_dbl_s(_dilog_complex, r_vec, i_vec, n)
-
-    return (r_vec + 1j * i_vec).reshape(r.shape)
+cdef ComplexResult _dilog_complex(double r, double theta) noexcept nogil:
+    # polar form of _dilog_complex_xy
+    return _dilog_complex_xy(r * cm.cos(theta), r * cm.sin(theta))
 
-cdef ComplexResult _dilog_complex(double r, double theta) nogil:
+cdef ComplexResult _dilog_complex_xy(double x, double y) noexcept nogil:
     cdef:
         ComplexResult c = make_c_0()
         Result real_res
-        double x = r * cm.cos(theta)
-        double y = r * cm.sin(theta)
         double zeta2 = PI ** 2 / 6
         double r2 = x * x + y * y
-        double t1, t2
+        double theta, t1, t2
 
         double ln_minusz_re, ln_minusz_im, lmz2_re, lmz2_im
 
     if cm.fabs(y) < 10 * DBL_EPS:
+        if SCIFY_STATS:
+            hit(DILOG_COMPLEX, 0, 1)
         real_res = _dilog(x)
         c.real, c.real_err = real_res.val, real_res.err
         if x >= 1:
@@ -189,6 +229,9 @@ cdef ComplexResult _dilog_complex(double r, double theta) nogil:
             c.imag_err = 2 * DBL_EPS * cm.fabs(c.imag)
 
     elif cm.fabs(r2 - 1) <= DBL_EPS:
+        if SCIFY_STATS:
+            hit(DILOG_COMPLEX, 1, 1)
+        theta = cm.atan2(y, x)
         t1 = theta * theta / 4
         t2 = PI * cm.fabs(theta) / 2
         c.real = zeta2 + t1 - t2
@@ -199,12 +242,17 @@ cdef ComplexResult _dilog_complex(double r, double theta) nogil:
         c.imag_err = real_res.err
 
     elif r2 < 1:
+        if SCIFY_STATS:
+            hit(DILOG_COMPLEX, 2, 1)
         return dilogc_unit_disk(x, y)
 
     else:
-        c = dilogc_unit_disk(x / r2, - y / r2)
-        ln_minusz_re = cm.log(r)
-        ln_minusz_im = (-1.0 if theta < 0.0 else 1.0) * (cm.fabs(theta) - PI)
+        if SCIFY_STATS:
+            hit(DILOG_COMPLEX, 3, 1)
+        # Li_2(z) = -Li_2(1 / z) - log(-z)^2 / 2 - zeta(2)
+        c = dilogc_unit_disk(x / r2, - y / r2, True)
+        ln_minusz_re = cm.log(cm.hypot(x, y))
+        ln_minusz_im = cm.atan2(-y, -x)
         lmz2_re = ln_minusz_re ** 2 - ln_minusz_im ** 2
         lmz2_im = 2.0 * ln_minusz_re * ln_minusz_im
 
@@ -215,7 +263,7 @@ cdef ComplexResult _dilog_complex(double r, double theta) nogil:
 
     return c
 
-cdef inline ComplexResult dilogc_fundamental(double r, double x, double y) nogil:
+cdef inline ComplexResult dilogc_fundamental(double r, double x, double y) noexcept nogil:
     if r > 0.98:
         return dilogc_series_3(r, x, y)
     elif r > 0.25:
@@ -223,7 +271,77 @@ cdef inline ComplexResult dilogc_fundamental(double r, double x, double y) nogil
     else:
         return dilogc_series_1(r, x, y)
 
-cdef ComplexResult dilogc_unit_disk(double x, double y) nogil:
+cdef ComplexResult dilogc_unit_disk(double x, double y, bint inverted=False) noexcept nogil:
+    """
+    Li_2(z) for |z| < 1 by the Bernoulli series Li_2(z) = sum B_n u^(n + 1) / (n + 1)! in u = -log(1 - z), which
+    converges for |u| < 2 pi. Where Re(z) > 1/2, Li_2(z) = -Li_2(1 - z) + zeta(2) - log(z) log(1 - z) is used so that
+    the series is taken in u = -log(z) instead. Then |u| <= pi / 3 over the disk and a fixed 12 terms suffice, fewer
+    with a relative tolerance. inverted tells the statistics that z is the inverse of the argument of Li_2
+    """
+    cdef:
+        ComplexResult c = make_c_0()
+        double zeta2 = PI ** 2 / 6
+        double ur, ui, wr, wi, qr, qi, tmp, sr, si
+        double lr, li, rr = 0, ri = 0, rest_err = 0, sgn = 1
+        double tol = SERIES_RTOL * get_rtol(), aw, p, dropped = 0
+        int k, n = 10
+
+    if x > 0.5:
+        ur = -0.5 * cm.log1p((x - 1) * (x + 1) + y * y)  # -log(z)
+        ui = -cm.atan2(y, x)
+        lr = cm.log(cm.hypot(1 - x, y))  # log(1 - z)
+        li = cm.atan2(-y, 1 - x)
+        rr = zeta2 + ur * lr - ui * li
+        ri = ur * li + ui * lr
+        rest_err = zeta2 + cm.fabs(ur * lr) + cm.fabs(ui * li)
+        sgn = -1
+    else:
+        ur = -0.5 * cm.log1p(x * (x - 2) + y * y)  # -log(1 - z)
+        ui = -cm.atan2(-y, 1 - x)
+
+    # u + u^2 (B_1 / 2!) + u w Q(w), w = u^2, by Horner's rule in w
+    wr = ur * ur - ui * ui
+    wi = 2 * ur * ui
+
+    # with a tolerance, the terms of Q from the first below it relative to |u| are left out. They decrease by
+    # |w| / (2 pi)^2 < 0.03, so twice the first bounds them
+    if tol > 0:
+        aw = ur * ur + ui * ui
+        p = aw
+        n = 0
+        while n < 10 and cm.fabs(BERNOULLI[n]) * p >= tol:
+            p *= aw
+            n += 1
+        if n < 10:
+            dropped = 2 * cm.fabs(BERNOULLI[n]) * p * cm.hypot(ur, ui)
+
+    if SCIFY_STATS:
+        hit(DILOGC_UNIT_DISK, 2 if inverted else (1 if x > 0.5 else 0), 1)
+        iterations(DILOGC_UNIT_DISK, n + 2)
+
+    qr = BERNOULLI[n - 1] if n > 0 else 0
+    qi = 0
+    for k in range(n - 2, -1, -1):
+        tmp = qr * wr - qi * wi + BERNOULLI[k]
+        qi = qr * wi + qi * wr
+        qr = tmp
+
+    tmp = qr * wr - qi * wi
+    qi = qr * wi + qi * wr
+    qr = 1 + tmp
+    sr = ur * qr - ui * qi - 0.25 * wr
+    si = ur * qi + ui * qr - 0.25 * wi
+
+    # the parts of the sum cancel where Re or Im Li_2 changes sign, so both errors are taken relative to |sum|
+    tmp = cm.hypot(ur, ui) * cm.hypot(qr, qi) + 0.25 * (ur * ur + ui * ui)
+    c.real = sgn * sr + rr
+    c.real_err = 4 * DBL_EPS * (tmp + cm.fabs(rr) + rest_err) + dropped
+    c.imag = sgn * si + ri
+    c.imag_err = 4 * DBL_EPS * (tmp + cm.fabs(ri) + rest_err) + dropped
+    return c
+
+cdef ComplexResult dilogc_unit_disk_series(double x, double y) noexcept nogil:
+    # Li_2(z) for |z| < 1 by power series in z, kept as the baseline of dilogc_unit_disk
     cdef:
         ComplexResult c = make_c_0()
         ComplexResult tmp_c
@@ -251,7 +369,7 @@ cdef ComplexResult dilogc_unit_disk(double x, double y) nogil:
     else:
         return dilogc_fundamental(r, x, y)
 
-cdef ComplexResult dilogc_series_1(double r, double x, double y) nogil:
+cdef ComplexResult dilogc_series_1(double r, double x, double y) noexcept nogil:
     cdef:
         ComplexResult c = make_c_0()
         double cos_theta = x / r
@@ -283,7 +401,7 @@ cdef ComplexResult dilogc_series_1(double r, double x, double y) nogil:
     c.imag_err = 2 * kmax * DBL_EPS * cm.fabs(imag)
     return c
 
-cdef ComplexResult dilogc_series_2(double r, double x, double y) nogil:
+cdef ComplexResult dilogc_series_2(double r, double x, double y) noexcept nogil:
     cdef:
         ComplexResult c = make_c_0()
         ComplexResult ln_omz, sum_c
@@ -308,7 +426,7 @@ cdef ComplexResult dilogc_series_2(double r, double x, double y) nogil:
 
     return c
 
-cdef ComplexResult dilogc_series_3(double r, double x, double y) nogil:
+cdef ComplexResult dilogc_series_3(double r, double x, double y) noexcept nogil:
     cdef:
         ComplexResult c = make_c_0()
         double theta = cm.atan2(y, x)
@@ -352,7 +470,7 @@ cdef ComplexResult dilogc_series_3(double r, double x, double y) nogil:
     c.imag_err = 2 * 6 * DBL_EPS * cm.fabs(sum_im) + claus.err + cm.fabs(an / nfact)
     return c
 
-cdef ComplexResult series_2_c(double r, double x, double y) nogil:
+cdef ComplexResult series_2_c(double r, double x, double y) noexcept nogil:
     cdef:
         ComplexResult c = make_c_0()
         double cos_theta = x / r
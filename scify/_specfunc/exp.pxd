@@ -1,4 +1,4 @@
 from ._results cimport Result
 
 cdef:
-    Result exp_mult_err(double, double, double, double) nogil
+    Result exp_mult_err(double, double, double, double) noexcept nogil
\ No newline at end of file
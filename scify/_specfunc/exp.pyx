@@ -6,7 +6,7 @@ from scify cimport _machine as m
 from ._results cimport Result, make_r
 
 
-cdef Result exp_mult_err(double x, double dx, double y, double dy) nogil:
+cdef Result exp_mult_err(double x, double dx, double y, double dy) noexcept nogil:
     cdef:
         double ay = cm.fabs(y), ex = cm.exp(x)
         double ly, lnr, a, b, err, val
@@ -31,8 +31,8 @@ cdef Result exp_mult_err(double x, double dx, double y, double dy) nogil:
                 warnings.warn('Underflow encountered in exp_mult_err')
             return make_r(cm.NAN, cm.NAN)
 
-        a = cm.exp(x - cm.floor(x))
-        b = cm.exp(ly - cm.floor(ly))
+        a = cm.exp(cm.floor(x) + cm.floor(ly))
+        b = cm.exp(x - cm.floor(x) + ly - cm.floor(ly))
 
         val = m.sign(y) * a * b
         err = a * b * (2 * m.DBL_EPSILON + cm.fabs(dy / y) + cm.fabs(dx))
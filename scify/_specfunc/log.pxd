@@ -1,6 +1,6 @@
 from ._results cimport ComplexResult, Result
 
 cdef:
-    ComplexResult _complex_log(double, double) nogil
-    Result log_1plusx(double x) nogil
-    Result log_1plusx_mx(double x) nogil
+    ComplexResult _complex_log(double, double) noexcept nogil
+    Result log_1plusx(double x) noexcept nogil
+    Result log_1plusx_mx(double x) noexcept nogil
\ No newline at end of file
@@ -1,18 +1,15 @@
-import numpy as np
-
 from libc cimport math as cm
-cimport numpy as cnp
 
 from scify cimport _machine as m
 from ._results cimport (
 Result, make_r_0, make_r_nan,
-ComplexResult, make_c_0, make_c_nan, mapc_dbl_p, mapc_dbl_s
+ComplexResult, make_c_0, make_c_nan, ufunc_D_D, ufunc_D_DD, ufunc_dd_D, ufunc_dd_DD
 )
-from .cheb cimport cheb_eval
+from .cheb cimport ChebSeries, cheb_eval
 
 cdef:
     double DBL_EPS = m.DBL_EPSILON
-    double[::1] lopx = np.array([
+    double[21] LOPX = [
         2.16647910664395270521272590407,
         -0.28565398551049742084877469679,
         0.01517767255690553732382488171,
@@ -34,8 +31,9 @@ cdef:
         9.7089758328248469219003866867e-17,
         -1.3492637457521938883731579510e-17,
         1.8657327910677296608121390705e-18
-    ])
-    double[::1] lopxmx = np.array([
+    ]
+    ChebSeries lopx = ChebSeries(&LOPX[0], sizeof(LOPX) // sizeof(double))
+    double[20] LOPXMX = [
         -1.12100231323744103373737274541,
         0.19553462773379386241549597019,
         -0.01467470453808083971825344956,
@@ -56,31 +54,18 @@ cdef:
         6.8802890218846809524646902703e-16,
         -9.5034129794804273611403251480e-17,
         1.3170135013050997157326965813e-17
-    ])
-
-def complex_log(zr, zi, bint threaded):
-    zr = np.asarray(zr, float)
-    zi = np.asarray(zi, float)
-
-    cdef:
-        ComplexResult c
-        cnp.ndarray[cnp.npy_float64, ndim=1] r_vec = zr.ravel()
-        cnp.ndarray[cnp.npy_float64, ndim=1] i_vec = zi.ravel()
-        int n = r_vec.size
-
-    assert zr.shape == zi.shape, "Real part of complex vector must have same shape as the imaginary part"
-
-    if n == 1:
-        c = _complex_log(r_vec[0], i_vec[0])
-        return c.real + 1j * c.imag
-    if threaded:
-        mapc_dbl_p(_complex_log, r_vec, i_vec, n)
-    else:
-        mapc_dbl_s(_complex_log, r_vec, i_vec, n)
-
-    return (r_vec + 1j * i_vec).reshape(zr.shape)
-
-cdef ComplexResult _complex_log(double zr, double zi) nogil:
+    ]
+    ChebSeries lopxmx = ChebSeries(&LOPXMX[0], sizeof(LOPXMX) // sizeof(double))
+
+complex_log = ufunc_D_D(_complex_log, 'complex_log', "Complex natural logarithm, log(z)")
+complex_log_e = ufunc_D_DD(_complex_log, 'complex_log_e', "Complex natural logarithm, log(z), and its absolute error")
+complex_log_rect = ufunc_dd_D(_complex_log, 'complex_log_rect',
+                              "Complex natural logarithm, log(z), of z = zr + i zi given as (zr, zi)")
+complex_log_rect_e = ufunc_dd_DD(_complex_log, 'complex_log_rect_e',
+                                 "Complex natural logarithm, log(z), of z = zr + i zi given as (zr, zi), "
+                                 "and its absolute error")
+
+cdef ComplexResult _complex_log(double zr, double zi) noexcept nogil:
     cdef:
         ComplexResult res = make_c_0()
         double ax, ay, min_, max_
@@ -96,11 +81,11 @@ cdef ComplexResult _complex_log(double zr, double zi) nogil:
     res.real = cm.log(max_) + 0.5 * cm.log(1 + (min_ / max_) ** 2)
     res.real_err = 2 * DBL_EPS * cm.fabs(res.real)
     res.imag = cm.atan2(zi, zr)
-    res.real_err = DBL_EPS * cm.fabs(res.real)
+    res.imag_err = DBL_EPS * cm.fabs(res.imag)
 
     return res
 
-cdef Result log_1plusx(double x) nogil:
+cdef Result log_1plusx(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
@@ -124,7 +109,7 @@ cdef Result log_1plusx(double x) nogil:
     return res
 
 
-cdef Result log_1plusx_mx(double x) nogil:
+cdef Result log_1plusx_mx(double x) noexcept nogil:
     cdef:
         Result res = make_r_0()
         Result c
@@ -0,0 +1,40 @@
+cdef extern from *:
+    """
+    /* The instrumentation is compiled in by defining SCIFY_STATS=1, see setup.py --stats. Otherwise the
+       `if SCIFY_STATS:` blocks around the calls below are constant false and removed by the C compiler */
+    #ifndef SCIFY_STATS
+    #define SCIFY_STATS 0
+    #endif
+    """
+    bint SCIFY_STATS
+
+cdef enum:
+    MAX_BRANCHES = 16
+
+# kernels whose branches, regimes or iterations are counted. Their names and the names of their branches are listed
+# in KERNELS in stats.pyx
+cdef enum:
+    AIRY_AI
+    AIRY_BI
+    DEBYE_1
+    DEBYE_2
+    DEBYE_3
+    DEBYE_4
+    DEBYE_5
+    DEBYE_6
+    DEBYE_N
+    DILOG
+    DILOG_COMPLEX
+    DILOGC_UNIT_DISK
+    N_KERNELS
+
+# paths of the ufunc loops
+cdef enum:
+    SERIAL
+    PARALLEL
+
+cdef:
+    void hit(int kernel, int branch, long long n) noexcept nogil
+    void iterations(int kernel, long long n) noexcept nogil
+    void loop_begin(int threads, Py_ssize_t size) noexcept nogil
+    void loop_end() noexcept nogil
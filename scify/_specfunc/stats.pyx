@@ -0,0 +1,107 @@
+"""
+Counters of the instrumented builds, read by scify.stats(). The kernels count the branches or regimes their inputs
+take and the iterations of their series, and the ufunc loops the elements and time of the serial and parallel
+paths. All are updated atomically, as they are from within the parallel loops.
+"""
+
+cimport openmp
+
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #include <intrin.h>
+    #define SCIFY_ATOMIC_ADD(p, v) _InterlockedExchangeAdd64((volatile long long*) (p), (v))
+    #define SCIFY_THREAD_LOCAL __declspec(thread)
+    #else
+    #define SCIFY_ATOMIC_ADD(p, v) __atomic_fetch_add((p), (v), __ATOMIC_RELAXED)
+    #define SCIFY_THREAD_LOCAL __thread
+    #endif
+
+    /* Start time, path and size of the ufunc loop running on the current thread */
+    static SCIFY_THREAD_LOCAL double scify_loop_t0 = 0;
+    static SCIFY_THREAD_LOCAL int scify_loop_path = 0;
+    static SCIFY_THREAD_LOCAL Py_ssize_t scify_loop_size = 0;
+    """
+    void SCIFY_ATOMIC_ADD(long long*, long long) nogil
+    double scify_loop_t0
+    int scify_loop_path
+    Py_ssize_t scify_loop_size
+
+# name of each kernel and of its branches, by the index passed to hit
+KERNELS = {
+    AIRY_AI: ('airy_Ai', ('oscillating', 'near', 'series', 'decaying')),
+    AIRY_BI: ('airy_Bi', ('oscillating', 'near', 'series', 'series_2', 'growth', 'growth_2')),
+    DEBYE_N: ('debye_n', ('nan', 'infinity', 'series', 'series_and_sum')),
+    DILOG: ('dilog', ('negative', 'inverted', 'reflected_inverted', 'near_one', 'one', 'reflected', 'series_2',
+                      'series_1', 'zero')),
+    DILOG_COMPLEX: ('dilog_complex', ('real_axis', 'unit_circle', 'unit_disk', 'inverted')),
+    DILOGC_UNIT_DISK: ('dilogc_unit_disk', ('unit_disk', 'reflected', 'inverted')),
+}
+for _n in range(1, 7):
+    KERNELS[DEBYE_1 + _n - 1] = (f'debye_{_n}', ('negative', 'small', 'chebyshev', 'rtol_sum', 'exp_sum', 'exp',
+                                                 'limit'))
+
+cdef:
+    long long hits[N_KERNELS][MAX_BRANCHES]
+    long long iters[N_KERNELS]
+    # calls, elements and nanoseconds of each path of the loops
+    long long loops[2][3]
+
+
+cdef void hit(int kernel, int branch, long long n) noexcept nogil:
+    # n inputs of kernel took the branch
+    SCIFY_ATOMIC_ADD(&hits[kernel][branch], n)
+
+
+cdef void iterations(int kernel, long long n) noexcept nogil:
+    # a call of kernel ran n iterations
+    SCIFY_ATOMIC_ADD(&iters[kernel], n)
+
+
+cdef void loop_begin(int threads, Py_ssize_t size) noexcept nogil:
+    global scify_loop_t0, scify_loop_path, scify_loop_size
+    scify_loop_path = PARALLEL if threads > 1 else SERIAL
+    scify_loop_size = size
+    scify_loop_t0 = openmp.omp_get_wtime()
+
+
+cdef void loop_end() noexcept nogil:
+    cdef long long ns = <long long> (1e9 * (openmp.omp_get_wtime() - scify_loop_t0))
+    SCIFY_ATOMIC_ADD(&loops[scify_loop_path][0], 1)
+    SCIFY_ATOMIC_ADD(&loops[scify_loop_path][1], scify_loop_size)
+    SCIFY_ATOMIC_ADD(&loops[scify_loop_path][2], ns)
+
+
+def enabled():
+    """Returns True if the extensions were built with the instrumentation"""
+    return SCIFY_STATS
+
+
+def kernel_stats():
+    """Returns the branch counts and iterations of each kernel, by name"""
+    res = {}
+    for k, (name, branches) in KERNELS.items():
+        counts = {b: hits[k][i] for i, b in enumerate(branches)}
+        calls = sum(counts.values())
+        res[name] = {'calls': calls, 'branches': counts, 'iterations': iters[k],
+                     'mean_iterations': iters[k] / calls if calls else 0.}
+    return res
+
+
+def loop_stats():
+    """Returns the calls, elements and wall time in seconds of the serial and parallel paths of the ufunc loops"""
+    return {name: {'calls': loops[p][0], 'elements': loops[p][1], 'seconds': loops[p][2] * 1e-9}
+            for p, name in ((SERIAL, 'serial'), (PARALLEL, 'parallel'))}
+
+
+def reset():
+    """Sets all the counters to zero"""
+    cdef int k, b
+
+    for k in range(N_KERNELS):
+        iters[k] = 0
+        for b in range(MAX_BRANCHES):
+            hits[k][b] = 0
+    for k in range(2):
+        for b in range(3):
+            loops[k][b] = 0
@@ -1,6 +1,7 @@
 from ._results cimport Result
 
 cdef:
-    Result angle_restrict_pos_err(double) nogil
-    Result cos_err(const double, const double) nogil
-    Result sin_err(const double, const double) nogil
+    Result angle_restrict_pos_err(double) noexcept nogil
+    Result cos_err(const double, const double) noexcept nogil
+    Result sin_err(const double, const double) noexcept nogil
+    void sincos_err(const double, const double, Result*, Result*) noexcept nogil
@@ -1,14 +1,12 @@
-import numpy as np
-
 from libc cimport math as cm
 
 from scify cimport _machine as m
 from ._results cimport Result, make_r
-from .cheb cimport cheb_eval
+from .cheb cimport ChebSeries, cheb_eval
 
 cdef:
     double PI = m.M_PI
-    double[::1] cos_constants = np.array([
+    double[11] COS_CONSTANTS = [
         0.165391825637921473505668118136,
         -0.00084852883845000173671196530195,
         -0.000210086507222940730213625768083,
@@ -20,8 +18,9 @@ cdef:
         1.77126739876261435667156490461e-14,
         -7.6896421502815579078577263149e-17,
         -3.7363121133079412079201377318e-18
-    ])
-    double[::1] sin_constants = np.array([
+    ]
+    ChebSeries cos_constants = ChebSeries(&COS_CONSTANTS[0], sizeof(COS_CONSTANTS) // sizeof(double))
+    double[12] SIN_CONSTANTS = [
         -0.3295190160663511504173,
         0.0025374284671667991990,
         0.0006261928782647355874,
@@ -34,10 +33,11 @@ cdef:
         5.3701981409132410797062e-16,
         2.5984137983099020336115e-17,
         -1.1821555255364833468288e-19
-    ])
+    ]
+    ChebSeries sin_constants = ChebSeries(&SIN_CONSTANTS[0], sizeof(SIN_CONSTANTS) // sizeof(double))
 
 
-cdef Result angle_restrict_pos_err(double theta) nogil:
+cdef Result angle_restrict_pos_err(double theta) noexcept nogil:
     cdef:
         Result res = make_r(0, 0)
         double two_pi = 2 * PI
@@ -63,7 +63,7 @@ cdef Result angle_restrict_pos_err(double theta) nogil:
     return res
 
 
-cdef Result cos_err(const double x, const double dx) nogil:
+cdef Result cos_err(const double x, const double dx) noexcept nogil:
     cdef:
         Result res = make_r(0, 0)
         double abs_x = cm.fabs(x)
@@ -116,7 +116,7 @@ cdef Result cos_err(const double x, const double dx) nogil:
     return res
 
 
-cdef Result sin_err(const double x, const double dx) nogil:
+cdef Result sin_err(const double x, const double dx) noexcept nogil:
     cdef:
         Result res = make_r(0, 0)
         double abs_x = cm.fabs(x)
@@ -164,3 +164,63 @@ cdef Result sin_err(const double x, const double dx) nogil:
     res.err += cm.fabs(cm.cos(x) * dx) + m.DBL_EPSILON * res.val
 
     return res
+
+
+cdef void sincos_err(const double x, const double dx, Result* s, Result* c) noexcept nogil:
+    """sin_err and cos_err of the same angle, sharing the argument reduction and the series evaluations"""
+    cdef:
+        double abs_x = cm.fabs(x)
+        double x2, t, y, z, sin_z, cos_z, err
+        int sgn_s = m.sign(x), sgn_c = 1
+        int octant
+
+    if abs_x < m.ROOT4_DBL_EPSILON:
+        x2 = x * x
+        s.val = x * (1 - x * x / 6.)
+        s.err = cm.fabs(x * x2 * x2 / 100.0)
+        c.val = 1 - 0.5 * x2
+        c.err = cm.fabs(x2 * x2 / 12)
+    else:
+        y = cm.floor(abs_x / (0.25 * PI))
+        octant = <int>(y - cm.ldexp(cm.floor(cm.ldexp(y, -3)), 3))
+
+        if octant % 2 == 1:
+            octant += 1
+            octant &= 7
+            y += 1
+
+        if octant > 3:
+            octant -= 4
+            sgn_s *= -1
+            sgn_c *= -1
+
+        if octant > 1:
+            sgn_c *= -1
+
+        z = abs_x - y * 7.85398125648498535156e-1 - y * 3.77489470793079817668e-8 - y * 2.69515142907905952645e-15
+
+        t = 8 * cm.fabs(z) / PI - 1
+        sin_z = z * (1 + z * z * cheb_eval(sin_constants, t, -1, 1).val)
+        cos_z = 1 - 0.5 * z * z * (1 - z * z * cheb_eval(cos_constants, t, -1, 1).val)
+
+        if octant == 0:
+            s.val = sgn_s * sin_z
+            c.val = sgn_c * cos_z
+        else:
+            s.val = sgn_s * cos_z
+            c.val = sgn_c * sin_z
+
+        if abs_x > 1/m.DBL_EPSILON:
+            err = 1
+        elif abs_x > 100/m.SQRT_DBL_EPSILON:
+            err = 2.0 * abs_x * m.DBL_EPSILON
+        elif abs_x > 0.1/m.SQRT_DBL_EPSILON:
+            err = 2.0 * m.SQRT_DBL_EPSILON
+        else:
+            err = 2.0 * m.DBL_EPSILON
+
+        s.err = err * cm.fabs(s.val)
+        c.err = err * cm.fabs(c.val)
+
+    s.err += cm.fabs(c.val * dx) + m.DBL_EPSILON * s.val
+    c.err += cm.fabs(s.val * dx) + m.DBL_EPSILON * c.val
@@ -0,0 +1,59 @@
+"""
+Statistics of the specfunc kernels, for finding out which code paths the data of an application takes and where the
+time goes.
+
+They are only recorded by extensions built with the instrumentation, by ``make ext-stats`` or
+``python setup.py --stats build_ext``, as the counting slows the kernels down. Other builds leave out the counting
+code altogether and :func:`stats` reports that it is not enabled, with all counts zero.
+
+Examples
+--------
+>>> import numpy as np
+>>> import scify
+>>> from scify.specfunc import airy_Ai
+>>> scify.reset_stats()
+>>> _ = airy_Ai(np.linspace(-5, 5, 100000))
+>>> s = scify.stats()
+>>> s['enabled'] or s['kernels']['airy_Ai']['calls'] == 0
+True
+"""
+
+from ._specfunc import _results as r, stats as s
+
+__all__ = ['reset_stats', 'stats']
+
+
+def stats() -> dict:
+    """
+    Returns the statistics recorded since the extensions were loaded or :func:`reset_stats` was last called
+
+    Returns
+    -------
+    dict
+        With the keys
+
+        enabled
+            True if the extensions were built with the instrumentation. Otherwise nothing is recorded
+        kernels
+            For each instrumented kernel, such as 'airy_Ai', 'debye_3' or 'dilog_complex', its 'calls', the number
+            of calls taking each of its 'branches' (for Airy functions, the points evaluated in each regime), the
+            'iterations' run by its series and the 'mean_iterations' per call
+        loops
+            The 'calls', 'elements' and wall time in 'seconds' of the 'serial' and 'parallel' paths of the ufunc
+            loops
+        ufuncs
+            The 'calls', 'elements' and wall time in 'seconds' of each ufunc evaluated by the specfunc functions, by
+            name
+    """
+    return {
+        'enabled': bool(s.enabled()),
+        'kernels': s.kernel_stats(),
+        'loops': s.loop_stats(),
+        'ufuncs': r.ufunc_stats(),
+    }
+
+
+def reset_stats():
+    """Sets all the statistics to zero"""
+    s.reset()
+    r.reset_ufunc_stats()
@@ -0,0 +1,77 @@
+"""
+Controls the number of threads used by the specfunc functions.
+
+By default, arrays with at least :func:`get_serial_threshold` elements are evaluated with all the threads OpenMP
+makes available; smaller arrays are evaluated on the calling thread, as starting the threads would cost more than
+it saves. The number of threads can be set for the whole process with :func:`set_num_threads`, for the calls made
+from the current thread with the :func:`num_threads` context manager, or for a single call with the `num_threads`
+argument of the functions, in increasing order of precedence.
+
+Examples
+--------
+>>> import numpy as np
+>>> import scify
+>>> from scify.specfunc import airy_Ai
+>>> scify.set_num_threads(4)
+>>> with scify.num_threads(2):
+...     _ = airy_Ai(np.linspace(-5, 5, 100000))
+"""
+
+from contextlib import contextmanager
+
+from ._specfunc import _results as r
+
+__all__ = ['get_num_threads', 'get_serial_threshold', 'num_threads', 'set_num_threads', 'set_serial_threshold']
+
+
+def get_num_threads() -> int:
+    """Returns the number of threads used by the calls made from the current thread"""
+    return r.get_local_threads() or r.get_num_threads()
+
+
+def set_num_threads(n: int = 0):
+    """
+    Sets the number of threads used by the specfunc functions for the whole process
+
+    Parameters
+    ----------
+    n: int, optional
+        Number of threads. If 0, uses as many threads as OpenMP makes available, e.g. as set by the
+        OMP_NUM_THREADS environment variable.
+    """
+    r.set_num_threads(n)
+
+
+@contextmanager
+def num_threads(n: int):
+    """
+    Context manager setting the number of threads used by the specfunc functions called from the current thread.
+    Other threads are unaffected, so that each can be given a share of the machine.
+
+    Parameters
+    ----------
+    n: int
+        Number of threads. If 0, uses the process wide setting.
+    """
+    prev = r.set_local_threads(n)
+    try:
+        yield
+    finally:
+        r.set_local_threads(prev)
+
+
+def get_serial_threshold() -> int:
+    """Returns the array size below which the specfunc functions are evaluated on the calling thread only"""
+    return r.get_serial_threshold()
+
+
+def set_serial_threshold(n: int):
+    """
+    Sets the array size below which the specfunc functions are evaluated on the calling thread only
+
+    Parameters
+    ----------
+    n: int
+        Minimum number of elements for which threads are started. Defaults to 1000.
+    """
+    r.set_serial_threshold(n)
@@ -0,0 +1 @@
+from scify.specfunc.capi cimport *
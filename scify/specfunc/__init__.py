@@ -1,4 +1,64 @@
-from .airy import *
-from .clausen import clausen
-from .debye import *
-from .dilog import *
+"""
+The special functions.
+
+The submodules are imported when one of their functions is first looked up (PEP 562), so that ``import
+scify.specfunc`` loads neither their extensions nor NumPy, and a program pays only for the functions it uses. On
+Python 3.6 they are imported with the package.
+"""
+
+import importlib as _importlib
+import sys as _sys
+from types import ModuleType as _ModuleType
+
+# submodule of each function
+_SUBMODULES = {
+    **dict.fromkeys(['airy_Ai', 'airy_Ai_scaled', 'airy_Ai_deriv', 'airy_Ai_deriv_scaled', 'airy_zero_Ai',
+                     'airy_zero_Ai_deriv', 'airy_Bi', 'airy_Bi_scaled', 'airy_Bi_deriv', 'airy_Bi_deriv_scaled',
+                     'airy_zero_Bi', 'airy_zero_Bi_deriv', 'airy_all', 'airy_zeros_Ai', 'airy_zeros_Ai_deriv',
+                     'airy_zeros_Bi', 'airy_zeros_Bi_deriv'], 'airy'),
+    'clausen': 'clausen',
+    **dict.fromkeys(['debye_all', 'debye_n', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5', 'debye_6'],
+                    'debye'),
+    'dilog': 'dilog',
+    'dilog_complex': 'dilog',
+    'stream': 'stream',
+}
+
+# submodules found as attributes of the package, imported on first use too. The clausen, dilog and stream names are
+# their functions
+_MODULES = ['airy', 'capi', 'debye', 'log', 'scalar', 'ufuncs']
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return _importlib.import_module(f'.{name}', __name__)
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = _importlib.import_module(f'.{_SUBMODULES[name]}', __name__)
+    for n, m in _SUBMODULES.items():
+        if m == _SUBMODULES[name]:
+            globals()[n] = getattr(module, n)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_MODULES))
+
+
+class _Package(_ModuleType):
+    def __setattr__(self, name, value):
+        # importing the submodules 'clausen', 'dilog' and 'stream' binds them in the package, under the names of their
+        # functions, which are kept instead
+        if isinstance(value, _ModuleType) and name in _SUBMODULES:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _Package
+
+if _sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
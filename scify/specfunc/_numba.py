@@ -0,0 +1,195 @@
+"""
+Numba overloads of the specfunc functions, so that they can be called from ``@njit`` and ``@vectorize`` code.
+
+Numba imports this module through the ``numba_extensions`` entry point declared in setup.py when it first compiles a
+function, so scify never imports Numba itself. The overloads call the nogil kernels of :mod:`scify.specfunc.capi` by
+their addresses, which LLVM sees as direct calls, without going through the interpreter or NumPy.
+
+Both the wrappers of :mod:`scify.specfunc` and the functions of :mod:`scify.specfunc.scalar` are overloaded. A
+number gives a float (complex for :func:`dilog_complex`) and an array an array of the same shape. The ``threaded`` and
+``num_threads`` arguments are accepted and ignored, the jitted code deciding its own parallelism, while ``out``,
+``inplace``, ``with_error``, ``rtol`` and the polar form of :func:`dilog_complex` are not supported and fail to
+compile. The functions are at full double precision.
+
+Examples
+--------
+>>> from numba import njit
+>>> from scify.specfunc import airy_Ai, debye_2
+>>> @njit
+... def f(x):
+...     return airy_Ai(x) * debye_2(x)
+>>> round(f(0.5), 12)
+0.195484806151
+"""
+
+import ctypes
+
+import numpy as np
+from llvmlite import ir
+from numba import njit, types
+from numba.core import cgutils
+from numba.core.errors import TypingError
+from numba.extending import get_cython_function_address, intrinsic, overload
+
+import scify.specfunc as sf
+from . import scalar
+
+CAPI = 'scify.specfunc.capi'
+
+# functions of a real argument and of an index
+REAL = ['airy_Ai', 'airy_Ai_scaled', 'airy_Ai_deriv', 'airy_Ai_deriv_scaled', 'airy_Bi', 'airy_Bi_scaled',
+        'airy_Bi_deriv', 'airy_Bi_deriv_scaled', 'clausen', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5',
+        'debye_6', 'dilog']
+INDEX = ['airy_zero_Ai', 'airy_zero_Ai_deriv', 'airy_zero_Bi', 'airy_zero_Bi_deriv']
+
+
+def _init_extension():
+    """Entry point of Numba. The overloads are registered by importing this module"""
+
+
+def _function(name, restype, *argtypes):
+    return ctypes.CFUNCTYPE(restype, *argtypes)(get_cython_function_address(CAPI, name))
+
+
+def _check_defaults(name, **kwargs):
+    # the arguments which change what the wrappers return must be left out, when Numba passes their defaults
+    for arg, value in kwargs.items():
+        if isinstance(value, types.Type) and not isinstance(value, (types.Omitted, types.NoneType)):
+            raise TypingError(f"{name}: '{arg}' is not supported in jitted code")
+
+
+def _apply(f, x, numbers, dtype=np.float64):
+    """
+    Returns a jitted function applying f to the number or each element of the array x, or None if x is neither, so
+    that Numba reports the types as unsupported
+    """
+    if isinstance(x, numbers):
+        return njit(lambda x: f(x))
+    if isinstance(x, types.Array) and isinstance(x.dtype, numbers):
+        @njit
+        def apply(x):
+            xs = x.ravel()
+            res = np.empty(xs.size, dtype=dtype)
+            for i in range(xs.size):
+                res[i] = f(xs[i])
+            return res.reshape(x.shape)
+
+        return apply
+    return None
+
+
+def _overload_unary(name, numbers, f, with_rtol):
+    _module_function = getattr(sf, name)
+    _scalar_function = getattr(scalar, name)
+
+    if with_rtol:
+        @overload(_module_function)
+        def wrapper(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.):
+            _check_defaults(name, out=out, inplace=inplace, with_error=with_error, rtol=rtol)
+            impl = _apply(f, x, numbers)
+            if impl is not None:
+                return lambda x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, \
+                    rtol=0.: impl(x)
+
+        @overload(_scalar_function)
+        def scalar_function(x, rtol=0.):
+            _check_defaults(name, rtol=rtol)
+            if isinstance(x, numbers):
+                return lambda x, rtol=0.: f(x)
+    else:
+        @overload(_module_function)
+        def wrapper(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None):
+            _check_defaults(name, out=out, inplace=inplace, with_error=with_error)
+            impl = _apply(f, x, numbers)
+            if impl is not None:
+                return lambda x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None: impl(x)
+
+        @overload(_scalar_function)
+        def scalar_function(x):
+            if isinstance(x, numbers):
+                return lambda x: f(x)
+
+
+for _name in REAL:
+    _overload_unary(_name, (types.Float, types.Integer), _function(_name, ctypes.c_double, ctypes.c_double), True)
+for _name in INDEX:
+    _overload_unary(_name, types.Integer, _function(_name, ctypes.c_double, ctypes.c_longlong), False)
+
+_debye_n = _function('debye_n', ctypes.c_double, ctypes.c_double, ctypes.c_longlong)
+
+
+@overload(sf.debye_n)
+def _debye_n_wrapper(x, order=1, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+                     rtol=0.):
+    _check_defaults('debye_n', out=out, inplace=inplace, with_error=with_error, rtol=rtol)
+    if not isinstance(order, (types.Integer, types.Omitted)):
+        raise TypingError("debye_n: the order must be an integer in jitted code")
+
+    if isinstance(x, (types.Float, types.Integer)):
+        return lambda x, order=1, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, \
+            rtol=0.: _debye_n(x, order)
+    if isinstance(x, types.Array) and isinstance(x.dtype, (types.Float, types.Integer)):
+        def impl(x, order=1, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.):
+            xs = x.ravel()
+            res = np.empty(xs.size)
+            for i in range(xs.size):
+                res[i] = _debye_n(xs[i], order)
+            return res.reshape(x.shape)
+
+        return impl
+
+
+@overload(scalar.debye_n)
+def _debye_n_scalar(x, n, rtol=0.):
+    _check_defaults('debye_n', rtol=rtol)
+    if isinstance(x, (types.Float, types.Integer)) and isinstance(n, types.Integer):
+        return lambda x, n, rtol=0.: _debye_n(x, n)
+
+
+@intrinsic
+def _dilog_complex_xy(typingctx, x, y):
+    # calls dilog_complex_xy of the C API, whose results are stored through pointers on the stack
+    sig = types.complex128(types.float64, types.float64)
+
+    def codegen(context, builder, signature, args):
+        double = ir.DoubleType()
+        fnty = ir.FunctionType(ir.VoidType(), [double, double, double.as_pointer(), double.as_pointer()])
+        address = context.get_constant(types.uintp, get_cython_function_address(CAPI, 'dilog_complex_xy'))
+        fn = builder.inttoptr(address, fnty.as_pointer())
+
+        real, imag = cgutils.alloca_once(builder, double), cgutils.alloca_once(builder, double)
+        builder.call(fn, [args[0], args[1], real, imag])
+        res = context.make_complex(builder, types.complex128)
+        res.real, res.imag = builder.load(real), builder.load(imag)
+        return res._getvalue()
+
+    return sig, codegen
+
+
+def _dilog_complex(z):
+    z = complex(z)
+    return _dilog_complex_xy(z.real, z.imag)
+
+
+@overload(_dilog_complex)
+def _dilog_complex_impl(z):
+    if isinstance(z, types.Complex):
+        return lambda z: _dilog_complex_xy(z.real, z.imag)
+    return lambda z: _dilog_complex_xy(float(z), 0.)
+
+
+@overload(sf.dilog_complex)
+def _dilog_complex_wrapper(r, theta=None, threaded=True, out=None, inplace=False, with_error=False,
+                           num_threads=None, rtol=0.):
+    _check_defaults('dilog_complex', theta=theta, out=out, inplace=inplace, with_error=with_error, rtol=rtol)
+    impl = _apply(_dilog_complex, r, (types.Complex, types.Float, types.Integer), np.complex128)
+    if impl is not None:
+        return lambda r, theta=None, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, \
+            rtol=0.: impl(r)
+
+
+@overload(scalar.dilog_complex)
+def _dilog_complex_scalar(z, rtol=0.):
+    _check_defaults('dilog_complex', rtol=rtol)
+    if isinstance(z, (types.Complex, types.Float, types.Integer)):
+        return lambda z, rtol=0.: _dilog_complex(z)
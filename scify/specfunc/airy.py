@@ -1,13 +1,49 @@
-from scify.types import Real
+"""
+The Airy functions, their derivatives and their zeros.
+
+For x < -1, where the functions oscillate, they are computed from a modulus and a phase, and their errors are
+relative to the modulus, sqrt(Ai^2 + Bi^2) or sqrt(Ai'^2 + Bi'^2), rather than to the value. This holds for ``rtol``
+and for float32 inputs, which are about one float32 ulp of the modulus: near the zeros that is many ulps of the
+value.
+"""
+
+import threading
+from numbers import Integral
+
+import numpy as np
+
+from scify.types import Real, SCALARS
 from .._specfunc import airy as a
+from .._specfunc import airy_all as aa
 from .._specfunc import airy_deriv as d
 from .._specfunc import airy_zero as z
+from .._specfunc._results import evaluate, get_num_threads
 
 __all__ = ['airy_Ai', 'airy_Ai_scaled', 'airy_Ai_deriv', 'airy_Ai_deriv_scaled', 'airy_zero_Ai', 'airy_zero_Ai_deriv',
-           'airy_Bi', 'airy_Bi_scaled', 'airy_Bi_deriv', 'airy_Bi_deriv_scaled', 'airy_zero_Bi', 'airy_zero_Bi_deriv']
+           'airy_Bi', 'airy_Bi_scaled', 'airy_Bi_deriv', 'airy_Bi_deriv_scaled', 'airy_zero_Bi', 'airy_zero_Bi_deriv',
+           'airy_all', 'airy_zeros_Ai', 'airy_zeros_Ai_deriv', 'airy_zeros_Bi', 'airy_zeros_Bi_deriv']
+
+# Order of the outputs of the fused Airy kernel
+_AIRY_ALL = ('Ai', 'Ai_deriv', 'Bi', 'Bi_deriv')
+
 
+# First zeros computed so far and the other function at each, per kind of zeros, see _airy_zeros
+_ZEROS = {}
+_ZEROS_LOCK = threading.Lock()
 
-def airy_Ai(x, threaded=True) -> Real:
+
+def _zero_index(x, out, inplace):
+    # Real valued indices are truncated to integers, as np.asarray(x, np.int64) does, without copying an int64 input.
+    # Only the index is cast so: the zeros are written into `out`, or back into `x`, with the default casting, which
+    # refuses integer arrays as for the other functions
+    if inplace:
+        assert out is None, "Cannot specify 'out' when evaluating inplace"
+        assert isinstance(x, np.ndarray), "Input must be a numpy array when evaluating inplace"
+        out = x
+    return np.asarray(x).astype(np.int64, copy=False), out
+
+
+def airy_Ai(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     Computes the Airy function of the first kind. This is defined as
 
@@ -25,15 +61,41 @@ def airy_Ai(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return a.airy_Ai(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return a.airy_Ai_scalar(x, rtol)
 
+    ufunc = a.airy_Ai_e if with_error else a.airy_Ai
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
-def airy_Ai_deriv(x, threaded=True) -> Real:
+
+def airy_Ai_deriv(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     """
     Compute the derivative of the Airy function the first kind
 
@@ -45,15 +107,41 @@ def airy_Ai_deriv(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Derivative values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.airy_Ai_deriv(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.airy_Ai_deriv_scalar(x, rtol)
+
+    ufunc = d.airy_Ai_deriv_e if with_error else d.airy_Ai_deriv
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
 
-def airy_Ai_scaled(x, threaded=True) -> Real:
+def airy_Ai_scaled(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     Computes a scaled version of the Airy function of the first kind.
 
@@ -78,15 +166,42 @@ def airy_Ai_scaled(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return a.airy_Ai_scaled(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return a.airy_Ai_scaled_scalar(x, rtol)
+
+    ufunc = a.airy_Ai_scaled_e if with_error else a.airy_Ai_scaled
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
 
-def airy_Ai_deriv_scaled(x, threaded=True) -> Real:
+def airy_Ai_deriv_scaled(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+                         rtol=0.) -> Real:
     """
     Compute the scaled derivative of the Airy function the first kind
 
@@ -98,15 +213,41 @@ def airy_Ai_deriv_scaled(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Derivative values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.airy_Ai_deriv_scaled(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.airy_Ai_deriv_scaled_scalar(x, rtol)
 
+    ufunc = d.airy_Ai_deriv_scaled_e if with_error else d.airy_Ai_deriv_scaled
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
-def airy_zero_Ai(x, threaded=True) -> Real:
+
+def airy_zero_Ai(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None) -> Real:
     r"""
     Compute the location of the s-th zero of the Airy function :math:`Ai(x)`
 
@@ -118,15 +259,37 @@ def airy_zero_Ai(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
     Returns
     -------
     array_like or scalar
         Location of the s-th zero of the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return z.airy_zero_Ai(x, threaded)
+    if type(x) is int and out is None and not (inplace or with_error):
+        return z.airy_zero_Ai_scalar(x)
 
+    ufunc = z.airy_zero_Ai_e if with_error else z.airy_zero_Ai
+    x, out = _zero_index(x, out, inplace)
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out)
 
-def airy_zero_Ai_deriv(x, threaded=True) -> Real:
+
+def airy_zero_Ai_deriv(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None) -> Real:
     r"""
     Compute the location of the s-th zero of the Airy function derivative :math:`Ai'(x)`.
 
@@ -138,15 +301,37 @@ def airy_zero_Ai_deriv(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
     Returns
     -------
     array_like or scalar
         Location of the s-th zero of the Airy function derivative
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return z.airy_zero_Ai_deriv(x, threaded)
+    if type(x) is int and out is None and not (inplace or with_error):
+        return z.airy_zero_Ai_deriv_scalar(x)
+
+    ufunc = z.airy_zero_Ai_deriv_e if with_error else z.airy_zero_Ai_deriv
+    x, out = _zero_index(x, out, inplace)
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out)
 
 
-def airy_Bi(x, threaded=True) -> Real:
+def airy_Bi(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     Computes the Airy function of the second kind. This is defined as
 
@@ -164,15 +349,41 @@ def airy_Bi(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return a.airy_Bi(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return a.airy_Bi_scalar(x, rtol)
+
+    ufunc = a.airy_Bi_e if with_error else a.airy_Bi
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
 
-def airy_Bi_deriv(x, threaded=True) -> Real:
+def airy_Bi_deriv(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     Compute the derivative of the Airy function the second kind.
 
@@ -184,15 +395,41 @@ def airy_Bi_deriv(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Derivative values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.airy_Bi_deriv(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.airy_Bi_deriv_scalar(x, rtol)
 
+    ufunc = d.airy_Bi_deriv_e if with_error else d.airy_Bi_deriv
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
-def airy_Bi_scaled(x, threaded=True) -> Real:
+
+def airy_Bi_scaled(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     Computes a scaled version of the Airy function of the second kind.
 
@@ -217,15 +454,42 @@ def airy_Bi_scaled(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return a.airy_Bi_scaled(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return a.airy_Bi_scaled_scalar(x, rtol)
+
+    ufunc = a.airy_Bi_scaled_e if with_error else a.airy_Bi_scaled
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
 
-def airy_Bi_deriv_scaled(x, threaded=True) -> Real:
+def airy_Bi_deriv_scaled(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+                         rtol=0.) -> Real:
     r"""
     Compute the scaled derivative of the Airy function the second kind.
 
@@ -237,15 +501,41 @@ def airy_Bi_deriv_scaled(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, which is faster. For
+        x < -1, where the function oscillates, the error is relative to its modulus instead. Defaults to 0, full
+        double precision.
+
     Returns
     -------
     array_like or scalar
         Derivative values from the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.airy_Bi_deriv_scaled(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.airy_Bi_deriv_scaled_scalar(x, rtol)
+
+    ufunc = d.airy_Bi_deriv_scaled_e if with_error else d.airy_Bi_deriv_scaled
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
 
-def airy_zero_Bi(x, threaded=True) -> Real:
+def airy_zero_Bi(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None) -> Real:
     r"""
     Compute the location of the s-th zero of the Airy function :math:`Bi(x)`
 
@@ -257,15 +547,37 @@ def airy_zero_Bi(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
     Returns
     -------
     array_like or scalar
         Location of the s-th zero of the Airy function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return z.airy_zero_Bi(x, threaded)
+    if type(x) is int and out is None and not (inplace or with_error):
+        return z.airy_zero_Bi_scalar(x)
+
+    ufunc = z.airy_zero_Bi_e if with_error else z.airy_zero_Bi
+    x, out = _zero_index(x, out, inplace)
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out)
 
 
-def airy_zero_Bi_deriv(x, threaded=True) -> Real:
+def airy_zero_Bi_deriv(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None) -> Real:
     r"""
     Compute the location of the s-th zero of the Airy function derivative :math:`Bi'(x)`.
 
@@ -277,9 +589,290 @@ def airy_zero_Bi_deriv(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
     Returns
     -------
     array_like or scalar
         Location of the s-th zero of the Airy function derivative
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
+    """
+    if type(x) is int and out is None and not (inplace or with_error):
+        return z.airy_zero_Bi_deriv_scalar(x)
+
+    ufunc = z.airy_zero_Bi_deriv_e if with_error else z.airy_zero_Bi_deriv
+    x, out = _zero_index(x, out, inplace)
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out)
+
+
+def airy_all(x, which=_AIRY_ALL, scaled=False, threaded=True, out=None, with_error=False, num_threads=None, rtol=0.):
+    """
+    Computes the Airy functions Ai and Bi and their derivatives in a single pass over `x`.
+
+    This is equivalent to calling :func:`airy_Ai`, :func:`airy_Ai_deriv`, :func:`airy_Bi` and :func:`airy_Bi_deriv`
+    (or their scaled versions) on `x`, but each element is visited once and the work common to the functions, such
+    as the modulus and phase of the oscillatory region and the exponential scaling factor, is shared.
+
+    Parameters
+    ----------
+    x: array_like
+        Numerical vector
+
+    which: iterable of str, optional
+        The functions to compute, any of 'Ai', 'Ai_deriv', 'Bi' and 'Bi_deriv'. Only these are computed and they
+        are returned in the given order. Defaults to all four.
+
+    scaled: bool, optional
+        If True, computes the scaled functions, as :func:`airy_Ai_scaled` and the like do.
+
+    threaded: bool, optional
+        If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
+
+    out: tuple of ndarray, optional
+        Locations into which the results are stored, one per function in `which`. If `with_error` is True, it may
+        also hold a further location per function for the errors.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series are truncated once the relative error is below `rtol`, as for
+        :func:`airy_Ai`. Defaults to 0, full double precision.
+
+    Returns
+    -------
+    tuple of array_like or scalar
+        Values of the functions in `which`
+
+    tuple of array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
+
+    Examples
+    --------
+    >>> from scify.specfunc import airy_all
+    >>> ai, ai_deriv, bi, bi_deriv = airy_all([-2., 0., 2.])
+    >>> ai, bi = airy_all([-2., 0., 2.], which=('Ai', 'Bi'))
+    """
+    which = tuple(which)
+    assert len(which) > 0 and set(which) <= set(_AIRY_ALL), f"which must be a subset of {_AIRY_ALL}"
+    assert len(set(which)) == len(which), "which must not contain duplicates"
+
+    slots = sorted(_AIRY_ALL.index(w) for w in which)
+    order = [slots.index(_AIRY_ALL.index(w)) for w in which]  # position of each requested output in the ufunc's
+    n = len(which)
+    ufunc = aa.airy_all_ufunc(sum(1 << i for i in slots), scaled, with_error)
+
+    if out is not None:
+        out = tuple(out)
+        assert len(out) in (n, ufunc.nout), f"out must hold {n} arrays"
+        out = out + (None,) * (ufunc.nout - len(out))
+        ordered = [None] * ufunc.nout
+        for i, o in enumerate(order):
+            ordered[o] = out[i]
+            if with_error:
+                ordered[n + o] = out[n + i]
+        out = tuple(ordered)
+
+    res = evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, rtol=rtol)
+    if ufunc.nout == 1:
+        res = res,
+
+    values = tuple(res[o] for o in order)
+    if with_error:
+        return values, tuple(res[n + o] for o in order)
+    return values
+
+
+def airy_zeros_Ai(n, with_values=False, threaded=True, num_threads=None):
+    r"""
+    Computes the first `n` zeros of the Airy function :math:`Ai(x)`, and optionally its derivative at each of them
+
+    The zeros are computed in parallel, those beyond the tabulated ones being refined by a Newton step. The
+    results are cached so that later calls for as many zeros or fewer cost nothing, and calls for more only compute
+    the missing ones.
+
+    Parameters
+    ----------
+    n: int
+        Number of zeros
+
+    with_values: bool, optional
+        If True, also returns :math:`Ai'(a_s)` at each zero :math:`a_s`, computed in the same pass
+
+    threaded: bool, optional
+        If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    Returns
+    -------
+    ndarray
+        The first `n` zeros in decreasing order. The array is a read-only view of the cache
+
+    ndarray, optional
+        :math:`Ai'(a_s)` at each zero, read-only. Only returned if `with_values` is True
+
+    Examples
+    --------
+    >>> from scify.specfunc import airy_zeros_Ai
+    >>> zeros, values = airy_zeros_Ai(100000, with_values=True)
+    """
+    return _airy_zeros(0, n, with_values, threaded, num_threads)
+
+
+def airy_zeros_Bi(n, with_values=False, threaded=True, num_threads=None):
+    r"""
+    Computes the first `n` zeros of the Airy function :math:`Bi(x)`, and optionally its derivative at each of them
+
+    The zeros are computed in parallel, those beyond the tabulated ones being refined by a Newton step. The
+    results are cached so that later calls for as many zeros or fewer cost nothing, and calls for more only compute
+    the missing ones.
+
+    Parameters
+    ----------
+    n: int
+        Number of zeros
+
+    with_values: bool, optional
+        If True, also returns :math:`Bi'(b_s)` at each zero :math:`b_s`, computed in the same pass
+
+    threaded: bool, optional
+        If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    Returns
+    -------
+    ndarray
+        The first `n` zeros in decreasing order. The array is a read-only view of the cache
+
+    ndarray, optional
+        :math:`Bi'(b_s)` at each zero, read-only. Only returned if `with_values` is True
+
+    Examples
+    --------
+    >>> from scify.specfunc import airy_zeros_Bi
+    >>> zeros, values = airy_zeros_Bi(100000, with_values=True)
+    """
+    return _airy_zeros(1, n, with_values, threaded, num_threads)
+
+
+def airy_zeros_Ai_deriv(n, with_values=False, threaded=True, num_threads=None):
+    r"""
+    Computes the first `n` zeros of the Airy function derivative :math:`Ai'(x)`, and optionally the Airy function
+    at each of them
+
+    The zeros are computed in parallel, those beyond the tabulated ones being refined by a Newton step. The
+    results are cached so that later calls for as many zeros or fewer cost nothing, and calls for more only compute
+    the missing ones.
+
+    Parameters
+    ----------
+    n: int
+        Number of zeros
+
+    with_values: bool, optional
+        If True, also returns :math:`Ai(a'_s)` at each zero :math:`a'_s`, computed in the same pass
+
+    threaded: bool, optional
+        If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    Returns
+    -------
+    ndarray
+        The first `n` zeros in decreasing order. The array is a read-only view of the cache
+
+    ndarray, optional
+        :math:`Ai(a'_s)` at each zero, read-only. Only returned if `with_values` is True
+
+    Examples
+    --------
+    >>> from scify.specfunc import airy_zeros_Ai_deriv
+    >>> zeros, values = airy_zeros_Ai_deriv(100000, with_values=True)
     """
-    return z.airy_zero_Bi_deriv(x, threaded)
+    return _airy_zeros(2, n, with_values, threaded, num_threads)
+
+
+def airy_zeros_Bi_deriv(n, with_values=False, threaded=True, num_threads=None):
+    r"""
+    Computes the first `n` zeros of the Airy function derivative :math:`Bi'(x)`, and optionally the Airy function
+    at each of them
+
+    The zeros are computed in parallel, those beyond the tabulated ones being refined by a Newton step. The
+    results are cached so that later calls for as many zeros or fewer cost nothing, and calls for more only compute
+    the missing ones.
+
+    Parameters
+    ----------
+    n: int
+        Number of zeros
+
+    with_values: bool, optional
+        If True, also returns :math:`Bi(b'_s)` at each zero :math:`b'_s`, computed in the same pass
+
+    threaded: bool, optional
+        If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    Returns
+    -------
+    ndarray
+        The first `n` zeros in decreasing order. The array is a read-only view of the cache
+
+    ndarray, optional
+        :math:`Bi(b'_s)` at each zero, read-only. Only returned if `with_values` is True
+
+    Examples
+    --------
+    >>> from scify.specfunc import airy_zeros_Bi_deriv
+    >>> zeros, values = airy_zeros_Bi_deriv(100000, with_values=True)
+    """
+    return _airy_zeros(3, n, with_values, threaded, num_threads)
+
+
+def _airy_zeros(kind, n, with_values, threaded, num_threads):
+    assert isinstance(n, Integral) and n >= 0, "Number of zeros must be a non-negative integer"
+    assert num_threads is None or num_threads > 0, "Number of threads must be positive"
+
+    with _ZEROS_LOCK:
+        zeros, values = _ZEROS.get(kind, (np.empty(0), np.empty(0)))
+        start = len(zeros)
+
+        if start < n:
+            # only the zeros missing from the cache are computed
+            zeros, values = np.resize(zeros, n), np.resize(values, n)
+            threads = (num_threads or get_num_threads()) if threaded else 1
+            z.airy_zeros(kind, start + 1, zeros[start:], values[start:], threads)
+            zeros.flags.writeable = values.flags.writeable = False
+            _ZEROS[kind] = zeros, values
+
+    return (zeros[:n], values[:n]) if with_values else zeros[:n]
@@ -0,0 +1,73 @@
+# The public C API of scify.specfunc, for compiled code evaluating the functions one element at a time without the
+# interpreter. From Cython,
+#
+#     from scify.specfunc cimport airy_Ai, debye_n_e
+#
+# The functions are also exported as PyCapsules in the __pyx_capi__ table of scify.specfunc.capi, see its docstring.
+#
+# Each function has a value only form and an _e form which also stores the absolute error estimate of the value in
+# err, unless it is NULL. All are noexcept and nogil, and may be called from any thread. Arguments outside of the
+# domain of a function give nan. The declarations below are kept stable from one release to the next; new functions
+# are only ever added.
+
+cdef:
+    # Airy functions and their derivatives, and exp(2/3 x^1.5) Ai, exp(-2/3 x^1.5) Bi for x > 0 when scaled
+    double airy_Ai(double x) noexcept nogil
+    double airy_Ai_e(double x, double* err) noexcept nogil
+    double airy_Ai_scaled(double x) noexcept nogil
+    double airy_Ai_scaled_e(double x, double* err) noexcept nogil
+    double airy_Ai_deriv(double x) noexcept nogil
+    double airy_Ai_deriv_e(double x, double* err) noexcept nogil
+    double airy_Ai_deriv_scaled(double x) noexcept nogil
+    double airy_Ai_deriv_scaled_e(double x, double* err) noexcept nogil
+    double airy_Bi(double x) noexcept nogil
+    double airy_Bi_e(double x, double* err) noexcept nogil
+    double airy_Bi_scaled(double x) noexcept nogil
+    double airy_Bi_scaled_e(double x, double* err) noexcept nogil
+    double airy_Bi_deriv(double x) noexcept nogil
+    double airy_Bi_deriv_e(double x, double* err) noexcept nogil
+    double airy_Bi_deriv_scaled(double x) noexcept nogil
+    double airy_Bi_deriv_scaled_e(double x, double* err) noexcept nogil
+
+    # location of the s-th zero, s >= 1
+    double airy_zero_Ai(long long s) noexcept nogil
+    double airy_zero_Ai_e(long long s, double* err) noexcept nogil
+    double airy_zero_Ai_deriv(long long s) noexcept nogil
+    double airy_zero_Ai_deriv_e(long long s, double* err) noexcept nogil
+    double airy_zero_Bi(long long s) noexcept nogil
+    double airy_zero_Bi_e(long long s, double* err) noexcept nogil
+    double airy_zero_Bi_deriv(long long s) noexcept nogil
+    double airy_zero_Bi_deriv_e(long long s, double* err) noexcept nogil
+
+    # Clausen function, Cl_2(x)
+    double clausen(double x) noexcept nogil
+    double clausen_e(double x, double* err) noexcept nogil
+
+    # Debye functions of order 1 to 6 and of any order n >= 1, at full double precision
+    double debye_1(double x) noexcept nogil
+    double debye_1_e(double x, double* err) noexcept nogil
+    double debye_2(double x) noexcept nogil
+    double debye_2_e(double x, double* err) noexcept nogil
+    double debye_3(double x) noexcept nogil
+    double debye_3_e(double x, double* err) noexcept nogil
+    double debye_4(double x) noexcept nogil
+    double debye_4_e(double x, double* err) noexcept nogil
+    double debye_5(double x) noexcept nogil
+    double debye_5_e(double x, double* err) noexcept nogil
+    double debye_6(double x) noexcept nogil
+    double debye_6_e(double x, double* err) noexcept nogil
+    double debye_n(double x, long long n) noexcept nogil
+    double debye_n_e(double x, long long n, double* err) noexcept nogil
+
+    # real and complex dilogarithms, Li_2. The error of the complex one has the errors of the real and imaginary
+    # parts as its parts
+    double dilog(double x) noexcept nogil
+    double dilog_e(double x, double* err) noexcept nogil
+    double complex dilog_complex(double complex z) noexcept nogil
+    double complex dilog_complex_e(double complex z, double complex* err) noexcept nogil
+    # Li_2(x + iy) into real and imag, for callers without C99 complex numbers, such as Numba. Since API version 2
+    void dilog_complex_xy(double x, double y, double* real, double* imag) noexcept nogil
+
+    # Chebyshev series sum_k c_k T_k(y) - c_0 / 2 of the n coefficients c over [a, b], at x mapped to y in [-1, 1]
+    double cheb_eval(const double* c, size_t n, double x, double a, double b) noexcept nogil
+    double cheb_eval_e(const double* c, size_t n, double x, double a, double b, double* err) noexcept nogil
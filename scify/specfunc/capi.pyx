@@ -0,0 +1,244 @@
+"""
+The C API of the specfunc kernels, for compiled code evaluating the functions one element at a time without the
+interpreter. The functions are declared, with their forms and arguments, in capi.pxd, which is installed with the
+package. From Cython they are cimported from scify.specfunc or from this module,
+
+.. code-block:: cython
+
+    from cython.parallel import prange
+    from scify.specfunc cimport airy_Ai
+
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True):
+        y[i] = airy_Ai(x[i])
+
+Other code, e.g. in C or from ctypes, finds each function by name in the ``__pyx_capi__`` dict of this module. It
+holds a PyCapsule per function, whose name is the function's C signature as written by Cython, such as
+``"double (double, double *)"`` or ``"double (PY_LONG_LONG)"``, and whose pointer is the function's address.
+:data:`API_VERSION` is raised whenever functions are added.
+
+The Debye functions are evaluated at full double precision, whatever the ``rtol`` of an evaluation on the calling
+thread.
+"""
+
+from scify._specfunc._results cimport ComplexResult, Result
+from scify._specfunc.airy cimport _airy_Ai, _airy_Ai_scaled, _airy_Bi, _airy_Bi_scaled
+from scify._specfunc.airy_deriv cimport (_airy_Ai_deriv, _airy_Ai_deriv_scaled, _airy_Bi_deriv,
+                                         _airy_Bi_deriv_scaled)
+from scify._specfunc.airy_zero cimport _airy_zero_Ai, _airy_zero_Ai_deriv, _airy_zero_Bi, _airy_zero_Bi_deriv
+from scify._specfunc.cheb cimport cheb_eval_n, set_rtol
+from scify._specfunc.clausen cimport _clausen
+from scify._specfunc.debye cimport _debye_n
+from scify._specfunc.dilog cimport _dilog, _dilog_complex_xy
+
+API_VERSION = 2
+
+
+cdef inline double value(Result res, double* err) noexcept nogil:
+    if err != NULL:
+        err[0] = res.err
+    return res.val
+
+
+cdef inline Result debye(double x, long long n) noexcept nogil:
+    # D_n(x) with the thread's relative tolerance set to 0 for the call
+    cdef:
+        double prev = set_rtol(0)
+        Result res = _debye_n(x, n)
+
+    set_rtol(prev)
+    return res
+
+
+cdef double airy_Ai(double x) noexcept nogil:
+    return _airy_Ai(x).val
+
+
+cdef double airy_Ai_e(double x, double* err) noexcept nogil:
+    return value(_airy_Ai(x), err)
+
+
+cdef double airy_Ai_scaled(double x) noexcept nogil:
+    return _airy_Ai_scaled(x).val
+
+
+cdef double airy_Ai_scaled_e(double x, double* err) noexcept nogil:
+    return value(_airy_Ai_scaled(x), err)
+
+
+cdef double airy_Ai_deriv(double x) noexcept nogil:
+    return _airy_Ai_deriv(x).val
+
+
+cdef double airy_Ai_deriv_e(double x, double* err) noexcept nogil:
+    return value(_airy_Ai_deriv(x), err)
+
+
+cdef double airy_Ai_deriv_scaled(double x) noexcept nogil:
+    return _airy_Ai_deriv_scaled(x).val
+
+
+cdef double airy_Ai_deriv_scaled_e(double x, double* err) noexcept nogil:
+    return value(_airy_Ai_deriv_scaled(x), err)
+
+
+cdef double airy_Bi(double x) noexcept nogil:
+    return _airy_Bi(x).val
+
+
+cdef double airy_Bi_e(double x, double* err) noexcept nogil:
+    return value(_airy_Bi(x), err)
+
+
+cdef double airy_Bi_scaled(double x) noexcept nogil:
+    return _airy_Bi_scaled(x).val
+
+
+cdef double airy_Bi_scaled_e(double x, double* err) noexcept nogil:
+    return value(_airy_Bi_scaled(x), err)
+
+
+cdef double airy_Bi_deriv(double x) noexcept nogil:
+    return _airy_Bi_deriv(x).val
+
+
+cdef double airy_Bi_deriv_e(double x, double* err) noexcept nogil:
+    return value(_airy_Bi_deriv(x), err)
+
+
+cdef double airy_Bi_deriv_scaled(double x) noexcept nogil:
+    return _airy_Bi_deriv_scaled(x).val
+
+
+cdef double airy_Bi_deriv_scaled_e(double x, double* err) noexcept nogil:
+    return value(_airy_Bi_deriv_scaled(x), err)
+
+
+cdef double airy_zero_Ai(long long s) noexcept nogil:
+    return _airy_zero_Ai(s).val
+
+
+cdef double airy_zero_Ai_e(long long s, double* err) noexcept nogil:
+    return value(_airy_zero_Ai(s), err)
+
+
+cdef double airy_zero_Ai_deriv(long long s) noexcept nogil:
+    return _airy_zero_Ai_deriv(s).val
+
+
+cdef double airy_zero_Ai_deriv_e(long long s, double* err) noexcept nogil:
+    return value(_airy_zero_Ai_deriv(s), err)
+
+
+cdef double airy_zero_Bi(long long s) noexcept nogil:
+    return _airy_zero_Bi(s).val
+
+
+cdef double airy_zero_Bi_e(long long s, double* err) noexcept nogil:
+    return value(_airy_zero_Bi(s), err)
+
+
+cdef double airy_zero_Bi_deriv(long long s) noexcept nogil:
+    return _airy_zero_Bi_deriv(s).val
+
+
+cdef double airy_zero_Bi_deriv_e(long long s, double* err) noexcept nogil:
+    return value(_airy_zero_Bi_deriv(s), err)
+
+
+cdef double clausen(double x) noexcept nogil:
+    return _clausen(x).val
+
+
+cdef double clausen_e(double x, double* err) noexcept nogil:
+    return value(_clausen(x), err)
+
+
+cdef double debye_1(double x) noexcept nogil:
+    return debye(x, 1).val
+
+
+cdef double debye_1_e(double x, double* err) noexcept nogil:
+    return value(debye(x, 1), err)
+
+
+cdef double debye_2(double x) noexcept nogil:
+    return debye(x, 2).val
+
+
+cdef double debye_2_e(double x, double* err) noexcept nogil:
+    return value(debye(x, 2), err)
+
+
+cdef double debye_3(double x) noexcept nogil:
+    return debye(x, 3).val
+
+
+cdef double debye_3_e(double x, double* err) noexcept nogil:
+    return value(debye(x, 3), err)
+
+
+cdef double debye_4(double x) noexcept nogil:
+    return debye(x, 4).val
+
+
+cdef double debye_4_e(double x, double* err) noexcept nogil:
+    return value(debye(x, 4), err)
+
+
+cdef double debye_5(double x) noexcept nogil:
+    return debye(x, 5).val
+
+
+cdef double debye_5_e(double x, double* err) noexcept nogil:
+    return value(debye(x, 5), err)
+
+
+cdef double debye_6(double x) noexcept nogil:
+    return debye(x, 6).val
+
+
+cdef double debye_6_e(double x, double* err) noexcept nogil:
+    return value(debye(x, 6), err)
+
+
+cdef double debye_n(double x, long long n) noexcept nogil:
+    return debye(x, n).val
+
+
+cdef double debye_n_e(double x, long long n, double* err) noexcept nogil:
+    return value(debye(x, n), err)
+
+
+cdef double dilog(double x) noexcept nogil:
+    return _dilog(x).val
+
+
+cdef double dilog_e(double x, double* err) noexcept nogil:
+    return value(_dilog(x), err)
+
+
+cdef double complex dilog_complex(double complex z) noexcept nogil:
+    cdef ComplexResult c = _dilog_complex_xy(z.real, z.imag)
+    return c.real + 1j * c.imag
+
+
+cdef double complex dilog_complex_e(double complex z, double complex* err) noexcept nogil:
+    cdef ComplexResult c = _dilog_complex_xy(z.real, z.imag)
+    if err != NULL:
+        err[0] = c.real_err + 1j * c.imag_err
+    return c.real + 1j * c.imag
+
+
+cdef void dilog_complex_xy(double x, double y, double* real, double* imag) noexcept nogil:
+    cdef ComplexResult c = _dilog_complex_xy(x, y)
+    real[0] = c.real
+    imag[0] = c.imag
+
+
+cdef double cheb_eval(const double* c, size_t n, double x, double a, double b) noexcept nogil:
+    return cheb_eval_n(c, n, x, a, b).val
+
+
+cdef double cheb_eval_e(const double* c, size_t n, double x, double a, double b, double* err) noexcept nogil:
+    return value(cheb_eval_n(c, n, x, a, b), err)
@@ -1,8 +1,9 @@
-from scify.types import Real
+from scify.types import Real, SCALARS
 from .._specfunc import clausen as c
+from .._specfunc._results import evaluate
 
 
-def clausen(x, threaded=True) -> Real:
+def clausen(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     The Clausen function is defined by the following integral,
 
@@ -21,9 +22,35 @@ def clausen(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the Chebyshev series is truncated once the relative error is below `rtol`, which is faster. Near
+        the zeros at multiples of pi, the error is relative to the largest value of the function instead. Defaults to
+        0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Clausen output
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return c.clausen(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return c.clausen_scalar(x, rtol)
+
+    ufunc = c.clausen_e if with_error else c.clausen
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
@@ -1,13 +1,14 @@
-from scify.types import Real
-
 import numpy as np
 
+from scify.types import Real, SCALARS
 from .._specfunc import debye as d
+from .._specfunc._results import evaluate
 
-__all__ = ['debye_n', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5', 'debye_6']
+__all__ = ['debye_all', 'debye_n', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5', 'debye_6']
 
 
-def debye_n(x, order=1, threaded=True) -> Real:
+def debye_n(x, order=1, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:
     r"""
     Computes the nth order Debye function
 
@@ -22,33 +23,53 @@ def debye_n(x, order=1, threaded=True) -> Real:
     x: array_like
         Real values
 
-    order: {1, 2, 3, 4, 5, 6}
-        Order of the Debye function. Limited to 6.
+    order: int or array_like of int
+        Positive order of the Debye function. An array of orders is broadcast against `x`, so that each value can
+        have its own order. Orders 1 to 6 use dedicated Chebyshev expansions, higher orders a series in the
+        incomplete gamma function.
 
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    assert 1 <= order <= 6, "Debye order must be between [1, 6]"
-    if order == 1:
-        return debye_1(x, threaded)
-    elif order == 2:
-        return debye_2(x, threaded)
-    elif order == 3:
-        return debye_3(x, threaded)
-    elif order == 4:
-        return debye_4(x, threaded)
-    elif order == 5:  # pragma: no cover
-        return debye_5(x, threaded)
-    elif order == 6:  # pragma: no cover
-        return debye_6(x, threaded)
-
-
-def debye_1(x, threaded=True) -> Real:
+    if type(x) in SCALARS and type(order) is int and out is None and not (inplace or with_error):
+        return d.debye_n_scalar(x, order, rtol)
+
+    order = np.asarray(order)
+    assert np.issubdtype(order.dtype, np.integer) and np.all(order >= 1), "Debye order must be a positive integer"
+
+    ufunc = d.debye_n_e if with_error else d.debye_n
+    return evaluate(ufunc, x, order, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
+
+
+def debye_1(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:
     r"""
     Computes the first-order Debye function
 
@@ -64,15 +85,42 @@ def debye_1(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.debye_1(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.debye_1_scalar(x, rtol)
+
+    ufunc = d.debye_1_e if with_error else d.debye_1
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
 
 
-def debye_2(x, threaded=True) -> Real:
+def debye_2(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:
     r"""
     Computes the second-order Debye function
 
@@ -87,15 +135,42 @@ def debye_2(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.debye_2(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.debye_2_scalar(x, rtol)
+
+    ufunc = d.debye_2_e if with_error else d.debye_2
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
 
 
-def debye_3(x, threaded=True) -> Real:
+def debye_3(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:
     r"""
     Computes the third-order Debye function
 
@@ -111,15 +186,42 @@ def debye_3(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.debye_3(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.debye_3_scalar(x, rtol)
+
+    ufunc = d.debye_3_e if with_error else d.debye_3
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
 
 
-def debye_4(x, threaded=True) -> Real:
+def debye_4(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:
     r"""
     Computes the fourth-order Debye function
 
@@ -135,15 +237,42 @@ def debye_4(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.debye_4(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.debye_4_scalar(x, rtol)
+
+    ufunc = d.debye_4_e if with_error else d.debye_4
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
 
 
-def debye_5(x, threaded=True) -> Real:  # pragma: no cover
+def debye_5(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:  # pragma: no cover
     r"""
     Computes the fifth-order Debye function
 
@@ -159,15 +288,42 @@ def debye_5(x, threaded=True) -> Real:  # pragma: no cover
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.debye_5(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.debye_5_scalar(x, rtol)
+
+    ufunc = d.debye_5_e if with_error else d.debye_5
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
 
 
-def debye_6(x, threaded=True) -> Real:  # pragma: no cover
+def debye_6(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+            rtol=0.) -> Real:  # pragma: no cover
     r"""
     Computes the sixth-order Debye function
 
@@ -183,9 +339,110 @@ def debye_6(x, threaded=True) -> Real:  # pragma: no cover
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is several times faster
+        for x > 4 at tolerances such as 1e-8. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like
         Value of the Debye function
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
+    """
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.debye_6_scalar(x, rtol)
+
+    ufunc = d.debye_6_e if with_error else d.debye_6
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace,
+                    rtol=rtol)
+
+
+def debye_all(x, orders=(1, 2, 3, 4, 5, 6), threaded=True, out=None, with_error=False, num_threads=None, rtol=0.):
+    """
+    Computes several Debye functions of orders 1 to 6 in a single pass over `x`.
+
+    This is equivalent to calling :func:`debye_n` once per order, but each element is visited once and the work
+    common to the orders, such as the exponentials and the series of the mid-range, is shared.
+
+    For 4 < x < 708, the shared series is summed forward until its tail is below half a double ulp, whereas
+    :func:`debye_n` sums each order's series backward. The results differ by a few ulps there, up to about 6e-15
+    relative for order 6 just above 4, where the series cancels, and both are within their error estimates.
+    Elsewhere they are the same.
+
+    Parameters
+    ----------
+    x: array_like
+        Real values
+
+    orders: iterable of int, optional
+        The orders to compute, between 1 and 6. The results are returned in the given order. Defaults to all six.
+
+    threaded: bool, optional
+        If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
+
+    out: ndarray, optional
+        A location into which the result is stored, of shape ``(len(orders),) + x.shape``. If not provided, a
+        freshly-allocated array is returned. If `with_error` is True, it may be a tuple of two such arrays for the
+        values and the errors.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. Defaults to 0, full double
+        precision.
+
+    Returns
+    -------
+    ndarray
+        Values of the Debye functions, one row per order
+
+    ndarray, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
+
+    Examples
+    --------
+    >>> from scify.specfunc import debye_all
+    >>> d1, d3 = debye_all([0.5, 5., 50.], orders=(1, 3))
     """
-    return d.debye_6(x, threaded)
+    orders = tuple(int(o) for o in orders)
+    assert len(orders) > 0 and all(1 <= o <= 6 for o in orders), "Debye orders must be between [1, 6]"
+    assert len(set(orders)) == len(orders), "orders must not contain duplicates"
+
+    ufunc = d.debye_all_ufunc(sum(1 << (o - 1) for o in orders), with_error)
+    shape = (len(orders),) + np.shape(x)
+    dtype = np.float32 if getattr(x, 'dtype', None) == np.float32 else np.float64
+
+    out = (out,) if out is None or isinstance(out, np.ndarray) else tuple(out)
+    assert len(out) <= ufunc.nout // len(orders), "out must hold the values and optionally the errors"
+    blocks = []
+    for i in range(ufunc.nout // len(orders)):
+        block = out[i] if i < len(out) and out[i] is not None else np.empty(shape, dtype)
+        assert block.shape == shape, f"out must have shape {shape}"
+        blocks.append(block)
+
+    # the ufunc's outputs are in increasing order
+    rows = [orders.index(o) for o in sorted(orders)]
+    evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=tuple(b[r, ...] for b in blocks for r in rows),
+             rtol=rtol)
+    return tuple(blocks) if with_error else blocks[0]
@@ -1,10 +1,9 @@
-import numpy as np
-
-from scify.types import Complex, Real
+from scify.types import COMPLEX_SCALARS, Complex, Real, SCALARS
 from .._specfunc import dilog as d
+from .._specfunc._results import evaluate
 
 
-def dilog(x, threaded=True) -> Real:
+def dilog(x, threaded=True, out=None, inplace=False, with_error=False, num_threads=None, rtol=0.) -> Real:
     r"""
     Computes the dilogarithm for a real argument. In Lewin’s notation this is  :math:`Li_2(x)`,
     the real part of the dilogarithm of a real :math:`x`. It is defined by the integral
@@ -20,15 +19,41 @@ def dilog(x, threaded=True) -> Real:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `x`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the relative error is below `rtol`. This is about twice as fast at
+        tolerances such as 1e-6. Defaults to 0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Real Dilog output
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
-    return d.dilog(x, threaded)
+    if type(x) in SCALARS and out is None and not (inplace or with_error):
+        return d.dilog_scalar(x, rtol)
+
+    ufunc = d.dilog_e if with_error else d.dilog
+    return evaluate(ufunc, x, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
 
-def dilog_complex(r, theta=None, threaded=True) -> Complex:
+def dilog_complex(r, theta=None, threaded=True, out=None, inplace=False, with_error=False, num_threads=None,
+                  rtol=0.) -> Complex:
     r"""
     This function computes the full complex-valued dilogarithm for the complex argument
     :math:`z = r \exp^{i \theta}`.
@@ -44,13 +69,39 @@ def dilog_complex(r, theta=None, threaded=True) -> Complex:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `r`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    rtol: float, optional
+        If positive, the series are stopped once the error relative to the modulus of the result is below `rtol`.
+        Most of the time goes into the logarithms the series is taken in, so this is only faster for |z| < 1.
+        Defaults to 0, full double precision.
+
     Returns
     -------
     array_like or scalar
         Complex Dilog output
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
     if theta is None:
-        theta = np.angle(r)
-        r = np.abs(r)
+        if type(r) in COMPLEX_SCALARS and out is None and not (inplace or with_error):
+            return d.dilog_complex_scalar(r, rtol)
+
+        ufunc = d.dilog_complex_e if with_error else d.dilog_complex
+        return evaluate(ufunc, r, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
 
-    return d.dilog_complex(r, theta, threaded)
+    ufunc = d.dilog_complex_polar_e if with_error else d.dilog_complex_polar
+    return evaluate(ufunc, r, theta, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace, rtol=rtol)
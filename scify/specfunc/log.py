@@ -1,12 +1,12 @@
-import numpy as np
-
 from scify.types import Complex
 from .._specfunc import log as sl
+from .._specfunc._results import evaluate
 
 __all__ = ['complex_log']
 
 
-def complex_log(zr: Complex, zi=None, threaded=True) -> Complex:
+def complex_log(zr: Complex, zi=None, threaded=True, out=None, inplace=False, with_error=False,
+                num_threads=None) -> Complex:
     r"""
     Function returns the complex natural logarithm (base e) of the complex number z, :math:`\log(z)`.
 
@@ -23,13 +23,31 @@ def complex_log(zr: Complex, zi=None, threaded=True) -> Complex:
     threaded: bool, optional
         If True, uses multi-threading. Multi-threading is supported by the OpenMP api.
 
+    out: ndarray, optional
+        A location into which the result is stored. Its shape must be one that the inputs broadcast to. If not
+        provided, a freshly-allocated array is returned. The input is never modified unless `inplace` is True.
+
+    inplace: bool, optional
+        If True, the result is written back into `zr`, which must be an array that can hold the result.
+
+    with_error: bool, optional
+        If True, also returns the absolute error estimate of each value. It is computed in the same pass.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
     Returns
     -------
     array_like or scalar
         Complex Dilog output
+
+    array_like or scalar, optional
+        Absolute error estimates of the values. Only returned if `with_error` is True
     """
     if zi is None:
-        zi = np.imag(zr)
-        zr = np.real(zr)
+        ufunc = sl.complex_log_e if with_error else sl.complex_log
+        return evaluate(ufunc, zr, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace)
 
-    return sl.complex_log(zr, zi, threaded)
+    ufunc = sl.complex_log_rect_e if with_error else sl.complex_log_rect
+    return evaluate(ufunc, zr, zi, threaded=threaded, num_threads=num_threads, out=out, inplace=inplace)
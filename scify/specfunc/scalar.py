@@ -0,0 +1,38 @@
+"""
+The specfunc kernels for a single value.
+
+Unlike the wrappers in :mod:`scify.specfunc`, these take one Python number and return a Python float (complex for
+:func:`dilog_complex`), calling the kernel directly without NumPy. They are meant for code evaluating the functions
+one value at a time, where the conversion to and from arrays would cost many times the evaluation itself. The
+wrappers take the same path when given a single float or int without ``out``, ``inplace`` or ``with_error``, so
+this module saves only the few checks they make first.
+
+There are no error estimates, and ``rtol`` applies to the call only.
+
+Examples
+--------
+>>> from scify.specfunc.scalar import airy_Ai, debye_n
+>>> round(airy_Ai(0.5), 12)
+0.231693606481
+>>> round(debye_n(2.5, 9, rtol=1e-8), 6)
+0.267835
+"""
+
+from .._specfunc.airy import (airy_Ai_scalar as airy_Ai, airy_Ai_scaled_scalar as airy_Ai_scaled,
+                              airy_Bi_scalar as airy_Bi, airy_Bi_scaled_scalar as airy_Bi_scaled)
+from .._specfunc.airy_deriv import (airy_Ai_deriv_scalar as airy_Ai_deriv,
+                                    airy_Ai_deriv_scaled_scalar as airy_Ai_deriv_scaled,
+                                    airy_Bi_deriv_scalar as airy_Bi_deriv,
+                                    airy_Bi_deriv_scaled_scalar as airy_Bi_deriv_scaled)
+from .._specfunc.airy_zero import (airy_zero_Ai_scalar as airy_zero_Ai, airy_zero_Ai_deriv_scalar as airy_zero_Ai_deriv,
+                                   airy_zero_Bi_scalar as airy_zero_Bi, airy_zero_Bi_deriv_scalar as airy_zero_Bi_deriv)
+from .._specfunc.clausen import clausen_scalar as clausen
+from .._specfunc.debye import (debye_1_scalar as debye_1, debye_2_scalar as debye_2, debye_3_scalar as debye_3,
+                               debye_4_scalar as debye_4, debye_5_scalar as debye_5, debye_6_scalar as debye_6,
+                               debye_n_scalar as debye_n)
+from .._specfunc.dilog import dilog_complex_scalar as dilog_complex, dilog_scalar as dilog
+
+__all__ = ['airy_Ai', 'airy_Ai_scaled', 'airy_Ai_deriv', 'airy_Ai_deriv_scaled', 'airy_zero_Ai', 'airy_zero_Ai_deriv',
+           'airy_Bi', 'airy_Bi_scaled', 'airy_Bi_deriv', 'airy_Bi_deriv_scaled', 'airy_zero_Bi', 'airy_zero_Bi_deriv',
+           'clausen', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5', 'debye_6', 'debye_n', 'dilog',
+           'dilog_complex']
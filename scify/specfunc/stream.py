@@ -0,0 +1,153 @@
+"""
+Evaluates the specfunc functions over arrays which do not fit in memory, such as memory-mapped `.npy` files, one
+chunk at a time. The next chunk is read and the previous one written by background threads while the current one
+is evaluated, so that memory use is bounded by a few chunks whatever the size of the arrays.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .._specfunc._results import evaluate as _evaluate
+
+__all__ = ['stream']
+
+CHUNK_BYTES = 1 << 25
+
+
+def stream(func, src, dst=None, chunk_bytes=CHUNK_BYTES, dtype=None, threaded=True, num_threads=None, **kwargs):
+    """
+    Evaluates a function over an array chunk by chunk, with bounded memory
+
+    Parameters
+    ----------
+    func: callable
+        A function of `scify.specfunc` taking a single array, such as :func:`debye_3`, or one of the ufuncs in
+        `scify.specfunc.ufuncs`
+
+    src: array_like or str
+        Input array, typically a memory-mapped array as returned by ``np.load(path, mmap_mode='r')``. If a path, a
+        `.npy` file is memory-mapped, any other file is read as raw binary data of type `dtype`.
+
+    dst: ndarray or str or tuple, optional
+        Location into which the result is stored. If a path, a `.npy` file is created, any other file is written as
+        raw binary data. Functions returning several arrays, for instance with `with_error`, take a tuple. If not
+        provided, the result is returned in a freshly-allocated array.
+
+    chunk_bytes: int, optional
+        Size in bytes of the input chunks. Four chunks of the input and the output are held in memory at a time.
+
+    dtype: dtype, optional
+        Data type of `src` if it is a raw binary file. Defaults to float64.
+
+    threaded: bool, optional
+        If True, uses multi-threading to evaluate each chunk. Multi-threading is supported by the OpenMP api.
+
+    num_threads: int, optional
+        Number of threads to use. Defaults to the current setting, see :func:`scify.set_num_threads`. Ignored if
+        `threaded` is False.
+
+    kwargs
+        Other arguments passed to `func`, for instance `with_error`
+
+    Returns
+    -------
+    ndarray or tuple of ndarray
+        The result, memory-mapped if `dst` is a path
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scify.specfunc import debye_3, stream
+    >>> x = np.load('x.npy', mmap_mode='r')  # doctest: +SKIP
+    >>> stream(debye_3, x, 'debye_3.npy')  # doctest: +SKIP
+    """
+    assert chunk_bytes > 0, "Chunk size must be positive"
+    src = _open_src(src, dtype)
+
+    def evaluate(x, out=None):
+        if isinstance(func, np.ufunc):
+            return _evaluate(func, x, threaded=threaded, num_threads=num_threads, out=out, **kwargs)
+        return func(x, threaded=threaded, out=out, num_threads=num_threads, **kwargs)
+
+    probe = evaluate(src.reshape(-1)[:0])
+    single = not isinstance(probe, tuple)
+    dtypes = [p.dtype for p in ((probe,) if single else probe)]
+
+    if dst is None:
+        dst = [np.empty(src.shape, t) for t in dtypes]
+    else:
+        dst = [_open_dst(d, src.shape, t) for d, t in zip((dst,) if single else dst, dtypes)]
+        assert len(dst) == len(dtypes), f"Function returns {len(dtypes)} arrays but {len(dst)} outputs were given"
+
+    if src.flags.c_contiguous and all(d.flags.c_contiguous for d in dst):
+        # chunks are then contiguous slices of the files, whatever the number of dimensions
+        x, ys = src.reshape(-1), [d.reshape(-1) for d in dst]
+    else:
+        x, ys = np.atleast_1d(src), [np.atleast_1d(d) for d in dst]
+
+    row_bytes = max(1, int(np.prod(x.shape[1:]))) * max([x.itemsize] + [t.itemsize for t in dtypes])
+    rows = max(1, chunk_bytes // row_bytes)
+    _stream(evaluate, x, ys, rows)
+
+    for d in dst:
+        if isinstance(d, np.memmap):
+            d.flush()
+    return dst[0] if single else tuple(dst)
+
+
+def _stream(evaluate, x, ys, rows):
+    """Evaluates the chunks of `rows` rows of x into ys, reading and writing in the background"""
+    chunks = [slice(i, min(i + rows, len(x))) for i in range(0, len(x), rows)]
+    if not chunks:
+        return
+
+    shape = (min(rows, len(x)),) + x.shape[1:]
+    inputs = [np.empty(shape, x.dtype) for _ in range(2)]
+    outputs = [[np.empty(shape, y.dtype) for y in ys] for _ in range(2)]
+
+    def read(i):
+        buf = inputs[i % 2][:chunks[i].stop - chunks[i].start]
+        np.copyto(buf, x[chunks[i]])
+        return buf
+
+    def write(i, bufs):
+        for y, buf in zip(ys, bufs):
+            np.copyto(y[chunks[i]], buf)
+
+    with ThreadPoolExecutor(1) as reader, ThreadPoolExecutor(1) as writer:
+        pending = reader.submit(read, 0)
+        written = None
+        for i in range(len(chunks)):
+            buf = pending.result()
+            if i + 1 < len(chunks):
+                pending = reader.submit(read, i + 1)
+
+            out = tuple(o[:len(buf)] for o in outputs[i % 2])
+            evaluate(buf, out=out[0] if len(out) == 1 else out)
+
+            # the other output buffers are reused by the next chunk once they have been written
+            if written is not None:
+                written.result()
+            written = writer.submit(write, i, out)
+        written.result()
+
+
+def _open_src(src, dtype=None):
+    if isinstance(src, (str, os.PathLike)):
+        if str(src).endswith('.npy'):
+            return np.load(src, mmap_mode='r')
+        return np.memmap(src, dtype=dtype or np.float64, mode='r')
+    return np.asanyarray(src)
+
+
+def _open_dst(dst, shape, dtype):
+    if isinstance(dst, (str, os.PathLike)):
+        if str(dst).endswith('.npy'):
+            return np.lib.format.open_memmap(dst, mode='w+', dtype=dtype, shape=shape)
+        return np.memmap(dst, dtype=dtype, mode='w+', shape=shape)
+
+    assert isinstance(dst, np.ndarray), "Output must be a numpy array or a path"
+    assert dst.shape == shape, f"Output has shape {dst.shape} but the input has shape {shape}"
+    return dst
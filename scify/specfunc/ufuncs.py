@@ -0,0 +1,50 @@
+"""
+The specfunc kernels as NumPy universal functions.
+
+Unlike the wrappers in :mod:`scify.specfunc`, these are :class:`numpy.ufunc` objects. They broadcast their
+arguments, accept the standard ufunc keywords such as ``out``, ``where`` and ``dtype``, iterate over strided
+and N-dimensional inputs without copying them and defer to ``__array_ufunc__`` overrides (e.g. xarray, dask).
+
+Every function has a ``_e`` counterpart with two outputs, the value and its absolute error estimate.
+
+float32 and complex64 arguments are not upcast. They are evaluated with the Chebyshev series truncated to single
+precision accuracy and return float32 and complex64 results, halving the memory used by large arrays. The results
+are within about one float32 ulp, except those of the Airy functions for x < -1: there they oscillate, and as with
+their ``rtol``, the error is relative to their modulus, so that near their zeros it is many ulps of the value.
+NumPy also takes the single precision loops for bool, the small integer types and float16, which cast safely to
+float32; pass ``dtype=np.float64`` (``np.complex128`` for the complex functions) to evaluate them in double
+precision, as the wrappers do.
+
+Examples
+--------
+>>> import numpy as np
+>>> from scify.specfunc.ufuncs import airy_Ai, airy_Ai_e
+>>> out = np.empty(3)
+>>> _ = airy_Ai(np.array([-1., 0., 1.]), out=out)
+>>> val, err = airy_Ai_e(np.array([-1., 0., 1.]))
+"""
+
+from .._specfunc.airy import (airy_Ai, airy_Ai_e, airy_Ai_scaled, airy_Ai_scaled_e, airy_Bi, airy_Bi_e,
+                              airy_Bi_scaled, airy_Bi_scaled_e)
+from .._specfunc.airy_all import airy_all, airy_all_e, airy_all_scaled, airy_all_scaled_e
+from .._specfunc.airy_deriv import (airy_Ai_deriv, airy_Ai_deriv_e, airy_Ai_deriv_scaled, airy_Ai_deriv_scaled_e,
+                                    airy_Bi_deriv, airy_Bi_deriv_e, airy_Bi_deriv_scaled, airy_Bi_deriv_scaled_e)
+from .._specfunc.airy_zero import (airy_zero_Ai, airy_zero_Ai_e, airy_zero_Ai_deriv, airy_zero_Ai_deriv_e,
+                                   airy_zero_Bi, airy_zero_Bi_e, airy_zero_Bi_deriv, airy_zero_Bi_deriv_e)
+from .._specfunc.clausen import clausen, clausen_e
+from .._specfunc.debye import (debye_1, debye_1_e, debye_2, debye_2_e, debye_3, debye_3_e, debye_4, debye_4_e,
+                               debye_5, debye_5_e, debye_6, debye_6_e, debye_all, debye_all_e, debye_n, debye_n_e)
+from .._specfunc.dilog import (dilog, dilog_e, dilog_complex, dilog_complex_e, dilog_complex_polar,
+                               dilog_complex_polar_e)
+from .._specfunc.log import complex_log, complex_log_e, complex_log_rect, complex_log_rect_e
+
+__all__ = ['airy_Ai', 'airy_Ai_scaled', 'airy_Ai_deriv', 'airy_Ai_deriv_scaled', 'airy_zero_Ai', 'airy_zero_Ai_deriv',
+           'airy_Bi', 'airy_Bi_scaled', 'airy_Bi_deriv', 'airy_Bi_deriv_scaled', 'airy_zero_Bi', 'airy_zero_Bi_deriv',
+           'clausen', 'complex_log', 'complex_log_rect', 'debye_1', 'debye_2', 'debye_3', 'debye_4', 'debye_5',
+           'debye_6', 'debye_n', 'dilog', 'dilog_complex', 'dilog_complex_polar',
+           'airy_Ai_e', 'airy_Ai_scaled_e', 'airy_Ai_deriv_e', 'airy_Ai_deriv_scaled_e', 'airy_zero_Ai_e',
+           'airy_zero_Ai_deriv_e', 'airy_Bi_e', 'airy_Bi_scaled_e', 'airy_Bi_deriv_e', 'airy_Bi_deriv_scaled_e',
+           'airy_zero_Bi_e', 'airy_zero_Bi_deriv_e', 'clausen_e', 'complex_log_e', 'complex_log_rect_e', 'debye_1_e',
+           'debye_2_e', 'debye_3_e', 'debye_4_e', 'debye_5_e', 'debye_6_e', 'debye_n_e', 'dilog_e', 'dilog_complex_e',
+           'dilog_complex_polar_e', 'airy_all', 'airy_all_e', 'airy_all_scaled', 'airy_all_scaled_e', 'debye_all',
+           'debye_all_e']
@@ -4,3 +4,7 @@ from numpy import ndarray
 
 Real = Union[ndarray, Iterable, float, int]
 Complex = Union[ndarray, Iterable, float, int, complex]
+
+# types of the single values the specfunc wrappers evaluate directly by the scalar kernels, without NumPy
+SCALARS = (float, int)
+COMPLEX_SCALARS = (complex, float, int)
@@ -13,6 +13,14 @@ for e in argv:
         _, ENV = e.upper().split('=')
         argv.remove(e)
 
+# --trace builds the extensions for line tracing and profiling by Python tools, --stats with the instrumentation read
+# by scify.stats(). Both slow the kernels down, so neither is on by default
+TRACE = '--trace' in argv
+STATS = '--stats' in argv
+for e in ('--trace', '--stats'):
+    if e in argv:
+        argv.remove(e)
+
 IS_DEV_MODE = ENV == 'DEV'
 
 try:
@@ -38,11 +46,11 @@ def build_extensions():
     macros = [('NPY_NO_DEPRECATED_API', '1'),
               ('NPY_1_7_API_VERSION', '1')]
 
-    if IS_DEV_MODE:
+    if TRACE:
         macros.append(('CYTHON_TRACE', '1'))
 
-    if IS_DEV_MODE:
-        macros.append(('CYTHON_TRACE', '1'))
+    if STATS:
+        macros.append(('SCIFY_STATS', '1'))
 
     if platform.system() == 'Windows':
         parallelism_options = {'extra_compile_args': ['/openmp']}
@@ -81,8 +89,8 @@ def build_extensions():
         'nonecheck': False,
         'cdivision': True,
         'language_level': '3',
-        'linetrace': IS_DEV_MODE,
-        'profile': IS_DEV_MODE,
+        'linetrace': TRACE,
+        'profile': TRACE,
     }
     return cythonize(extensions, compiler_directives=compiler_directives)
 
@@ -112,6 +120,7 @@ setup(
         'Programming Language :: Python :: 3.7',
     ],
     description="Scientific functions for Python",
+    extras_require={'numba': ['numba >=0.49']},
     install_requires=requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history,
@@ -126,4 +135,6 @@ setup(
     version='0.1.0',
     zip_safe=False,
     ext_modules=build_extensions(),
+    # registers the overloads of scify.specfunc in jitted code when Numba is installed
+    entry_points={'numba_extensions': ['init = scify.specfunc._numba:_init_extension']},
 )
@@ -0,0 +1,212 @@
+"""
+Benchmarks of every function of `scify.specfunc` over the size of the input, the number of threads, the layout of the
+input in memory and the regime of the input, that is the branch of the function which evaluates it.
+
+Each benchmark records the elements evaluated per second in its extra info, and those on a single element measure the
+overhead of a call, as does the 'scalar' group for the scalar kernels against math.exp. The 'import' group times a new
+interpreter importing the package, against one importing nothing. `make benchmark-baseline` saves the timings which
+`make benchmark` compares against, failing on a regression beyond its threshold. Inputs of more than 10^6 elements are
+only run up to SCIFY_BENCHMARK_MAX_SIZE elements, e.g. SCIFY_BENCHMARK_MAX_SIZE=100000000 for the largest, which take
+about 2 GB.
+"""
+
+import math
+import os
+import subprocess
+import sys
+from functools import partial
+
+import numpy as np
+import pytest
+
+import scify
+import scify.specfunc as sf
+import scify.specfunc.scalar as scalar
+from scify.specfunc import airy
+
+MAX_SIZE = int(float(os.environ.get('SCIFY_BENCHMARK_MAX_SIZE', 1e6)))
+SIZES = [1, 10 ** 2, 10 ** 4, 10 ** 6, 10 ** 8]
+THREADS = sorted({n for n in (1, 2, 4, os.cpu_count() or 1) if n <= (os.cpu_count() or 1)})
+LAYOUTS = ['contiguous', 'strided', 'reversed', 'transposed']
+SIZE = 10 ** 6  # of the layout and regime benchmarks
+
+
+def uniform(lo, hi):
+    return lambda rs, n: rs.uniform(lo, hi, n)
+
+
+def annulus(lo, hi):
+    return lambda rs, n: np.sqrt(rs.uniform(lo ** 2, hi ** 2, n)) * np.exp(1j * rs.uniform(-np.pi, np.pi, n))
+
+
+def index(lo, hi):
+    return lambda rs, n: rs.randint(lo, hi, n).astype(np.int64)
+
+
+AIRY_AI = {'oscillating': uniform(-50, -2), 'near': uniform(-2, -1), 'series': uniform(-1, 1),
+           'decaying': uniform(1, 50)}
+AIRY_BI = {'oscillating': uniform(-50, -2), 'near': uniform(-2, -1), 'series': uniform(-1, 1),
+           'series_2': uniform(1, 2), 'growth': uniform(2, 4), 'growth_2': uniform(4, 50)}
+AIRY_AI_DERIV = {'oscillating': uniform(-50, -4), 'near': uniform(-4, -2), 'near_2': uniform(-2, -1),
+                 'series': uniform(-1, 1), 'decaying': uniform(1, 4), 'decaying_2': uniform(4, 50)}
+AIRY_BI_DERIV = {'oscillating': uniform(-50, -1), 'series': uniform(-1, 2), 'growth': uniform(2, 50)}
+AIRY_ZERO = {'table': index(1, 100), 'asymptotic': index(100, 10 ** 6)}
+DEBYE = {'series': uniform(0, 4), 'sum': uniform(4, 36), 'asymptotic': uniform(36, 708), 'limit': uniform(708, 1e4)}
+
+# function, its regimes
+FUNCTIONS = {
+    'airy_Ai': (sf.airy_Ai, AIRY_AI),
+    'airy_Ai_scaled': (sf.airy_Ai_scaled, AIRY_AI),
+    'airy_Ai_deriv': (sf.airy_Ai_deriv, AIRY_AI_DERIV),
+    'airy_Ai_deriv_scaled': (sf.airy_Ai_deriv_scaled, AIRY_AI_DERIV),
+    'airy_Bi': (sf.airy_Bi, AIRY_BI),
+    'airy_Bi_scaled': (sf.airy_Bi_scaled, AIRY_BI),
+    'airy_Bi_deriv': (sf.airy_Bi_deriv, AIRY_BI_DERIV),
+    'airy_Bi_deriv_scaled': (sf.airy_Bi_deriv_scaled, AIRY_BI_DERIV),
+    'airy_all': (sf.airy_all, AIRY_BI),
+    'airy_zero_Ai': (sf.airy_zero_Ai, AIRY_ZERO),
+    'airy_zero_Ai_deriv': (sf.airy_zero_Ai_deriv, AIRY_ZERO),
+    'airy_zero_Bi': (sf.airy_zero_Bi, AIRY_ZERO),
+    'airy_zero_Bi_deriv': (sf.airy_zero_Bi_deriv, AIRY_ZERO),
+    'clausen': (sf.clausen, {'principal': uniform(-6, 6)}),
+    'debye_1': (sf.debye_1, DEBYE),
+    'debye_2': (sf.debye_2, DEBYE),
+    'debye_3': (sf.debye_3, DEBYE),
+    'debye_4': (sf.debye_4, DEBYE),
+    'debye_5': (sf.debye_5, DEBYE),
+    'debye_6': (sf.debye_6, DEBYE),
+    'debye_n': (partial(sf.debye_n, order=12), DEBYE),
+    'debye_all': (sf.debye_all, DEBYE),
+    'dilog': (sf.dilog, {'negative': uniform(-5, 0), 'series': uniform(0, 0.5), 'reflected': uniform(0.5, 1),
+                         'above_one': uniform(1, 2), 'inverted': uniform(2, 10)}),
+    'dilog_complex': (sf.dilog_complex, {'unit_disk': annulus(0, 1), 'outside': annulus(1, 5)}),
+}
+
+# evaluated from counts of zeros and from files rather than arrays, see their own benchmarks
+AIRY_ZEROS = ['airy_zeros_Ai', 'airy_zeros_Ai_deriv', 'airy_zeros_Bi', 'airy_zeros_Bi_deriv']
+OTHERS = AIRY_ZEROS + ['stream']
+
+
+def mixed(regimes, rs, n):
+    """Input drawn from all the regimes of a function, in random order"""
+    parts = [sample(rs, n // len(regimes) + 1) for sample in regimes.values()]
+    return rs.permutation(np.concatenate(parts))[:n]
+
+
+def make_input(name, n, regime=None, layout='contiguous'):
+    rs = np.random.RandomState(8)
+    regimes = FUNCTIONS[name][1]
+
+    if layout == 'strided':
+        return make_input(name, 2 * n, regime)[::2]
+    if layout == 'reversed':
+        return make_input(name, n, regime)[::-1]
+    if layout == 'transposed':
+        rows = int(np.sqrt(n))
+        return make_input(name, n, regime).reshape(rows, -1).T
+
+    return regimes[regime](rs, n) if regime else mixed(regimes, rs, n)
+
+
+def run(benchmark, group, f, x, size, **kwargs):
+    benchmark.group = group
+    benchmark(f, x, **kwargs)
+    if benchmark.stats:
+        benchmark.extra_info['elements_per_second'] = size / benchmark.stats.stats.mean
+
+
+def skip_large(size):
+    if size > MAX_SIZE:
+        pytest.skip(f"evaluates {size} elements, set SCIFY_BENCHMARK_MAX_SIZE to run")
+
+
+def test_benchmark_coverage():
+    public = {name for name in dir(sf)
+              if not name.startswith('_') and getattr(getattr(sf, name), '__module__', '').startswith('scify.specfunc')}
+    assert public - {'Complex', 'Real'} == set(FUNCTIONS) | set(OTHERS)
+
+
+@pytest.mark.parametrize('name', list(FUNCTIONS))
+def test_benchmark_overhead(benchmark, name):
+    x = make_input(name, 1)[0].item()
+    run(benchmark, 'overhead', FUNCTIONS[name][0], x, 1)
+
+
+@pytest.mark.parametrize('name', ['math.exp'] + scalar.__all__)
+def test_benchmark_scalar(benchmark, name):
+    # latency of a call of the scalar kernels, against that of math.exp
+    if name == 'math.exp':
+        f, x = math.exp, 0.5
+    else:
+        f = partial(scalar.debye_n, n=12) if name == 'debye_n' else getattr(scalar, name)
+        x = make_input(name, 1)[0].item()
+    run(benchmark, 'scalar', f, x, 1)
+
+
+@pytest.mark.parametrize('statement', ['pass', 'import scify.specfunc', 'from scify.specfunc import airy_Ai',
+                                       'import numpy'])
+def test_benchmark_import(benchmark, statement):
+    # the submodules are imported lazily, so importing the package should cost little over starting the interpreter
+    benchmark.group = 'import'
+    benchmark.pedantic(subprocess.run, ([sys.executable, '-c', statement],), kwargs={'check': True}, rounds=10)
+
+
+@pytest.mark.parametrize('size', SIZES)
+@pytest.mark.parametrize('threads', THREADS)
+@pytest.mark.parametrize('name', list(FUNCTIONS))
+def test_benchmark_size(benchmark, name, threads, size):
+    skip_large(size)
+    if threads > 1 and size < scify.get_serial_threshold():
+        pytest.skip("evaluated serially below the serial threshold")
+
+    x = make_input(name, size)
+    run(benchmark, f'{name}-size', FUNCTIONS[name][0], x, size, threaded=threads > 1, num_threads=threads)
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+@pytest.mark.parametrize('name', list(FUNCTIONS))
+def test_benchmark_layout(benchmark, name, layout):
+    x = make_input(name, SIZE, layout=layout)
+    run(benchmark, f'{name}-layout', FUNCTIONS[name][0], x, SIZE, threaded=False)
+
+
+@pytest.mark.parametrize('name, regime', [(name, regime) for name, (_, regimes) in FUNCTIONS.items()
+                                          for regime in regimes])
+def test_benchmark_regime(benchmark, name, regime):
+    x = make_input(name, SIZE, regime)
+    run(benchmark, f'{name}-regime', FUNCTIONS[name][0], x, SIZE, threaded=False)
+
+
+@pytest.mark.parametrize('size', [10 ** 2, 10 ** 4, 10 ** 6])
+@pytest.mark.parametrize('name', AIRY_ZEROS)
+def test_benchmark_airy_zeros(benchmark, name, size):
+    # the zeros are cached, so the cache is emptied before each round
+    benchmark.group = 'airy_zeros'
+    benchmark.pedantic(getattr(sf, name), (size,), setup=airy._ZEROS.clear, rounds=5)
+    if benchmark.stats:
+        benchmark.extra_info['elements_per_second'] = size / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize('engine', ['numba', 'ufunc'])
+def test_benchmark_numba(benchmark, engine):
+    # a jitted loop calling the kernels through the Numba overloads, against the ufunc on the same points
+    numba = pytest.importorskip('numba')
+    pytest.importorskip('scify.specfunc._numba')  # registered by the entry point once scify is installed
+    x = make_input('debye_3', SIZE)
+    if engine == 'numba':
+        f = numba.njit(lambda x: sf.airy_Ai(x) + sf.debye_3(x))
+        f(x[:1])
+    else:
+        def f(x):
+            return sf.airy_Ai(x, threaded=False) + sf.debye_3(x, threaded=False)
+    run(benchmark, 'numba', f, x, SIZE)
+
+
+@pytest.mark.parametrize('size', [10 ** 6, 10 ** 8])
+def test_benchmark_stream(benchmark, tmp_path, size):
+    skip_large(size)
+    src = np.lib.format.open_memmap(tmp_path / 'x.npy', mode='w+', shape=(size,))
+    src[:] = make_input('debye_3', size)
+    src.flush()
+
+    run(benchmark, 'stream', sf.stream, sf.debye_3, size, src=str(tmp_path / 'x.npy'), dst=str(tmp_path / 'y.npy'))
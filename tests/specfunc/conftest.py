@@ -2,13 +2,13 @@ import numpy as np
 import pytest
 
 
-@pytest.fixture('module')
+@pytest.fixture(scope='module')
 def data():
     np.random.seed(8)
     return np.random.uniform(-5, 5, 1000000)
 
 
-@pytest.fixture('module')
+@pytest.fixture(scope='module')
 def complex_data():
     np.random.seed(8)
     return np.random.uniform(-5, 5, 1000000) + 1j * np.random.uniform(-5, 5, 1000000)
@@ -1,7 +1,8 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal, assert_array_equal
 
+import scify._specfunc.airy as c
 import scify.specfunc.airy as a
 
 
@@ -245,6 +246,138 @@ def test_airy_zero_Bi_deriv(x, exp):
     assert_almost_equal(a.airy_zero_Bi_deriv(x), exp)
 
 
+@pytest.mark.parametrize('name, func, other', [
+    ('Ai', a.airy_Ai, a.airy_Ai_deriv),
+    ('Bi', a.airy_Bi, a.airy_Bi_deriv),
+    ('Ai_deriv', a.airy_Ai_deriv, a.airy_Ai),
+    ('Bi_deriv', a.airy_Bi_deriv, a.airy_Bi),
+])
+def test_airy_zeros(name, func, other):
+    zeros_of, zero = getattr(a, f'airy_zeros_{name}'), getattr(a, f'airy_zero_{name}')
+    s = np.arange(1, 3001)
+
+    zeros, values = zeros_of(3000, with_values=True, num_threads=3)
+    assert_allclose(zeros, zero(s), rtol=1e-14)
+    assert_array_equal(zeros[:50], zero(s[:50]))
+    assert_array_equal(values, other(zeros))
+    assert np.sum(np.abs(func(zeros))) < 0.5 * np.sum(np.abs(func(zero(s))))
+
+    # later calls reuse the cached zeros
+    assert np.shares_memory(zeros_of(100), zeros)
+    assert not zeros.flags.writeable
+    assert_array_equal(zeros_of(5000, threaded=False)[:3000], zeros)
+
+    with pytest.raises(AssertionError):
+        zeros_of(-1)
+
+
+@pytest.mark.parametrize('name', ['Ai', 'Ai_deriv', 'Bi', 'Bi_deriv'])
+def test_airy_zero_integer_output(name):
+    # the index is truncated to an integer, but the zeros are never truncated into an integer output
+    zero = getattr(a, f'airy_zero_{name}')
+    with pytest.raises(TypeError):
+        zero(np.array([1, 2, 3]), inplace=True)
+    with pytest.raises(TypeError):
+        zero([1, 2, 3], out=np.empty(3, np.int32))
+
+    x = np.array([1., 2.7, 3.])
+    expected = zero([1, 2, 3])
+    assert zero(x, inplace=True) is x
+    assert_array_equal(x, expected)
+
+
+def test_airy_zero_large_index():
+    assert a.airy_zero_Ai(2 ** 32 + 1) == a.airy_zero_Ai(float(2 ** 32 + 1)) < -7e6
+
+
+@pytest.mark.parametrize('scaled', [False, True])
+def test_airy_all(scaled):
+    x = np.concatenate([np.linspace(-30, 30, 2001), [-1, 0, 1, 2, 100]])
+    funcs = [a.airy_Ai, a.airy_Ai_deriv, a.airy_Bi, a.airy_Bi_deriv]
+    if scaled:
+        funcs = [a.airy_Ai_scaled, a.airy_Ai_deriv_scaled, a.airy_Bi_scaled, a.airy_Bi_deriv_scaled]
+
+    values, errors = a.airy_all(x, scaled=scaled, with_error=True)
+    for f, v, e in zip(funcs, values, errors):
+        exp = f(x)
+        assert_allclose(v, exp, rtol=1e-12, atol=1e-300)
+        assert np.all(e >= 0)
+
+
+def test_airy_all_subset():
+    x = np.linspace(-10, 10, 101)
+    bi, ai = a.airy_all(x, which=('Bi', 'Ai'))
+    assert_almost_equal(ai, a.airy_Ai(x))
+    assert_almost_equal(bi, a.airy_Bi(x))
+
+    ai_deriv, = a.airy_all(x, which=['Ai_deriv'])
+    assert_almost_equal(ai_deriv, a.airy_Ai_deriv(x))
+
+    with pytest.raises(AssertionError):
+        a.airy_all(x, which=('Ai', 'Ci'))
+
+
+def test_airy_all_out():
+    x = np.linspace(-10, 10, 101)
+    out = np.empty_like(x), np.empty_like(x)
+    bi_deriv, ai = a.airy_all(x, which=('Bi_deriv', 'Ai'), out=out)
+
+    assert bi_deriv is out[0] and ai is out[1]
+    assert_almost_equal(ai, a.airy_Ai(x))
+    assert_allclose(bi_deriv, a.airy_Bi_deriv(x), rtol=1e-12)
+
+
+@pytest.mark.parametrize('name', ['Ai', 'Bi'])
+def test_airy_regimes(name):
+    # points of every regime and their boundaries, shuffled so that the blocks mix the regimes
+    x = np.concatenate([np.random.RandomState(2).uniform(-10, 10, 5000),
+                        [-2, -1, 0, 1, 2, 4, 150, np.nan, np.inf, -np.inf]])
+    np.random.RandomState(3).shuffle(x)
+    f, f_e = getattr(c, f'airy_{name}'), getattr(c, f'airy_{name}_e')
+
+    assert_array_equal(f(x), getattr(c, f'_airy_{name}_elementwise')(x))
+    assert_array_equal(f(x[::3]), f(x)[::3])
+    assert_array_equal(getattr(a, f'airy_{name}')(x, num_threads=3), f(x))
+
+    val, err = f_e(x)
+    for i in range(0, len(x), 97):
+        assert_array_equal(f_e(x[i]), (val[i], err[i]))
+
+    x32 = x.astype(np.float32)
+    assert_array_equal(f(x32)[::97], [f(v) for v in x32[::97]])
+
+
+@pytest.mark.parametrize('name, other', [
+    ('Ai', 'Bi'), ('Bi', 'Ai'), ('Ai_deriv', 'Bi_deriv'), ('Bi_deriv', 'Ai_deriv')
+])
+@pytest.mark.parametrize('scaled', [False, True])
+@pytest.mark.parametrize('rtol', [1e-4, 1e-8])
+def test_airy_rtol(name, other, scaled, rtol):
+    x = np.concatenate([np.linspace(-50, 50, 100001), [-1, 0, 1, 2, 4]])
+    suffix = '_scaled' if scaled else ''
+    f = getattr(a, f'airy_{name}{suffix}')
+    expected = f(x)
+    res, err = f(x, with_error=True, rtol=rtol)
+
+    # where the functions oscillate, the error is relative to their modulus
+    scale = np.where(x < -1, np.hypot(expected, getattr(a, f'airy_{other}{suffix}')(x)), np.abs(expected))
+    assert np.all(np.abs(res - expected) <= rtol * scale)
+    assert np.all(np.abs(res - expected) <= err + 2 * np.finfo(float).eps * np.abs(expected))
+
+    assert_array_equal(f(x, rtol=rtol, num_threads=3), res)
+    assert f(-3.5, rtol=rtol) == f(np.array([-3.5]), rtol=rtol)[0]
+
+    res = a.airy_all(x, which=(name,), scaled=scaled, rtol=rtol)[0]
+    assert np.all(np.abs(res - expected) <= rtol * scale)
+
+    with pytest.raises(AssertionError):
+        f(x, rtol=1)
+
+
+def test_benchmark_airy_all(benchmark, data):
+    benchmark(a.airy_all, data, threaded=False)
+
+
 def test_benchmark_airy_Ai(benchmark, data):
     benchmark(a.airy_Ai, data, threaded=False)
 
@@ -261,6 +394,10 @@ def test_benchmark_airy_Ai_deriv_scaled(benchmark, data):
     benchmark(a.airy_Ai_deriv_scaled, data, threaded=False)
 
 
+def test_benchmark_airy_Ai_rtol(benchmark, data):
+    benchmark(a.airy_Ai, data, threaded=False, rtol=1e-6)
+
+
 def test_benchmark_airy_zero_Ai(benchmark, data):
     benchmark(a.airy_zero_Ai, data, threaded=False)
 
@@ -291,3 +428,11 @@ def test_benchmark_airy_zero_Bi(benchmark, data):
 
 def test_benchmark_airy_zero_Bi_deriv(benchmark, data):
     benchmark(a.airy_zero_Bi_deriv, data, threaded=False)
+
+
+@pytest.mark.parametrize('name', ['Ai', 'Bi'])
+@pytest.mark.parametrize('engine', ['regimes', 'elementwise'])
+@pytest.mark.parametrize('order', ['random', 'sorted'])
+def test_benchmark_airy_regimes(benchmark, data, name, engine, order):
+    f = getattr(c, f'airy_{name}' if engine == 'regimes' else f'_airy_{name}_elementwise')
+    benchmark(f, data if order == 'random' else np.sort(data))
@@ -0,0 +1,105 @@
+import ctypes
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import scify.specfunc.capi as c
+import scify.specfunc.ufuncs as u
+
+PXD = Path(c.__file__).with_name('capi.pxd').read_text()
+FUNCTIONS = re.findall(r'^    [\w ]+ (\w+)\(.*\) noexcept nogil$', PXD, re.MULTILINE)
+
+_name = ctypes.pythonapi.PyCapsule_GetName
+_name.restype, _name.argtypes = ctypes.c_char_p, [ctypes.py_object]
+_pointer = ctypes.pythonapi.PyCapsule_GetPointer
+_pointer.restype, _pointer.argtypes = ctypes.c_void_p, [ctypes.py_object, ctypes.c_char_p]
+
+
+def function(name, restype, *argtypes):
+    capsule = c.__pyx_capi__[name]
+    return ctypes.CFUNCTYPE(restype, *argtypes)(_pointer(capsule, _name(capsule)))
+
+
+def test_capi_table():
+    assert len(FUNCTIONS) == 47
+    assert set(FUNCTIONS) == set(c.__pyx_capi__)
+    assert _name(c.__pyx_capi__['airy_Ai_e']) == b'double (double, double *)'
+
+
+@pytest.mark.parametrize('name', [f for f in FUNCTIONS if f.endswith('_e') and f not in ('debye_n_e',
+                                                                                         'dilog_complex_e',
+                                                                                         'cheb_eval_e')])
+def test_capi_equals_ufunc(name):
+    d = ctypes.c_double
+    if name.startswith('airy_zero'):
+        x, arg = [-1, 0, 1, 2, 50, 101, 10 ** 6], ctypes.c_longlong
+    else:
+        x, arg = [-50., -3.7, -0.2, 0, 0.3, 2.5, 40, 800, np.inf, np.nan], d
+    val, err = getattr(u, name)(np.array(x))
+    f, f_e = function(name[:-2], d, arg), function(name, d, arg, ctypes.POINTER(d))
+
+    e = d()
+    assert_array_equal([f(v) for v in x], val)
+    assert_array_equal([f_e(v, ctypes.byref(e)) for v in x], val)
+    assert e.value == err[-1] or np.isnan(err[-1])
+    assert f_e(x[4], None) == val[4]
+
+
+def test_capi_other_signatures():
+    d, p = ctypes.c_double, ctypes.POINTER(ctypes.c_double)
+    debye_n_e = function('debye_n_e', d, d, ctypes.c_longlong, p)
+    err = d()
+    assert debye_n_e(2.5, 9, ctypes.byref(err)) == u.debye_n(2.5, 9)
+    assert err.value == u.debye_n_e(2.5, 9)[1]
+    assert np.isnan(debye_n_e(2.5, 0, None))
+
+    real, imag = d(), d()
+    function('dilog_complex_xy', None, d, d, p, p)(0.5, 2, ctypes.byref(real), ctypes.byref(imag))
+    assert complex(real.value, imag.value) == u.dilog_complex(0.5 + 2j)
+
+    # T_0 / 2 + 2 T_1 + 3 T_2 over [0, 4] at x = 3, so y = 0.5 and T_2(y) = -0.5
+    coefficients = (d * 3)(1, 2, 3)
+    cheb_eval_e = function('cheb_eval_e', d, p, ctypes.c_size_t, d, d, d, p)
+    assert cheb_eval_e(coefficients, 3, 3, 0, 4, ctypes.byref(err)) == 0.5 + 1 - 1.5
+    assert 0 < err.value < 4
+
+
+def test_capi_cimport(tmp_path):
+    # a Cython extension compiled against the installed declarations calls the functions without the interpreter
+    pyximport = pytest.importorskip('pyximport')
+    (tmp_path / 'use_capi.pyx').write_text('''
+# cython: language_level=3
+from cython.parallel import prange
+from scify.specfunc cimport airy_Ai, dilog_complex_e
+cimport scify.specfunc as sf
+
+
+def evaluate(double[::1] x):
+    cdef:
+        double[::1] y = x.copy()
+        double complex err
+        Py_ssize_t i
+
+    for i in prange(x.shape[0], nogil=True):
+        y[i] = airy_Ai(x[i]) + sf.debye_n(x[i], 12)
+    return y, dilog_complex_e(0.5j, &err), err
+''')
+    importer = pyximport.install(build_dir=str(tmp_path / 'build'), language_level=3)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        import use_capi
+    except ImportError as e:  # pragma: no cover
+        pytest.skip(f"could not build a Cython extension: {e}")
+    finally:
+        sys.path.remove(str(tmp_path))
+        pyximport.uninstall(*importer)
+
+    x = np.linspace(-5, 5, 101)
+    y, z, err = use_capi.evaluate(x)
+    assert_array_equal(np.asarray(y), u.airy_Ai(x) + u.debye_n(x, 12))
+    assert z == u.dilog_complex(0.5j)
+    assert err.real > 0 and err.imag > 0
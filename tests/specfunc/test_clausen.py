@@ -32,3 +32,31 @@ def test_clausen(x, exp):
 
 def test_benchmark_clausen(benchmark, data):
     benchmark(clausen, data, threaded=False)
+
+
+@pytest.mark.parametrize('rtol', [1e-4, 1e-8])
+def test_clausen_rtol(rtol):
+    x = np.linspace(-6, 6, 100001)
+    expected = clausen(x)
+    res, err = clausen(x, with_error=True, rtol=rtol)
+
+    # near the zeros at multiples of pi, the error is relative to the largest value, Cl_2(pi / 3)
+    assert np.all(np.abs(res - expected) <= rtol * np.maximum(np.abs(expected), clausen(np.pi / 3)))
+    assert np.all(np.abs(res - expected) <= err + 2 * np.finfo(float).eps * np.abs(expected))
+    assert clausen(2.5, rtol=rtol) == clausen(np.array([2.5]), rtol=rtol)[0]
+
+
+@pytest.mark.parametrize('n', [1, 63, 64, 65, 256, 257, 1001])
+def test_clausen_block(n):
+    x = np.random.RandomState(n).uniform(-6, 6, 2 * n)
+    x[::7] = 0
+    val, err = clausen(x, with_error=True)
+
+    for i in range(0, 2 * n, max(1, n // 5)):
+        v, e = clausen(x[i], with_error=True)
+        assert val[i] == v and err[i] == e
+
+    assert np.array_equal(clausen(x[::2]), val[::2])
+    x32 = x.astype(np.float32)
+    assert np.array_equal(clausen(x32)[::n // 5 + 1], [clausen(v) for v in x32[::n // 5 + 1]])
+    assert np.array_equal(clausen(x, out=x), val)
@@ -1,8 +1,9 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
-from scify.specfunc.debye import debye_n
+from scify.specfunc import debye
+from scify.specfunc.debye import debye_all, debye_n
 
 VALUES = [-1, 0, 2.5, 3.5, 4, 6.7, 15.8, 36, 104.5, 551.3, 702.6, 1025.6, 6712.4, 10251.2]
 
@@ -78,3 +79,135 @@ def test_debye(order, expected):
 @pytest.mark.parametrize('order', [1, 2, 3, 4, 5, 6])
 def test_benchmark_debye(benchmark, data, order):
     benchmark(debye_n, data, order, threaded=False)
+
+
+@pytest.mark.parametrize('order', [1, 2, 3, 4, 5, 6, 12])
+@pytest.mark.parametrize('rtol', [1e-4, 1e-8, 1e-12])
+def test_debye_rtol(order, rtol):
+    x = np.linspace(0, 800, 100001)
+    expected = debye_n(x, order)
+    res, err = debye_n(x, order, with_error=True, rtol=rtol)
+
+    assert np.all(np.abs(res - expected) <= rtol * expected)
+    assert np.all(np.abs(res - expected) <= err + 2 * np.finfo(float).eps * expected)
+
+
+def test_debye_rtol_threaded():
+    x = np.linspace(0, 50, 100001)
+    assert np.array_equal(debye_n(x, 3, rtol=1e-8, num_threads=3), debye_n(x, 3, rtol=1e-8, threaded=False))
+
+    with pytest.raises(AssertionError):
+        debye_n(x, 3, rtol=-1)
+
+
+@pytest.mark.parametrize('order', [1, 2, 3, 4, 5, 6])
+@pytest.mark.parametrize('rtol', [0, 1e-8])
+def test_debye_block(order, rtol):
+    # the single order functions evaluate the Chebyshev series of 0 < x <= 4 in blocks, debye_n point by point
+    f = getattr(debye, f'debye_{order}')
+    x = np.concatenate([np.linspace(-1, 6, 701), [1e-9, 4, np.inf, np.nan]])
+    res, err = f(x, with_error=True, rtol=rtol)
+    expected, expected_err = debye_n(x, order, with_error=True, rtol=rtol)
+
+    assert_array_equal(res, expected)
+    assert_array_equal(err, expected_err)
+    assert_array_equal(f(x[::-1], threaded=False, rtol=rtol), expected[::-1])
+
+
+@pytest.mark.parametrize('order', [1, 6])
+def test_benchmark_debye_rtol(benchmark, data, order):
+    benchmark(debye_n, data, order, threaded=False, rtol=1e-8)
+
+
+def quad_debye(x, order):
+    # n / x^n int_0^x t^n / (e^t - 1) dt by Gauss-Legendre quadrature over unit panels
+    nodes, weights = np.polynomial.legendre.leggauss(32)
+    panels = np.linspace(0, x, int(np.ceil(x)) + 1)
+    lo, hi = panels[:-1, None], panels[1:, None]
+    t = (hi - lo) / 2 * nodes + (hi + lo) / 2
+    f = np.exp(order * np.log(t / x) + np.log(t / np.expm1(t)) - np.log(t))
+    return order * np.sum((hi - lo) / 2 * weights * f)
+
+
+@pytest.mark.parametrize('order', [7, 8, 12, 20, 35])
+def test_debye_high_order(order):
+    x = np.array([1e-3, 0.5, 1.9, 2, 2.1, 3.7, 6.2, 10, 19.5, 27.3, 50, 120])
+    expected = [quad_debye(v, order) for v in x]
+
+    assert_allclose(debye_n(x, order), expected, rtol=1e-12)
+    assert debye_n(0, order) == 1
+    assert debye_n(np.inf, order) == 0
+
+
+def test_debye_order_broadcast():
+    x = np.linspace(0, 30, 301)[:, None]
+    orders = np.arange(1, 16)
+
+    res = debye_n(x, orders)
+    assert res.shape == (301, 15)
+    for j, order in enumerate(orders):
+        assert_array_equal(res[:, j], debye_n(x[:, 0], int(order)))
+
+    mixed = np.random.RandomState(3).randint(1, 16, 301)
+    assert_array_equal(debye_n(x[:, 0], mixed), res[np.arange(301), mixed - 1])
+    assert_array_equal(debye_n(x, orders, num_threads=3), debye_n(x, orders, threaded=False))
+
+
+def test_debye_order_invalid():
+    with pytest.raises(AssertionError):
+        debye_n(1, 0)
+
+    with pytest.raises(AssertionError):
+        debye_n(1, [2, 3.5])
+
+
+def test_debye_all():
+    x = np.concatenate([[-1, 0, 1e-9, np.nan, np.inf], np.linspace(0, 800, 20001)])
+    res = debye_all(x)
+
+    assert res.shape == (6, len(x))
+    for order in range(1, 7):
+        assert_allclose(res[order - 1], debye_n(x, order), rtol=1e-14)
+
+
+def test_debye_all_full_precision():
+    # the shared series of 4 < x < X_CUT rounds differently from the single-order kernels, within their errors
+    x = np.linspace(0, 800, 200001)
+    mid = (x > 4) & (x < -np.log(np.finfo(float).tiny))
+    val, err = debye_all(x, with_error=True)
+
+    for order in range(1, 7):
+        expected, expected_err = debye_n(x, order, with_error=True)
+        assert_array_equal(val[order - 1, ~mid], expected[~mid])
+        assert np.all(np.abs(val[order - 1] - expected) <= err[order - 1] + expected_err)
+        assert_allclose(val[order - 1], expected, rtol=6e-15)
+
+
+def test_debye_all_subset_out():
+    x = np.random.RandomState(4).uniform(0, 50, (40, 3))
+    out = np.empty((3, 40, 3)), np.empty((3, 40, 3))
+    val, err = debye_all(x, orders=(5, 2, 3), out=out, with_error=True)
+
+    assert val is out[0] and err is out[1]
+    for i, order in enumerate((5, 2, 3)):
+        expected, _ = debye_n(x, order, with_error=True)
+        assert_allclose(val[i], expected, rtol=1e-14)
+        assert np.all(err[i] > 0)
+
+    with pytest.raises(AssertionError):
+        debye_all(x, orders=(1, 7))
+    with pytest.raises(AssertionError):
+        debye_all(x, orders=(1, 1))
+
+
+def test_debye_all_rtol():
+    x = np.linspace(0, 50, 10001)
+    expected = debye_all(x)
+    res = debye_all(x, rtol=1e-8, num_threads=3)
+
+    assert np.all(np.abs(res - expected) <= 1e-8 * expected)
+    assert_array_equal(res, debye_all(x, rtol=1e-8, threaded=False))
+
+
+def test_benchmark_debye_all(benchmark, data):
+    benchmark(debye_all, data, threaded=False)
@@ -1,7 +1,8 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
+import scify._specfunc.dilog as d
 from scify.specfunc.dilog import dilog, dilog_complex
 
 
@@ -56,9 +57,84 @@ def test_dilog_complex(x, exp):
     assert_array_almost_equal(im, t_im)
 
 
+def test_dilog_complex_cartesian():
+    rs = np.random.RandomState(7)
+    z = rs.uniform(-4, 4, 2000) + 1j * rs.uniform(-4, 4, 2000)
+    res = dilog_complex(z)
+
+    assert_allclose(res, dilog_complex(np.abs(z), np.angle(z)), rtol=1e-12)
+    assert_allclose(dilog_complex(z.conj()), res.conj(), rtol=1e-14)
+
+    # near the negative real axis outside the unit disk, log(-z) is taken from (x, y) without cancellation
+    z = np.array([-1.5 + 1e-9j, -2.5 - 1e-12j, -3 + 2e-6j])
+    ln_mz = np.log(-z)
+    w = 1 / z
+    exp = -sum(w ** k / k ** 2 for k in range(1, 200)) - ln_mz ** 2 / 2 - np.pi ** 2 / 6
+    assert_allclose(dilog_complex(z).imag, exp.imag, rtol=1e-12)
+
+
+def unit_disk(lo, hi, n, seed=8):
+    rs = np.random.RandomState(seed)
+    return np.sqrt(rs.uniform(lo ** 2, hi ** 2, n)) * np.exp(1j * rs.uniform(-np.pi, np.pi, n))
+
+
+def test_dilog_complex_unit_disk():
+    z = unit_disk(0, 1, 100000)
+    res, err = dilog_complex(z, with_error=True)
+    assert_allclose(res, d._dilog_complex_series(z), rtol=1e-12)
+
+    # power series in z where it converges quickly
+    small = np.abs(z) < 0.5
+    exp = sum(z[small] ** k / k ** 2 for k in range(1, 60))
+    slack = 4 * np.finfo(float).eps * np.abs(exp)  # rounding of exp itself
+    assert np.all(np.abs(res[small].real - exp.real) <= err[small].real + slack)
+    assert np.all(np.abs(res[small].imag - exp.imag) <= err[small].imag + slack)
+
+    z = np.array([1e-10 + 1e-12j, 1e-8 - 1e-300j])
+    assert_allclose(dilog_complex(z), z + z ** 2 / 4 + z ** 3 / 9, rtol=1e-15)
+
+
+@pytest.mark.parametrize('rtol', [1e-4, 1e-8, 1e-12])
+def test_dilog_rtol(rtol):
+    x = np.linspace(-20, 20, 100001)
+    expected = dilog(x)
+    res, err = dilog(x, with_error=True, rtol=rtol)
+
+    assert np.all(np.abs(res - expected) <= rtol * np.abs(expected))
+    assert np.all(np.abs(res - expected) <= err + 2 * np.finfo(float).eps * np.abs(expected))
+    assert_array_equal(dilog(x, rtol=rtol, num_threads=3), res)
+    assert dilog(0.3, rtol=rtol) == dilog(np.array([0.3]), rtol=rtol)[0]
+
+
+@pytest.mark.parametrize('rtol', [1e-4, 1e-8, 1e-12])
+def test_dilog_complex_rtol(rtol):
+    rs = np.random.RandomState(9)
+    z = np.concatenate([unit_disk(0, 1, 100000), rs.uniform(-4, 4, 10000) + 1j * rs.uniform(-4, 4, 10000)])
+    expected = dilog_complex(z)
+    res, err = dilog_complex(z, with_error=True, rtol=rtol)
+
+    # the error is relative to the modulus of the result
+    assert np.all(np.abs(res - expected) <= rtol * np.abs(expected))
+    assert np.all(np.abs(res.real - expected.real) <= err.real + 4 * np.finfo(float).eps * np.abs(expected))
+    assert np.all(np.abs(res.imag - expected.imag) <= err.imag + 4 * np.finfo(float).eps * np.abs(expected))
+    assert_array_equal(dilog_complex(z, rtol=rtol, num_threads=3), res)
+    assert dilog_complex(0.3 + 0.2j, rtol=rtol) == dilog_complex(np.array([0.3 + 0.2j]), rtol=rtol)[0]
+
+
 def test_benchmark_dilog(benchmark, data):
     benchmark(dilog, data, threaded=False)
 
 
+def test_benchmark_dilog_rtol(benchmark, data):
+    benchmark(dilog, data, threaded=False, rtol=1e-6)
+
+
 def test_benchmark_dilog_complex(benchmark, complex_data):
-    benchmark(dilog_complex, complex_data, threaded=False)
\ No newline at end of file
+    benchmark(dilog_complex, complex_data, threaded=False)
+
+
+@pytest.mark.parametrize('lo, hi', [(0, 0.25), (0.25, 0.5), (0.5, 0.75), (0.75, 0.98), (0.98, 1)])
+@pytest.mark.parametrize('engine', ['bernoulli', 'series'])
+def test_benchmark_dilog_complex_unit_disk(benchmark, lo, hi, engine):
+    f = d.dilog_complex if engine == 'bernoulli' else d._dilog_complex_series
+    benchmark(f, unit_disk(lo, hi, 1000000))
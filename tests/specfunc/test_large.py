@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import scify.specfunc as sf
+
+N = 2 ** 31 + 7  # more elements than a 32-bit index can address
+
+large = pytest.mark.skipif(not os.environ.get('SCIFY_LARGE_TESTS'),
+                           reason="evaluates 2^31 elements, set SCIFY_LARGE_TESTS=1 to run")
+
+
+@pytest.fixture
+def virtual(tmp_path):
+    """Sparse memory map of N zeros, which takes no space on disk"""
+
+    def make(dtype):
+        return np.memmap(tmp_path / 'x.dat', dtype=dtype, mode='w+', shape=(N,))
+
+    return make
+
+
+def sink(x):
+    """Writable output of the same shape as x backed by a single element"""
+    return np.lib.stride_tricks.as_strided(np.empty(1, x.dtype), shape=x.shape, strides=(0,) * x.ndim, writeable=True)
+
+
+def test_strided_beyond_32_bit_offsets(virtual):
+    x = virtual(np.float64)
+    view = x[::2 ** 24]  # byte offsets of the later elements exceed 2^34
+    view[:] = np.linspace(0.5, 5, len(view))
+
+    assert_allclose(sf.debye_1(view), sf.debye_1(np.array(view)))
+    assert_allclose(sf.debye_1(x[-2 ** 16:].reshape(256, -1))[:, -1], sf.debye_1(x[-1:-2 ** 16:-256][::-1]))
+
+
+@large
+def test_size_beyond_32_bits(virtual):
+    x = virtual(np.float32)
+    x[-1] = 2
+    out = sink(x)
+
+    assert sf.debye_1(x, out=out, threaded=False) is out
+    assert_allclose(out[0], sf.debye_1(2.), rtol=1e-6)  # the last element evaluated is written last
+
+
+@large
+def test_size_beyond_32_bits_threaded(virtual):
+    x = virtual(np.float32)
+    out = sink(x)
+    out[0] = np.nan
+
+    sf.debye_1(x, out=out, num_threads=2)
+    assert out[0] == 1  # D_1(0)
+
+
+@large
+def test_size_beyond_32_bits_with_error(virtual):
+    x = virtual(np.float32)
+    x[-1] = -1
+    val, err = sf.clausen(x, out=(sink(x), sink(x)), with_error=True)
+    assert_allclose(val[0], sf.clausen(-1.), rtol=1e-6)
+    assert err[0] >= 0
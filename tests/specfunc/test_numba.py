@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+numba = pytest.importorskip('numba')
+
+import scify.specfunc as sf  # noqa: E402
+import scify.specfunc.scalar as s  # noqa: E402
+from scify.specfunc import _numba  # noqa: E402  registered by the entry point once scify is installed
+
+X = np.array([[-50., -3.7, -0.2, 0], [0.3, 2.5, 40, 800]])
+INDEX = np.array([1, 2, 50, 101, 10 ** 6])
+
+
+@pytest.mark.parametrize('name', _numba.REAL + _numba.INDEX)
+def test_numba_overloads(name):
+    x, v = (INDEX, 2) if name in _numba.INDEX else (X, 2.5)
+    f, g = getattr(sf, name), getattr(s, name)
+    h = numba.njit(lambda x: f(x, threaded=False))
+
+    assert_array_equal(h(x), f(x))
+    assert h(v) == numba.njit(lambda x: g(x))(v) == g(v)
+
+
+def test_numba_debye_n_and_dilog_complex():
+    z = X + 0.5j
+
+    assert_array_equal(numba.njit(lambda x: sf.debye_n(x, 12))(X), sf.debye_n(X, 12))
+    assert numba.njit(lambda x, n: s.debye_n(x, n))(2.5, 9) == s.debye_n(2.5, 9)
+    assert_array_equal(numba.njit(lambda z: sf.dilog_complex(z))(z), sf.dilog_complex(z))
+    assert numba.njit(lambda z: s.dilog_complex(z))(2.) == s.dilog_complex(2.)
+
+
+def test_numba_vectorize():
+    @numba.vectorize(['float64(float64)'])
+    def f(x):
+        return sf.airy_Ai(x) * s.debye_2(x)
+
+    assert_array_equal(f(X), sf.airy_Ai(X) * sf.debye_2(X))
+
+
+@pytest.mark.parametrize('kwargs', ["with_error=True", "rtol=1e-8", "out=x"])
+def test_numba_unsupported(kwargs):
+    f = numba.njit(eval(f"lambda x: sf.debye_3(x, {kwargs})"))
+    with pytest.raises(numba.core.errors.TypingError, match="not supported in jitted code"):
+        f(X)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import scify.specfunc as sf
+import scify.specfunc.scalar as s
+import scify.specfunc.ufuncs as u
+
+REAL = [-50., -3.7, -1, -0.2, 0, 1e-300, 0.3, 1., 2.5, 7, 40, 800, np.inf, -np.inf, np.nan]
+INDEX = [-1, 0, 1, 2, 50, 101, 10 ** 6]
+
+
+def inputs(name):
+    if name.startswith('airy_zero'):
+        return INDEX
+    if name == 'dilog_complex':
+        return [complex(x, y) for x in (-3, -0.4, 0, 0.5, 0.999, 1, 2.5) for y in (-1, 0, 1e-20, 0.3)]
+    return REAL
+
+
+@pytest.mark.parametrize('name', s.__all__)
+def test_scalar_equals_ufunc(name):
+    x = inputs(name)
+    args = (12,) if name == 'debye_n' else ()
+    expected = getattr(u, name)(np.array(x), *args)
+
+    assert_array_equal([getattr(s, name)(v, *args) for v in x], expected)
+    # the wrappers take the scalar path for single Python numbers
+    assert_array_equal([getattr(sf, name)(v, *args) for v in x], expected)
+
+
+def test_scalar_wrapper_options():
+    assert type(sf.airy_Ai(0.5)) is float
+    assert type(sf.airy_Ai(1)) is float
+    assert type(sf.dilog_complex(0.5j)) is complex
+
+    # anything other than a single value without out, inplace or with_error goes through the ufuncs as before
+    assert isinstance(sf.airy_Ai(np.float32(0.5)), np.float32)
+    val, err = sf.airy_Ai(0.5, with_error=True)
+    assert val == sf.airy_Ai(0.5) and err > 0
+    assert sf.airy_zero_Ai(3.9) == sf.airy_zero_Ai(3)
+
+
+def test_scalar_debye_rtol():
+    assert sf.debye_3(10.) == sf.debye_3(np.array(10.))
+    assert sf.debye_3(10., rtol=1e-4) == sf.debye_3(np.array(10.), rtol=1e-4) != sf.debye_3(10.)
+    assert sf.debye_n(10., 9, rtol=1e-4) == sf.debye_n(np.array(10.), 9, rtol=1e-4)
+
+    # the tolerance applies to the call only
+    assert sf.debye_3(10.) == sf.debye_3(np.array(10.))
+
+    with pytest.raises(AssertionError):
+        s.debye_3(1., rtol=1)
+    with pytest.raises(AssertionError):
+        sf.debye_n(1., 0)
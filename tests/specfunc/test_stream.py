@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from scify.__main__ import main
+from scify.specfunc import airy_Ai, debye_3, stream
+from scify.specfunc import ufuncs as u
+
+
+@pytest.fixture
+def x():
+    np.random.seed(8)
+    return np.random.uniform(0, 5, (1001, 7))
+
+
+def test_stream_npy(x, tmp_path):
+    np.save(tmp_path / 'x.npy', x)
+    res = stream(debye_3, np.load(tmp_path / 'x.npy', mmap_mode='r'), str(tmp_path / 'y.npy'), chunk_bytes=1000)
+
+    assert isinstance(res, np.memmap)
+    assert_array_equal(np.load(tmp_path / 'y.npy'), debye_3(x))
+
+
+def test_stream_raw(x, tmp_path):
+    x.astype(np.float32).tofile(tmp_path / 'x.bin')
+    stream(airy_Ai, tmp_path / 'x.bin', tmp_path / 'y.bin', chunk_bytes=1000, dtype=np.float32)
+
+    assert_array_equal(np.fromfile(tmp_path / 'y.bin', np.float32), airy_Ai(x.astype(np.float32).ravel()))
+
+
+@pytest.mark.parametrize('chunk_bytes', [8, 1000, 1 << 20])
+def test_stream_strided_with_error(x, chunk_bytes):
+    out = np.empty((7, 1001)), np.empty((7, 1001))
+    res = stream(u.airy_Ai_e, x.T, out, chunk_bytes=chunk_bytes)
+
+    assert res[0] is out[0] and res[1] is out[1]
+    for r, e in zip(res, u.airy_Ai_e(x.T)):
+        assert_array_equal(r, e)
+
+
+def test_stream_scalar_and_empty():
+    assert stream(airy_Ai, 1.0) == airy_Ai(1.0)
+    assert stream(airy_Ai, []).shape == (0,)
+
+
+def test_stream_bad_output(x):
+    with pytest.raises(AssertionError):
+        stream(airy_Ai, x, np.empty(len(x)))
+
+    with pytest.raises(AssertionError):
+        stream(airy_Ai, x, [1, 2])
+
+
+def test_cli(x, tmp_path):
+    np.save(tmp_path / 'x.npy', x)
+    src, dst, err = (str(tmp_path / f) for f in ('x.npy', 'y.npy', 'e.npy'))
+    assert main(['eval', 'debye_3', src, dst, '--error', err, '--chunk-bytes', '4096', '--threads', '1']) == 0
+
+    val, e = debye_3(x, with_error=True)
+    assert_array_equal(np.load(dst), val)
+    assert_array_equal(np.load(err), e)
+
+
+@pytest.mark.parametrize('name', ['stream', 'debye_n', 'debye_all', 'airy_all', 'airy_zero_Ai', 'airy_zeros_Bi',
+                                  'dilog_complex', '_missing'])
+def test_cli_rejects_function(name, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main(['eval', name, str(tmp_path / 'x.npy'), str(tmp_path / 'y.npy')])
+    assert 'invalid choice' in capsys.readouterr().err
@@ -0,0 +1,257 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_almost_equal, assert_array_equal
+
+import scify.specfunc as sf
+import scify.specfunc.ufuncs as u
+from scify.specfunc.airy import airy_Ai
+from scify.specfunc.debye import debye_3
+from scify.specfunc.dilog import dilog_complex
+from scify.specfunc.log import complex_log
+
+
+@pytest.mark.parametrize('name', u.__all__)
+def test_is_ufunc(name):
+    assert isinstance(getattr(u, name), np.ufunc)
+
+
+def test_broadcasting():
+    x = np.linspace(0.1, 8, 12).reshape(3, 1, 4)
+    res = u.debye_3(x + np.zeros((2, 1)))
+
+    assert res.shape == (3, 2, 4)
+    assert_almost_equal(res[:, 0], debye_3(x.reshape(3, 4)))
+    assert_almost_equal(res[:, 1], debye_3(x.reshape(3, 4)))
+
+
+def test_out_and_where():
+    x = np.linspace(-3, 3, 10)
+    out = np.full_like(x, -100.)
+    mask = x > 0
+
+    res = u.airy_Ai(x, out=out, where=mask)
+
+    assert res is out
+    assert_array_equal(out[~mask], -100.)
+    assert_almost_equal(out[mask], airy_Ai(x[mask]))
+
+
+def test_strided_input():
+    x = np.linspace(-5, 5, 60).reshape(6, 10)
+    assert_almost_equal(u.airy_Ai(x[:, 3]), airy_Ai(np.ascontiguousarray(x[:, 3])))
+    assert_almost_equal(u.airy_Ai(x.T), airy_Ai(x).T)
+
+
+def test_complex_ufuncs():
+    z = np.array([0.2 + 0.1j, 1.4 + 0.6j, -2 + 0j])
+    assert_almost_equal(u.dilog_complex(z), dilog_complex(z))
+    assert_almost_equal(u.dilog_complex_polar(np.abs(z), np.angle(z)), dilog_complex(z))
+    assert_almost_equal(u.complex_log_rect(z.real, z.imag), np.log(z))
+
+
+REAL_FUNCTIONS = [sf.airy_Ai, sf.airy_Ai_scaled, sf.airy_Ai_deriv, sf.airy_Ai_deriv_scaled, sf.airy_Bi,
+                  sf.airy_Bi_scaled, sf.airy_Bi_deriv, sf.airy_Bi_deriv_scaled, sf.clausen, sf.debye_1, sf.debye_2,
+                  sf.debye_3, sf.debye_4, sf.debye_5, sf.debye_6, sf.dilog]
+
+
+@pytest.mark.parametrize('f', REAL_FUNCTIONS)
+@pytest.mark.parametrize('threaded', [True, False])
+def test_default_does_not_modify_input(f, threaded):
+    x = np.linspace(0.1, 4.9, 50)
+    copy = x.copy()
+    res = f(x, threaded)
+
+    assert res is not x
+    assert_array_equal(x, copy)
+
+
+@pytest.mark.parametrize('f', REAL_FUNCTIONS)
+def test_out(f):
+    x = np.linspace(0.1, 4.9, 50).reshape(5, 10)
+    out = np.empty_like(x)
+    res = f(x, out=out)
+
+    assert res is out
+    assert_array_equal(out, f(x))
+
+
+@pytest.mark.parametrize('f', REAL_FUNCTIONS)
+def test_inplace(f):
+    x = np.linspace(0.1, 4.9, 50)
+    expected = f(x)
+    res = f(x, inplace=True)
+
+    assert res is x
+    assert_array_equal(x, expected)
+
+
+def test_out_complex():
+    z = np.array([0.2 + 0.1j, 1.4 + 0.6j, -2 + 0j])
+    expected = dilog_complex(z)
+    out = np.empty_like(z)
+
+    assert dilog_complex(z, out=out) is out
+    assert_array_equal(out, expected)
+    assert dilog_complex(z, inplace=True) is z
+    assert_array_equal(z, expected)
+
+
+def test_out_airy_zero():
+    x = np.array([1., 5.4, 40., 81.9])
+    expected = sf.airy_zero_Ai(x)
+    assert sf.airy_zero_Ai(x, inplace=True) is x
+    assert_array_equal(x, expected)
+
+
+def test_inplace_invalid():
+    with pytest.raises(AssertionError):
+        sf.airy_Ai([1., 2.], inplace=True)
+
+    with pytest.raises(AssertionError):
+        x = np.ones(3)
+        sf.airy_Ai(x, out=np.empty(3), inplace=True)
+
+
+@pytest.mark.parametrize('f', REAL_FUNCTIONS)
+def test_with_error(f):
+    x = np.linspace(0.1, 4.9, 50)
+    val, err = f(x, with_error=True)
+
+    assert_array_equal(val, f(x))
+    assert np.all(np.isfinite(err))
+    assert np.all(err >= 0)
+
+
+def test_with_error_out():
+    x = np.linspace(0.1, 4.9, 50)
+    out = np.empty_like(x), np.empty_like(x)
+    val, err = sf.debye_2(x, out=out, with_error=True)
+
+    assert val is out[0] and err is out[1]
+    assert_array_equal(val, sf.debye_2(x))
+
+
+def test_with_error_complex():
+    z = np.array([0.2 + 0.1j, 1.4 + 0.6j, -2 + 0j])
+    val, err = dilog_complex(z, with_error=True)
+
+    assert_array_equal(val, dilog_complex(z))
+    assert err.dtype == np.complex128
+    assert np.all(err.real >= 0) and np.all(err.imag >= 0)
+
+    val, err = complex_log(z, with_error=True)
+    assert_almost_equal(val, np.log(z))
+    assert np.all(err.imag >= 0)
+
+
+def test_with_error_airy_zero():
+    val, err = sf.airy_zero_Bi([1., 5.4, 40.], with_error=True)
+    assert_array_equal(val, sf.airy_zero_Bi([1, 5, 40]))
+    assert np.all(err >= 0)
+
+
+@pytest.mark.parametrize('f', REAL_FUNCTIONS)
+def test_single_precision(f):
+    x = np.linspace(0.1, 4.9, 50, dtype=np.float32)
+    res = f(x)
+
+    assert res.dtype == np.float32
+    assert_allclose(res, f(x.astype(np.float64)), rtol=4 * np.finfo(np.float32).eps)
+
+    val, err = f(x, with_error=True)
+    assert err.dtype == np.float32
+    assert np.all(err >= np.finfo(np.float32).eps * np.abs(val))
+
+
+@pytest.mark.parametrize('dtype', [np.bool_, np.int8, np.uint8, np.int16, np.uint16, np.float16])
+def test_small_types_in_double_precision(dtype):
+    # these cast safely to float32, but are evaluated in double precision as before the float32 loops
+    x = np.array([1, 2, 3]).astype(dtype)
+    for f in REAL_FUNCTIONS:
+        res = f(x)
+        assert res.dtype == np.float64
+        assert_array_equal(res, f(x.astype(np.float64)))
+        assert_array_equal(f(x, threaded=False), res)
+
+    assert dilog_complex(x).dtype == np.complex128
+    assert_array_equal(dilog_complex(x), dilog_complex(x.astype(np.complex128)))
+    assert sf.airy_all(x)[0].dtype == np.float64
+
+
+@pytest.mark.parametrize('f, other', [
+    (sf.airy_Ai, sf.airy_Bi), (sf.airy_Bi, sf.airy_Ai), (sf.airy_Ai_deriv, sf.airy_Bi_deriv),
+    (sf.airy_Bi_deriv, sf.airy_Ai_deriv)
+])
+def test_single_precision_airy_oscillatory(f, other):
+    # relative to the modulus, as the zeros are many ulps of the value away
+    x = np.linspace(-50, -1.01, 100001, dtype=np.float32)
+    expected = f(x.astype(np.float64))
+    modulus = np.hypot(expected, other(x.astype(np.float64)))
+
+    assert np.all(np.abs(f(x) - expected) <= np.finfo(np.float32).eps * modulus)
+
+
+def test_single_precision_complex():
+    z = np.array([0.2 + 0.1j, 1.4 + 0.6j, -2 + 0j], dtype=np.complex64)
+
+    assert dilog_complex(z).dtype == np.complex64
+    assert_allclose(dilog_complex(z), dilog_complex(z.astype(np.complex128)), rtol=1e-6)
+    assert complex_log(z.real, z.imag).dtype == np.complex64
+    assert sf.airy_all(z.real)[0].dtype == np.float32
+
+
+def peak_memory(f, *args, **kwargs):
+    tracemalloc.start()
+    try:
+        f(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('f', REAL_FUNCTIONS)
+def test_strided_input_is_not_copied(f):
+    table = np.linspace(0.1, 4.9, 80000).reshape(-1, 8)
+    column = table[:, 3]
+
+    assert peak_memory(f, column) < 1.1 * column.nbytes  # only the result is allocated
+    assert peak_memory(f, table.T) < 1.1 * table.nbytes
+    assert_array_equal(f(column), f(np.ascontiguousarray(column)))
+
+
+def test_strided_output_is_not_copied():
+    table = np.linspace(0.1, 4.9, 80000).reshape(-1, 8)
+    out = np.zeros_like(table)
+
+    assert peak_memory(sf.airy_Ai, table[:, ::2], out=out[:, 1::2]) < 0.1 * table.nbytes
+    assert_array_equal(out[:, 1::2], sf.airy_Ai(table[:, ::2]))
+    assert_array_equal(out[:, ::2], 0)
+
+
+def test_strided_complex_input_is_not_copied():
+    z = np.linspace(-2, 2, 20000) + 1j * np.linspace(2, -2, 20000)
+    view = z[::4]
+
+    assert peak_memory(dilog_complex, view) < 1.1 * view.nbytes
+    assert peak_memory(dilog_complex, z.real[::4], z.imag[::4]) < 1.1 * view.nbytes
+    assert_array_equal(dilog_complex(view), dilog_complex(view.copy()))
+
+
+@pytest.mark.parametrize('f', [dilog_complex, complex_log])
+def test_complex_output_is_not_copied(f):
+    z = (np.linspace(-2, 2, 200000) + 1j * np.linspace(2, -2, 200000)).reshape(400, 500)
+    expected = f(z)
+    out = np.empty((500, 400), np.complex128)
+
+    # the interleaved buffers are read and written in place, whatever their layout. NumPy only buffers a few
+    # thousand elements when the layouts of the input and the output differ
+    assert peak_memory(f, z.T, out=out) < 0.1 * z.nbytes
+    assert_array_equal(out, expected.T)
+    assert peak_memory(f, z, out=out.T) < 0.1 * z.nbytes
+    assert_array_equal(out.T, expected)
+
+    assert peak_memory(f, z[:, ::2]) < 1.1 * z[:, ::2].nbytes
+    assert peak_memory(f, z, inplace=True) < 0.1 * z.nbytes
+    assert_array_equal(z, expected)
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import scify
+import scify.specfunc as sf
+
+
+def run(code: str):
+    # runs the code in a new interpreter, where nothing of scify is imported yet
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(scify.__file__)))
+
+
+def test_import_lazy():
+    run("import sys, scify, scify.specfunc; "
+        "assert not [m for m in sys.modules if m == 'numpy' or m.startswith('scify._specfunc')], sys.modules")
+
+
+def test_import_submodule_on_use():
+    run("import sys, scify.specfunc as sf; sf.clausen; "
+        "assert 'scify.specfunc.clausen' in sys.modules and 'scify.specfunc.airy' not in sys.modules")
+
+
+@pytest.mark.parametrize('name', ['clausen', 'dilog', 'stream'])
+def test_import_function_named_as_submodule(name):
+    # importing the submodule binds its name in the package, which must still give the function
+    assert callable(getattr(sf, name))
+    run(f"import scify.specfunc as sf; assert callable(sf.{name})")
+    run(f"import scify.specfunc.{name}, scify.specfunc as sf; assert callable(sf.{name})")
+
+
+@pytest.mark.parametrize('name', ['airy', 'debye', 'ufuncs'])
+def test_import_submodule_as_attribute(name):
+    run(f"import sys, scify.specfunc as sf; assert sf.{name} is sys.modules['scify.specfunc.{name}']")
+
+
+def test_import_attributes():
+    assert set(sf.__all__) <= set(dir(sf))
+    assert not {'importlib', 'sys', 'ModuleType'} & set(dir(sf))
+    assert {'get_num_threads', 'stats'} <= set(dir(scify))
+    assert not {'importlib', 'sys'} & set(dir(scify))
+    assert scify.get_num_threads() >= 1
+
+    with pytest.raises(AttributeError):
+        sf.missing
+    with pytest.raises(AttributeError):
+        scify.missing
@@ -0,0 +1,111 @@
+import threading
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import scify
+import scify._specfunc._results as r
+from scify.specfunc import airy_Ai, debye_1
+
+stats_enabled = pytest.mark.skipif(
+    not scify.stats()['enabled'], reason="the extensions were not built with the instrumentation, see setup.py --stats")
+
+
+@pytest.fixture
+def restore():
+    threshold = scify.get_serial_threshold()
+    yield
+    scify.set_num_threads(0)
+    scify.set_serial_threshold(threshold)
+
+
+def test_set_num_threads(restore):
+    scify.set_num_threads(3)
+    assert scify.get_num_threads() == 3
+
+    scify.set_num_threads(0)
+    assert scify.get_num_threads() >= 1
+
+    with pytest.raises(AssertionError):
+        scify.set_num_threads(-1)
+
+
+def test_num_threads_context(restore):
+    scify.set_num_threads(3)
+    with scify.num_threads(2):
+        assert scify.get_num_threads() == 2
+        with scify.num_threads(1):
+            assert scify.get_num_threads() == 1
+        assert scify.get_num_threads() == 2
+    assert scify.get_num_threads() == 3
+
+
+def test_num_threads_context_is_thread_local(restore):
+    scify.set_num_threads(3)
+    seen = []
+    with scify.num_threads(2):
+        t = threading.Thread(target=lambda: seen.append(scify.get_num_threads()))
+        t.start()
+        t.join()
+
+    assert seen == [3]
+
+
+def test_serial_threshold(restore):
+    scify.set_serial_threshold(10)
+    assert scify.get_serial_threshold() == 10
+
+    with pytest.raises(AssertionError):
+        scify.set_serial_threshold(-1)
+
+
+@pytest.mark.parametrize('threshold', [0, 1000, 10 ** 9])
+@pytest.mark.parametrize('num_threads', [None, 1, 2, 4])
+def test_results_independent_of_threads(restore, threshold, num_threads):
+    scify.set_serial_threshold(threshold)
+    x = np.linspace(-10, 10, 5001)
+
+    assert_array_equal(airy_Ai(x, num_threads=num_threads), airy_Ai(x, threaded=False))
+    with scify.num_threads(3):
+        assert_array_equal(debye_1(x, num_threads=num_threads), debye_1(x, threaded=False))
+
+
+def test_team_size(restore):
+    scify.set_serial_threshold(1000)
+    scify.set_num_threads(3)
+    assert r.get_team_size(999) == 1
+    assert r.get_team_size(1000) == 3
+    assert r.get_team_size(2) == 1
+
+    with scify.num_threads(2):
+        assert r.get_team_size(10 ** 6) == 2
+        scify.set_serial_threshold(0)
+        assert r.get_team_size(2) == 2
+        assert r.get_team_size(1) == 1  # never more threads than elements
+    assert r.get_team_size(10 ** 6) == 3
+
+    scify.set_num_threads(0)
+    assert r.get_team_size(10 ** 6) == scify.get_num_threads()
+
+
+@stats_enabled
+@pytest.mark.parametrize('num_threads, threaded, threshold, path', [
+    (None, True, 0, 'parallel'), (3, True, 0, 'parallel'), (1, True, 0, 'serial'), (3, False, 0, 'serial'),
+    (3, True, 10 ** 9, 'serial')
+])
+def test_path_taken(restore, num_threads, threaded, threshold, path):
+    scify.set_num_threads(2)
+    scify.set_serial_threshold(threshold)
+    scify.reset_stats()
+    airy_Ai(np.linspace(-10, 10, 5001), num_threads=num_threads, threaded=threaded)
+    loops = scify.stats()['loops']
+    scify.reset_stats()
+
+    assert loops[path]['calls'] == 1
+    assert loops['serial' if path == 'parallel' else 'parallel']['calls'] == 0
+
+
+def test_invalid_num_threads():
+    with pytest.raises(AssertionError):
+        airy_Ai([1., 2.], num_threads=0)
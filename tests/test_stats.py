@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+import scify
+from scify.specfunc import airy_Ai, airy_Bi, debye_3, debye_n, dilog, dilog_complex
+
+enabled = pytest.mark.skipif(not scify.stats()['enabled'],
+                             reason="the extensions were not built with the instrumentation, see setup.py --stats")
+
+
+@pytest.fixture
+def fresh():
+    scify.reset_stats()
+    yield
+    scify.reset_stats()
+
+
+def test_stats_disabled(fresh):
+    if scify.stats()['enabled']:
+        pytest.skip("the extensions were built with the instrumentation")
+
+    airy_Ai(np.linspace(-5, 5, 10000))
+    s = scify.stats()
+    assert s['kernels']['airy_Ai']['calls'] == 0
+    assert s['loops']['serial']['calls'] == s['loops']['parallel']['calls'] == 0
+    assert s['ufuncs'] == {}
+
+
+@enabled
+def test_stats_regimes_threaded(fresh):
+    x = np.linspace(-5, 5, 100000)
+    airy_Ai(x, num_threads=3)
+    s = scify.stats()
+
+    # the counts are exact although updated from several threads
+    assert s['kernels']['airy_Ai']['branches'] == {
+        'oscillating': np.sum(x < -2),
+        'near': np.sum((x >= -2) & (x < -1)),
+        'series': np.sum((x >= -1) & (x <= 1)),
+        'decaying': np.sum(x > 1),
+    }
+    assert s['loops']['parallel']['elements'] == len(x)
+    assert s['ufuncs']['airy_Ai']['calls'] == 1
+    assert s['ufuncs']['airy_Ai']['elements'] == len(x)
+
+
+@enabled
+def test_stats_branches_and_iterations(fresh):
+    debye_3([-1, 1, 10, 100, 1000])
+    debye_n(np.linspace(3, 50, 10), 9)
+    dilog_complex([0.5j, 2 + 2j, 3])
+    s = scify.stats()['kernels']
+
+    assert s['debye_3']['branches'] == {'negative': 1, 'small': 0, 'chebyshev': 1, 'rtol_sum': 0, 'exp_sum': 1,
+                                        'exp': 1, 'limit': 1}
+    assert s['debye_3']['iterations'] == int(np.floor(-np.log(np.finfo(float).tiny) / 10))
+    assert s['debye_n']['branches']['series_and_sum'] == 10
+    assert s['debye_n']['mean_iterations'] > 1
+    assert s['dilog_complex']['branches'] == {'real_axis': 1, 'unit_circle': 0, 'unit_disk': 1, 'inverted': 1}
+
+    scify.reset_stats()
+    s = scify.stats()
+    assert s['kernels']['debye_3']['calls'] == 0
+    assert s['ufuncs'] == {}
+
+
+@enabled
+def test_stats_dilog_complex_unit_disk(fresh):
+    dilog_complex([0.2j, 0.8 + 0.1j, 2 + 2j])
+    dilog_complex([0.3 + 0.1j], rtol=1e-4)
+    s = scify.stats()['kernels']['dilogc_unit_disk']
+
+    assert s['branches'] == {'unit_disk': 2, 'reflected': 1, 'inverted': 1}
+    assert 3 * 12 < s['iterations'] < 4 * 12  # 12 terms at full precision, fewer with the tolerance
+
+
+@enabled
+def test_stats_dilog_iterations(fresh):
+    dilog([0.1, 0.3, 3])
+    s = scify.stats()['kernels']['dilog']
+    assert s['branches']['series_1'] == s['branches']['series_2'] == s['branches']['inverted'] == 1
+    assert 3 * 10 < s['iterations'] < 3 * 40  # the terms summed by the series of each point
+
+    scify.reset_stats()
+    dilog([0.3], rtol=1e-4)
+    assert 0 < scify.stats()['kernels']['dilog']['iterations'] < 25
+
+
+@enabled
+def test_stats_airy_scalar(fresh):
+    # the scalars are evaluated by the element-wise kernels, outside of the regime ufuncs
+    for x in (-3., -1.5, 0.5, 1.5, 3.):
+        airy_Ai(x)
+        airy_Bi(x)
+    s = scify.stats()
+
+    assert s['kernels']['airy_Ai']['branches'] == {'oscillating': 1, 'near': 1, 'series': 1, 'decaying': 2}
+    assert s['kernels']['airy_Bi']['branches'] == {'oscillating': 1, 'near': 1, 'series': 1, 'series_2': 1,
+                                                   'growth': 1, 'growth_2': 0}
+    assert s['ufuncs'] == {}